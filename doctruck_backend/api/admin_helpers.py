@@ -11,7 +11,6 @@ public String adminDashboard() { }
 """
 
 from functools import wraps
-from flask import jsonify
 from flask_jwt_extended import get_jwt_identity
 
 
@@ -30,7 +29,9 @@ def admin_required(fn):
             or not isinstance(identity, str)
             or not identity.startswith("admin:")
         ):
-            return jsonify({"message": "관리자 권한이 필요합니다."}), 403
+            # Resource.method_decorators에서 사용하므로 flask-restful 반환 형식 사용
+            # (jsonify() Response를 튜플로 반환하면 다시 JSON 직렬화되어 500 발생)
+            return {"message": "관리자 권한이 필요합니다."}, 403
         return fn(*args, **kwargs)
 
     return wrapper
@@ -13,6 +13,7 @@ from doctruck_backend.api.resources.admin_location import (
     AdminLocationResource,
 )
 from doctruck_backend.api.resources.admin_user import AdminUserList, AdminUserResource
+from doctruck_backend.api.resources.admin_stats import AdminStats
 from doctruck_backend.api.resources.admin_document_location import (
     AdminDocumentLocationConnect,
     AdminDocumentLocationList,
@@ -44,6 +45,7 @@ __all__ = [
     "AdminLocationResource",
     "AdminUserList",
     "AdminUserResource",
+    "AdminStats",
     "AdminDocumentLocationConnect",
     "AdminDocumentLocationList",
     "LocationInterest",
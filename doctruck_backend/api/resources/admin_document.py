@@ -27,8 +27,12 @@ from doctruck_backend.models import Document
 from doctruck_backend.models.document import DocumentStatus
 from doctruck_backend.extensions import db
 from doctruck_backend.commons.pagination import paginate
+from doctruck_backend.commons.projection import project, requested_schema
 from doctruck_backend.api.admin_helpers import admin_required, get_admin_id
 
+# 스키마는 모듈 로드 시 한 번만 생성 (요청마다 필드를 다시 구성하지 않음)
+documents_schema = DocumentSchema(many=True)
+
 
 class AdminDocumentPending(Resource):
     """PENDING 문서 목록 (검증 대시보드)
@@ -39,6 +43,13 @@ class AdminDocumentPending(Resource):
         - admin-documents
       summary: 검증 대기 문서 목록 조회 (관리자 전용)
       description: 관리자 검증을 위한 PENDING 상태 문서 목록을 조회합니다
+      parameters:
+        - in: query
+          name: fields
+          schema:
+            type: string
+          required: false
+          description: "응답 필드 제한 (쉼표 구분, 예: doc_id,title) - 요청한 컬럼만 조회"
       responses:
         200:
           description: PENDING 문서 목록
@@ -61,11 +72,15 @@ class AdminDocumentPending(Resource):
 
     def get(self):
         """PENDING 문서 목록 조회 (관리자용)"""
-        schema = DocumentSchema(many=True)
+        # fields= 파라미터로 응답 필드 제한 (sparse fieldset)
+        schema = requested_schema(documents_schema)
         query = Document.query.filter_by(status=DocumentStatus.PENDING).order_by(
             Document.created_at.desc()
         )
-        return paginate(query, schema)
+        cursor_keys = (Document.created_at, Document.doc_id)
+        # 엔티티 대신 응답 필드의 컬럼만 조회 (commons/projection.py)
+        query = project(query, schema, *cursor_keys)
+        return paginate(query, schema, cursor_keys=cursor_keys)
 
 
 class AdminDocumentVerify(Resource):
@@ -176,6 +191,12 @@ class AdminDocumentList(Resource):
             enum: [PENDING, VERIFIED, REJECTED]
           required: false
           description: 상태 필터
+        - in: query
+          name: fields
+          schema:
+            type: string
+          required: false
+          description: "응답 필드 제한 (쉼표 구분, 예: doc_id,title) - 요청한 컬럼만 조회"
       responses:
         200:
           description: 전체 문서 목록
@@ -198,7 +219,8 @@ class AdminDocumentList(Resource):
 
     def get(self):
         """전체 문서 목록 조회 (관리자용 - 상태 필터 가능)"""
-        schema = DocumentSchema(many=True)
+        # fields= 파라미터로 응답 필드 제한 (sparse fieldset)
+        schema = requested_schema(documents_schema)
         query = Document.query
 
         # 상태 필터 (선택)
@@ -211,7 +233,10 @@ class AdminDocumentList(Resource):
                 return {"message": f"Invalid status: {status_filter}"}, 400
 
         query = query.order_by(Document.created_at.desc())
-        return paginate(query, schema)
+        cursor_keys = (Document.created_at, Document.doc_id)
+        # 엔티티 대신 응답 필드의 컬럼만 조회 (commons/projection.py)
+        query = project(query, schema, *cursor_keys)
+        return paginate(query, schema, cursor_keys=cursor_keys)
 
 
 class AdminDocumentResource(Resource):
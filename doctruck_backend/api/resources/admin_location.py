@@ -28,8 +28,12 @@ from doctruck_backend.api.schemas import LocationSchema
 from doctruck_backend.models import Location
 from doctruck_backend.extensions import db
 from doctruck_backend.commons.pagination import paginate
+from doctruck_backend.commons.projection import project, requested_schema
 from doctruck_backend.api.admin_helpers import admin_required
 
+# 스키마는 모듈 로드 시 한 번만 생성 (요청마다 필드를 다시 구성하지 않음)
+locations_schema = LocationSchema(many=True)
+
 
 class AdminLocationList(Resource):
     """관리자 위치 목록 조회 및 등록
@@ -40,6 +44,13 @@ class AdminLocationList(Resource):
         - admin-locations
       summary: 전체 위치 목록 조회 (관리자 전용)
       description: 모든 위치 목록을 조회합니다
+      parameters:
+        - in: query
+          name: fields
+          schema:
+            type: string
+          required: false
+          description: "응답 필드 제한 (쉼표 구분, 예: location_id,location_name) - 요청한 컬럼만 조회"
       responses:
         200:
           description: 전체 위치 목록
@@ -126,9 +137,11 @@ class AdminLocationList(Resource):
 
     def get(self):
         """전체 위치 목록 조회 (관리자용)"""
-        schema = LocationSchema(many=True)
+        # fields= 파라미터로 응답 필드 제한 (sparse fieldset)
+        schema = requested_schema(locations_schema)
         query = Location.query.order_by(Location.created_at.desc())
-        return paginate(query, schema)
+        # 엔티티 대신 응답 필드의 컬럼만 조회 (commons/projection.py)
+        return paginate(project(query, schema), schema)
 
     def post(self):
         """새 위치 등록 (관리자용)"""
@@ -0,0 +1,45 @@
+"""Admin Stats Resource - 관리자 전용 캐시/제한기 통계 API
+
+/health는 인증 없이 공개되므로 생존 여부만 반환하고,
+캐시 적중률, 로그인 제한기, 토큰 쓰기 큐 등의 내부 통계는 관리자만 조회합니다.
+
+Spring Boot와 비교:
+- /actuator/health (공개) vs /actuator/metrics (관리자 권한)
+"""
+
+from flask_restful import Resource
+from flask_jwt_extended import jwt_required
+
+from doctruck_backend.commons.metrics import collect_stats
+from doctruck_backend.api.admin_helpers import admin_required
+
+
+class AdminStats(Resource):
+    """캐시/제한기 통계 조회
+
+    ---
+    get:
+      tags:
+        - admin-stats
+      summary: 캐시/제한기 통계 조회 (관리자 전용)
+      description: 요청을 처리한 워커 프로세스의 캐시 통계 (hit/miss 등)
+      responses:
+        200:
+          description: 이름별 통계
+          content:
+            application/json:
+              schema:
+                type: object
+                properties:
+                  caches:
+                    type: object
+                    description: 워커 프로세스별 캐시 통계 (hit/miss 등)
+        403:
+          description: Admin permission required
+    """
+
+    method_decorators = [admin_required, jwt_required()]
+
+    def get(self):
+        """캐시/제한기 통계 조회 (관리자용)"""
+        return {"caches": collect_stats()}, 200
@@ -19,14 +19,26 @@ public class DocumentController {
 
 from flask import request
 from flask_restful import Resource
-from sqlalchemy import or_
 
 from doctruck_backend.api.schemas import DocumentSchema
 from doctruck_backend.models import Document
 from doctruck_backend.models.document import DocumentStatus, DocumentType
+from doctruck_backend.commons.http_cache import cached_response, conditional_get
 from doctruck_backend.commons.pagination import paginate
+from doctruck_backend.commons.projection import project, requested_schema
+from doctruck_backend.commons.search import apply_search
+from doctruck_backend.commons.serializers import dump
+from doctruck_backend.commons.regions import (
+    ENTITY_DOCUMENT,
+    indexed_entity_ids,
+    region_code,
+)
 from datetime import datetime
 
+# 스키마는 모듈 로드 시 한 번만 생성 (요청마다 필드를 다시 구성하지 않음)
+document_schema = DocumentSchema()
+documents_schema = DocumentSchema(many=True)
+
 
 class DocumentResource(Resource):
     """단일 공문서 리소스 - 상세 조회
@@ -59,10 +71,12 @@ class DocumentResource(Resource):
     """
 
     # 인증 불필요 (공개 API)
+    # 조회만 하므로 읽기 전용 DB 사용 (commons/db_routing.py)
+    read_only = True
 
+    @conditional_get(Document.__tablename__)
     def get(self, doc_id):
         """공문서 상세 조회 (Spring의 @GetMapping과 유사)"""
-        schema = DocumentSchema()
         document = Document.query.get_or_404(doc_id)
 
         # 사용자는 VERIFIED 문서만 조회 가능
@@ -70,7 +84,7 @@ class DocumentResource(Resource):
         if document.status != DocumentStatus.VERIFIED:
             return {"message": "검증된 공문서만 조회할 수 있습니다."}, 403
 
-        return {"document": schema.dump(document)}, 200
+        return {"document": dump(document_schema, document)}, 200
 
 
 class DocumentList(Resource):
@@ -96,6 +110,12 @@ class DocumentList(Resource):
             type: string
           required: false
           description: "출처 필터 (예: 서울시청)"
+        - in: query
+          name: region
+          schema:
+            type: string
+          required: false
+          description: "출처 지역 필터 (예: 서울, 서울 영등포구)"
         - in: query
           name: start_date
           schema:
@@ -115,7 +135,15 @@ class DocumentList(Resource):
           schema:
             type: string
           required: false
-          description: 검색어 (제목 또는 AI 요약)
+          description: 검색어 (제목 또는 AI 요약, 3글자 이상은 전문 검색 색인 사용)
+        - in: query
+          name: sort
+          schema:
+            type: string
+            enum: [latest, relevance]
+            default: latest
+          required: false
+          description: 정렬 기준 (relevance는 search와 함께 사용, 검색 관련도 순)
         - in: query
           name: page
           schema:
@@ -128,6 +156,32 @@ class DocumentList(Resource):
             type: integer
             default: 10
           description: 페이지당 개수
+        - in: query
+          name: cursor
+          schema:
+            type: string
+          required: false
+          description: "cursor 페이지네이션 (첫 페이지는 빈 값, 이후 응답의 next_cursor 사용)"
+        - in: query
+          name: include_total
+          schema:
+            type: boolean
+            default: false
+          required: false
+          description: cursor 모드에서 전체 개수(total) 포함 여부
+        - in: query
+          name: count
+          schema:
+            type: string
+            enum: [exact, estimate, none]
+          required: false
+          description: "전체 개수 계산 방식 (생략 시 데이터 변경 전까지 캐시된 개수 사용)"
+        - in: query
+          name: fields
+          schema:
+            type: string
+          required: false
+          description: "응답 필드 제한 (쉼표 구분, 예: doc_id,title) - 요청한 컬럼만 조회"
       responses:
         200:
           description: 공문서 목록
@@ -145,10 +199,15 @@ class DocumentList(Resource):
     """
 
     # 인증 불필요 (공개 API)
+    # 조회만 하므로 읽기 전용 DB 사용 (commons/db_routing.py)
+    read_only = True
 
+    @conditional_get(Document.__tablename__)
+    @cached_response(Document.__tablename__)
     def get(self):
         """공문서 목록 조회 (필터링 지원 - Spring의 @GetMapping + @RequestParam과 유사)"""
-        schema = DocumentSchema(many=True)
+        # fields= 파라미터로 응답 필드 제한 (sparse fieldset)
+        schema = requested_schema(documents_schema)
 
         # 기본 쿼리: VERIFIED 문서만
         # Spring에서는 JPA Specification 또는 @Query로 구현
@@ -168,6 +227,17 @@ class DocumentList(Resource):
         if source:
             query = query.filter(Document.source.ilike(f"%{source}%"))
 
+        # 출처 지역 필터 (정규화된 지역 코드로 region_index 조회)
+        region = request.args.get("region")
+        if region:
+            code = region_code(region)
+            if code:
+                query = query.filter(
+                    Document.doc_id.in_(indexed_entity_ids(ENTITY_DOCUMENT, code))
+                )
+            else:
+                query = query.filter(Document.source.ilike(f"%{region}%"))
+
         # 3. 날짜 범위 필터 (게시일 기준)
         start_date = request.args.get("start_date")
         end_date = request.args.get("end_date")
@@ -189,16 +259,25 @@ class DocumentList(Resource):
         # 4. 검색어 필터 (제목 또는 AI 요약에서 검색)
         # Spring의 JPA Specification과 유사
         search = request.args.get("search")
+        sort = request.args.get("sort", "latest")
+        if sort not in ("latest", "relevance"):
+            return {"message": f"Invalid sort: {sort}"}, 400
         if search:
-            search_filter = or_(
-                Document.title.ilike(f"%{search}%"),
-                Document.ai_summary.ilike(f"%{search}%"),
+            query = apply_search(
+                query, Document, search, order_by_rank=sort == "relevance"
             )
-            query = query.filter(search_filter)
 
-        # 5. 최신순 정렬 (게시일 기준)
+        # 5. 최신순 정렬 (게시일 기준, relevance 정렬 시 동점 처리용)
         # Spring의 Sort.by(Sort.Direction.DESC, "publishedAt")와 유사
         query = query.order_by(Document.published_at.desc())
 
         # 6. 페이지네이션 (Spring의 Pageable과 유사)
-        return paginate(query, schema)
+        # cursor 모드는 게시일 + PK 기준 (relevance 정렬은 page 모드만 지원)
+        # 엔티티 대신 응답 필드의 컬럼만 조회 (ai_summary를 요청하지 않으면 읽지 않음)
+        cursor_keys = (Document.published_at, Document.doc_id)
+        query = project(query, schema, *cursor_keys)
+        if search and sort == "relevance":
+            cursor_keys = None
+        return paginate(
+            query, schema, cursor_keys=cursor_keys, count_table=Document.__tablename__
+        )
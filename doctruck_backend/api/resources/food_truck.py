@@ -129,7 +129,9 @@ class FoodTruckList(Resource):
                 "truck_name": "맛있는 푸드트럭",
                 "business_registration_number": "123-45-67890",
                 "food_category": "디저트",
-                "operating_region": "서울"
+                "operating_region": "서울",
+                "home_latitude": 37.5284,
+                "home_longitude": 126.9334
             }
         """
         schema = FoodTruckSchema()
@@ -21,12 +21,27 @@ public class LocationController {
 from flask import request
 from flask_restful import Resource
 from sqlalchemy import or_
+from werkzeug.exceptions import BadRequest
 
 from doctruck_backend.api.schemas import LocationSchema
 from doctruck_backend.models import Location
-from doctruck_backend.commons.pagination import paginate
+from doctruck_backend.commons.geo import parse_spatial_args
+from doctruck_backend.commons.http_cache import cached_response, conditional_get
+from doctruck_backend.commons.pagination import paginate, paginate_list
+from doctruck_backend.commons.projection import project, requested_schema
+from doctruck_backend.commons.search import apply_search
+from doctruck_backend.commons.serializers import dump
+from doctruck_backend.commons.regions import (
+    ENTITY_LOCATION,
+    indexed_entity_ids,
+    region_code,
+)
 from datetime import datetime
 
+# 스키마는 모듈 로드 시 한 번만 생성 (요청마다 필드를 다시 구성하지 않음)
+location_schema = LocationSchema()
+locations_schema = LocationSchema(many=True)
+
 
 class LocationResource(Resource):
     """단일 위치 리소스 - 상세 조회
@@ -61,12 +76,12 @@ class LocationResource(Resource):
     # 인증 불필요 (사용자 기능: 누구나 위치 조회 가능)
     # Spring의 permitAll()과 유사
 
+    @conditional_get(Location.__tablename__)
     def get(self, location_id):
         """위치 상세 조회 (Spring의 @GetMapping과 유사)"""
-        schema = LocationSchema()
         location = Location.query.get_or_404(location_id)
 
-        return {"location": schema.dump(location)}, 200
+        return {"location": dump(location_schema, location)}, 200
 
 
 class LocationList(Resource):
@@ -105,7 +120,47 @@ class LocationList(Resource):
           schema:
             type: string
           required: false
-          description: 검색어 (위치명 또는 주소)
+          description: 검색어 (위치명 또는 주소, 3글자 이상은 전문 검색 색인 사용)
+        - in: query
+          name: sort
+          schema:
+            type: string
+            enum: [latest, relevance, distance]
+            default: latest
+          required: false
+          description: "정렬 기준 (relevance: search와 함께 검색 관련도 순, distance: lat/lon 기준 거리순)"
+        - in: query
+          name: lat
+          schema:
+            type: number
+          required: false
+          description: 반경 검색 중심 위도 (lon과 함께 사용)
+        - in: query
+          name: lon
+          schema:
+            type: number
+          required: false
+          description: 반경 검색 중심 경도 (lat과 함께 사용)
+        - in: query
+          name: radius_km
+          schema:
+            type: number
+            default: 5
+            maximum: 100
+          required: false
+          description: 검색 반경 (km)
+        - in: query
+          name: bbox
+          schema:
+            type: string
+          required: false
+          description: "영역 검색 (min_lon,min_lat,max_lon,max_lat)"
+        - in: query
+          name: region
+          schema:
+            type: string
+          required: false
+          description: "지역 필터 (예: 서울, 서울 영등포구)"
         - in: query
           name: page
           schema:
@@ -118,6 +173,32 @@ class LocationList(Resource):
             type: integer
             default: 10
           description: 페이지당 개수
+        - in: query
+          name: cursor
+          schema:
+            type: string
+          required: false
+          description: "cursor 페이지네이션 (첫 페이지는 빈 값, 이후 응답의 next_cursor 사용, relevance 정렬과 lat/lon 반경 검색은 지원하지 않음)"
+        - in: query
+          name: include_total
+          schema:
+            type: boolean
+            default: false
+          required: false
+          description: cursor 모드에서 전체 개수(total) 포함 여부
+        - in: query
+          name: count
+          schema:
+            type: string
+            enum: [exact, estimate, none]
+          required: false
+          description: "전체 개수 계산 방식 (생략 시 데이터 변경 전까지 캐시된 개수 사용)"
+        - in: query
+          name: fields
+          schema:
+            type: string
+          required: false
+          description: "응답 필드 제한 (쉼표 구분, 예: location_id,location_name) - 요청한 컬럼만 조회"
       responses:
         200:
           description: 위치 목록
@@ -135,10 +216,15 @@ class LocationList(Resource):
     """
 
     # 인증 불필요 (공개 API)
+    # 조회만 하므로 읽기 전용 DB 사용 (commons/db_routing.py)
+    read_only = True
 
+    @conditional_get(Location.__tablename__)
+    @cached_response(Location.__tablename__)
     def get(self):
         """위치 목록 조회 (필터링 지원 - Spring의 @GetMapping + @RequestParam과 유사)"""
-        schema = LocationSchema(many=True)
+        # fields= 파라미터로 응답 필드 제한 (sparse fieldset)
+        schema = requested_schema(locations_schema)
 
         # 기본 쿼리
         query = Location.query
@@ -187,16 +273,60 @@ class LocationList(Resource):
 
         # 3. 검색어 필터 (위치명 또는 주소에서 검색)
         search = request.args.get("search")
+        sort = request.args.get("sort", "latest")
+        if sort not in ("latest", "relevance", "distance"):
+            return {"message": f"Invalid sort: {sort}"}, 400
         if search:
-            # Spring의 JPA Specification과 유사
-            search_filter = or_(
-                Location.location_name.ilike(f"%{search}%"),
-                Location.address.ilike(f"%{search}%"),
+            # Spring의 JPA Specification과 유사 (전문 검색 색인 사용)
+            query = apply_search(
+                query, Location, search, order_by_rank=sort == "relevance"
             )
-            query = query.filter(search_filter)
 
-        # 4. 최신순 정렬 (생성일 기준)
+        # 4. 지역 필터 (정규화된 지역 코드로 region_index 조회)
+        region = request.args.get("region")
+        if region:
+            code = region_code(region)
+            if code:
+                query = query.filter(
+                    Location.location_id.in_(indexed_entity_ids(ENTITY_LOCATION, code))
+                )
+            else:
+                query = query.filter(Location.address.ilike(f"%{region}%"))
+
+        # 5. 좌표 필터 (geohash 격자 색인으로 후보 조회)
+        try:
+            spatial = parse_spatial_args(request.args)
+        except BadRequest as e:
+            return {"message": e.description}, 400
+        if sort == "distance" and (spatial is None or spatial.center is None):
+            return {"message": "sort=distance requires lat and lon"}, 400
+        if spatial:
+            query = query.filter(spatial.candidate_filter())
+
+        # 6. 최신순 정렬 (생성일 기준, relevance/distance 정렬 시 동점 처리용)
         query = query.order_by(Location.created_at.desc())
 
-        # 5. 페이지네이션 (Spring의 Pageable과 유사)
-        return paginate(query, schema)
+        # 7. 페이지네이션 (Spring의 Pageable과 유사)
+        # 엔티티 대신 응답 필드의 컬럼만 조회 (commons/projection.py)
+        cursor_keys = (Location.created_at, Location.location_id)
+        if spatial and spatial.center:
+            # 반경 검색: 후보에만 거리 계산 후 Python에서 필터/정렬 (page 모드만 지원)
+            query = project(query, schema, Location.latitude, Location.longitude)
+            nearby = spatial.refine(query.all(), sort_by_distance=sort == "distance")
+            return paginate_list(
+                nearby,
+                lambda page: [
+                    {**result, "distance_km": round(distance, 3)}
+                    for result, (_, distance) in zip(
+                        dump(schema, [location for location, _ in page]), page
+                    )
+                ],
+            )
+
+        # cursor 모드는 생성일 + PK 기준 (relevance 정렬은 page 모드만 지원)
+        query = project(query, schema, *cursor_keys)
+        if search and sort == "relevance":
+            cursor_keys = None
+        return paginate(
+            query, schema, cursor_keys=cursor_keys, count_table=Location.__tablename__
+        )
@@ -18,19 +18,27 @@ public class RecommendationController {
 from flask import request
 from flask_restful import Resource
 from flask_jwt_extended import jwt_required, get_jwt_identity
-from sqlalchemy import or_
 
 from doctruck_backend.api.schemas import LocationSchema, DocumentSchema
+from doctruck_backend.extensions import db
+from doctruck_backend.commons.regions import ENTITY_DOCUMENT, region_code
+from doctruck_backend.commons.scoring import recommend_locations
+from doctruck_backend.commons.serializers import dump
+from doctruck_backend.commons.truck_recommendations import load_truck_recommendations
 from doctruck_backend.models import (
     FoodTruck,
-    Location,
     Document,
     DocumentLocation,
     FoodTruckLocation,
+    RegionIndex,
 )
 from doctruck_backend.models.document import DocumentStatus
 from datetime import datetime, timedelta
 
+# 스키마는 모듈 로드 시 한 번만 생성 (요청마다 필드를 다시 구성하지 않음)
+location_schema = LocationSchema()
+document_schema = DocumentSchema()
+
 
 class RecommendedLocations(Resource):
     """맞춤 위치 추천 (핵심 기능)
@@ -80,6 +88,10 @@ class RecommendedLocations(Resource):
     """
 
     method_decorators = [jwt_required()]
+    # owner_id(JWT identity)로만 조회하므로 사용자 로드 생략
+    skip_user_lookup = True
+    # 조회만 하므로 읽기 전용 DB 사용 (commons/db_routing.py)
+    read_only = True
 
     def get(self):
         """맞춤 위치 추천 (사용자용)
@@ -119,89 +131,23 @@ class RecommendedLocations(Resource):
             ).all()
         ]
 
-        # 추천 가능한 위치 (운영 종료일이 지나지 않은 위치)
-        today = datetime.now()
-        available_locations = Location.query.filter(
-            or_(
-                Location.end_datetime.is_(None),  # 종료일 없음 = 상시 운영
-                Location.end_datetime >= today,  # 아직 종료 안 됨
-            )
-        ).all()
-
-        # 점수 계산
-        scored_locations = []
-        for location in available_locations:
-            # 이미 관심 등록한 위치는 제외
-            if location.location_id in interested_location_ids:
-                continue
-
-            score = 0
-            reasons = []
+        # 트럭이 하나면 사전 계산된 추천 결과 사용 (오늘 계산된 결과가 있을 때만)
+        top_recommendations = None
+        if len(trucks) == 1:
+            top_recommendations = load_truck_recommendations(trucks[0], limit)
 
-            for truck in trucks:
-                # 1. 지역 매칭 (30점)
-                if truck.operating_region and location.address:
-                    if truck.operating_region.strip() in location.address:
-                        score += 30
-                        reasons.append(f"활동 지역({truck.operating_region}) 일치")
-
-                # 2. 카테고리 매칭 (20점)
-                # 예: 디저트 -> FESTIVAL, 한식 -> PARK
-                if truck.food_category:
-                    category_location_map = {
-                        "디저트": "FESTIVAL",
-                        "한식": "PARK",
-                        "분식": "MARKET",
-                    }
-                    preferred_type = category_location_map.get(truck.food_category)
-                    if (
-                        preferred_type
-                        and location.location_type.value == preferred_type
-                    ):
-                        score += 20
-                        reasons.append(f"{truck.food_category} 카테고리에 적합한 위치")
-
-            # 3. 운영 기간 임박 (10점)
-            if location.start_datetime:
-                days_until_start = (location.start_datetime.date() - today.date()).days
-                if 0 <= days_until_start <= 30:
-                    score += 10
-                    reasons.append(f"{days_until_start}일 후 시작")
-
-            # 4. 신청자 수 확인 (관계 테이블 조회)
-            # FoodTruckLocation에서 이 위치에 대한 신청 수 확인
-            applicant_count = FoodTruckLocation.query.filter_by(
-                location_id=location.location_id
-            ).count()
-            if applicant_count < 10:  # 임의의 제한 (10명)
-                score += 10
-                reasons.append(f"신청자 {applicant_count}명")
-            elif applicant_count < 20:
-                score += 5
-                reasons.append(f"신청자 {applicant_count}명 (경쟁 중간)")
-
-            # 5. 기본 점수 (모든 위치에 5점 - 최소 추천)
-            score += 5
-            if not reasons:
-                reasons.append("새로운 사업 기회")
-
-            scored_locations.append(
-                {"location": location, "score": score, "reason": ", ".join(reasons)}
+        # 상위 N개 추천 위치 (필터/매칭은 SQL, 순위는 크기 N의 힙으로 계산)
+        if top_recommendations is None:
+            top_recommendations = recommend_locations(
+                trucks, interested_location_ids, limit=limit
             )
 
-        # 점수 순 정렬
-        scored_locations.sort(key=lambda x: x["score"], reverse=True)
-
-        # 상위 N개만
-        top_recommendations = scored_locations[:limit]
-
-        # Schema로 직렬화
-        location_schema = LocationSchema()
+        # Schema로 직렬화 (컴파일된 직렬화 함수 사용)
         result = []
         for item in top_recommendations:
             result.append(
                 {
-                    "location": location_schema.dump(item["location"]),
+                    "location": dump(location_schema, item["location"]),
                     "score": item["score"],
                     "reason": item["reason"],
                 }
@@ -249,6 +195,10 @@ class RecommendedDocuments(Resource):
     """
 
     method_decorators = [jwt_required()]
+    # owner_id(JWT identity)로만 조회하므로 사용자 로드 생략
+    skip_user_lookup = True
+    # 조회만 하므로 읽기 전용 DB 사용 (commons/db_routing.py)
+    read_only = True
 
     def get(self):
         """맞춤 공문서 알림 (사용자용)
@@ -269,59 +219,86 @@ class RecommendedDocuments(Resource):
                 "recommendations": [],
             }, 200
 
-        # 내 관심 위치 가져오기
+        # 내 관심 위치 (서브쿼리)
         my_truck_ids = [t.truck_id for t in my_trucks]
-        my_interested_locations = [
-            rel.location_id
-            for rel in FoodTruckLocation.query.filter(
-                FoodTruckLocation.truck_id.in_(my_truck_ids)
-            ).all()
-        ]
+        my_interested_locations = db.session.query(
+            FoodTruckLocation.location_id
+        ).filter(FoodTruckLocation.truck_id.in_(my_truck_ids))
 
-        # 내 활동 지역
-        my_regions = set()
+        # 내 활동 지역 (지역 코드로 정규화되는 지역 / 정규화되지 않는 지역)
+        my_region_codes = {}
+        my_unindexed_regions = set()
         for truck in my_trucks:
             if truck.operating_region:
-                my_regions.add(truck.operating_region.strip())
+                region = truck.operating_region.strip()
+                code = region_code(region)
+                if code:
+                    my_region_codes.setdefault(code, region)
+                else:
+                    my_unindexed_regions.add(region)
 
         # 최근 VERIFIED 문서
         since_date = datetime.now() - timedelta(days=days)
-        recent_docs = Document.query.filter(
+        recent_filter = (
             Document.status == DocumentStatus.VERIFIED,
             Document.verified_at >= since_date,
-        ).all()
+        )
+        recent_docs = Document.query.filter(*recent_filter).all()
+
+        # 내 관심 위치와 연결된 최근 문서 ID (문서-위치 연결을 한 번의 JOIN으로 조회)
+        linked_doc_ids = {
+            doc_id
+            for (doc_id,) in db.session.query(DocumentLocation.doc_id)
+            .join(Document, Document.doc_id == DocumentLocation.doc_id)
+            .filter(
+                *recent_filter,
+                DocumentLocation.location_id.in_(my_interested_locations),
+            )
+            .distinct()
+        }
+
+        # 내 활동 지역과 관련된 최근 문서 (region_index 동등 비교)
+        doc_regions = {}
+        if my_region_codes:
+            region_rows = (
+                db.session.query(RegionIndex.entity_id, RegionIndex.region_code)
+                .join(Document, Document.doc_id == RegionIndex.entity_id)
+                .filter(
+                    *recent_filter,
+                    RegionIndex.entity_type == ENTITY_DOCUMENT,
+                    RegionIndex.region_code.in_(my_region_codes),
+                )
+            )
+            for doc_id, code in region_rows:
+                doc_regions.setdefault(doc_id, my_region_codes[code])
 
         recommended_docs = []
         for doc in recent_docs:
             reasons = []
 
             # 1. 내 관심 위치와 연결된 문서인가?
-            doc_locations = DocumentLocation.query.filter_by(doc_id=doc.doc_id).all()
-            doc_location_ids = [rel.location_id for rel in doc_locations]
-
-            for loc_id in my_interested_locations:
-                if loc_id in doc_location_ids:
-                    reasons.append("관심 등록한 위치와 관련됨")
-                    break
+            if doc.doc_id in linked_doc_ids:
+                reasons.append("관심 등록한 위치와 관련됨")
 
             # 2. 내 활동 지역과 관련된 문서인가?
-            if doc.source:
-                for region in my_regions:
-                    if region in doc.source:
-                        reasons.append(f"활동 지역({region}) 관련 문서")
-                        break
+            region = doc_regions.get(doc.doc_id)
+            if region is None and doc.source:
+                region = next(
+                    (r for r in my_unindexed_regions if r in doc.source), None
+                )
+            if region:
+                reasons.append(f"활동 지역({region}) 관련 문서")
 
             # 추천 이유가 있는 것만
             if reasons:
                 recommended_docs.append({"document": doc, "reason": ", ".join(reasons)})
 
-        # Schema로 직렬화
-        doc_schema = DocumentSchema()
+        # Schema로 직렬화 (컴파일된 직렬화 함수 사용)
         result = []
         for item in recommended_docs:
             result.append(
                 {
-                    "document": doc_schema.dump(item["document"]),
+                    "document": dump(document_schema, item["document"]),
                     "reason": item["reason"],
                 }
             )
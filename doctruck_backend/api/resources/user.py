@@ -3,7 +3,7 @@ from flask_restful import Resource
 from flask_jwt_extended import jwt_required
 from doctruck_backend.api.schemas import UserSchema
 from doctruck_backend.models import User
-from doctruck_backend.extensions import db
+from doctruck_backend.extensions import db, identity_cache, login_limiter
 from doctruck_backend.commons.pagination import paginate
 
 
@@ -96,6 +96,8 @@ class UserResource(Resource):
         user = schema.load(request.json, instance=user)
 
         db.session.commit()
+        identity_cache.invalidate(user_id)
+        login_limiter.forget_unknown(user.username)
 
         return {"msg": "user updated", "user": schema.dump(user)}
 
@@ -103,6 +105,7 @@ class UserResource(Resource):
         user = User.query.get_or_404(user_id)
         db.session.delete(user)
         db.session.commit()
+        identity_cache.invalidate(user_id)
 
         return {"msg": "user deleted"}
 
@@ -165,5 +168,6 @@ class UserList(Resource):
 
         db.session.add(user)
         db.session.commit()
+        login_limiter.forget_unknown(user.username)
 
         return {"msg": "user created", "user": schema.dump(user)}, 201
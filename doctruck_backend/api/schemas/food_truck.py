@@ -1,3 +1,5 @@
+from marshmallow import fields as ma_fields
+
 from doctruck_backend.models import FoodTruck
 from doctruck_backend.extensions import ma
 
@@ -14,6 +16,10 @@ class FoodTruckSchema(ma.SQLAlchemyAutoSchema):
     - Python 객체 → JSON (serialization)
     """
 
+    # Decimal을 Float로 직렬화 (db.Numeric -> float)
+    home_latitude = ma_fields.Float(allow_none=True)
+    home_longitude = ma_fields.Float(allow_none=True)
+
     class Meta:
         model = FoodTruck
         # Spring의 @JsonIgnore와 유사
@@ -28,6 +34,8 @@ class FoodTruckSchema(ma.SQLAlchemyAutoSchema):
             "business_registration_number",
             "food_category",
             "operating_region",
+            "home_latitude",
+            "home_longitude",
             "created_at",
         )
 
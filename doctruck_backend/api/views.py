@@ -2,6 +2,7 @@ from flask import Blueprint, jsonify
 from flask_restful import Api
 from marshmallow import ValidationError
 from doctruck_backend.extensions import apispec
+from doctruck_backend.commons.json_provider import output_json
 from doctruck_backend.api.resources import (
     UserResource,
     UserList,
@@ -19,6 +20,7 @@ from doctruck_backend.api.resources import (
     AdminLocationResource,
     AdminUserList,
     AdminUserResource,
+    AdminStats,
     AdminDocumentLocationConnect,
     AdminDocumentLocationList,
     LocationInterest,
@@ -36,6 +38,8 @@ from doctruck_backend.api.schemas import (
 
 blueprint = Blueprint("api", __name__, url_prefix="/api/v1")
 api = Api(blueprint)
+# 응답 JSON 인코딩은 app.json provider 사용 (JSON_ENCODER 설정, commons/json_provider.py)
+api.representation("application/json")(output_json)
 
 
 # User 라우트
@@ -88,6 +92,9 @@ api.add_resource(
     AdminUserResource, "/admin/users/<int:user_id>", endpoint="admin_user_by_id"
 )
 
+# Admin Stats 라우트 (캐시/제한기 통계, /health에서 분리)
+api.add_resource(AdminStats, "/admin/stats", endpoint="admin_stats")
+
 # Admin Document-Location 연결 (관리자 전용)
 api.add_resource(
     AdminDocumentLocationConnect,
@@ -155,6 +162,9 @@ def register_views(state):
     apispec.spec.path(view=AdminUserList, app=app)
     apispec.spec.path(view=AdminUserResource, app=app)
 
+    # Admin Stats 경로 등록
+    apispec.spec.path(view=AdminStats, app=app)
+
     # Admin Document-Location 경로 등록
     apispec.spec.path(view=AdminDocumentLocationConnect, app=app)
     apispec.spec.path(view=AdminDocumentLocationList, app=app)
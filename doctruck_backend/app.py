@@ -1,14 +1,39 @@
 import logging
 import time
 from flask import Flask, request, g
+from werkzeug.middleware.proxy_fix import ProxyFix
 from doctruck_backend import api
 from doctruck_backend import auth
 from doctruck_backend import manage
 from doctruck_backend.extensions import apispec
 from doctruck_backend.extensions import db
 from doctruck_backend.extensions import jwt
-from doctruck_backend.extensions import migrate, celery
+from doctruck_backend.extensions import migrate, celery, blocklist_cache
+from doctruck_backend.extensions import token_write_queue, identity_cache
+from doctruck_backend.extensions import password_verifier, login_limiter
+from doctruck_backend.extensions import response_cache
+from doctruck_backend.auth.helpers import check_blocklist_settings
 from doctruck_backend.errors import register_error_handlers
+from doctruck_backend.commons.db_routing import (
+    register_routing_listeners,
+    route_reads_for_request,
+)
+from doctruck_backend.commons.engine import (
+    configure_engine_options,
+    register_sqlite_pragmas,
+)
+from doctruck_backend.commons.geo import register_geohash_listeners
+from doctruck_backend.commons.json_provider import init_json_provider
+from doctruck_backend.commons.metrics import register_stats
+from doctruck_backend.commons.regions import register_region_index_listeners
+from doctruck_backend.commons.search import register_search_index_ddl
+from doctruck_backend.commons.table_versions import (
+    on_tables_committed,
+    register_table_version_listeners,
+)
+from doctruck_backend.commons.truck_recommendations import (
+    register_invalidation_listeners,
+)
 
 
 def create_app(testing=False):
@@ -20,6 +45,7 @@ def create_app(testing=False):
         app.config["TESTING"] = True
 
     configure_logging(app)
+    configure_proxy(app)
     configure_extensions(app)
     configure_cli(app)
     configure_apispec(app)
@@ -56,11 +82,47 @@ def configure_logging(app):
     logging.getLogger("doctruck_backend").setLevel(log_level)
 
 
+def configure_proxy(app):
+    """리버스 프록시 뒤에서 request.remote_addr를 클라이언트 IP로 설정
+
+    Spring Boot와 비교:
+    - server.forward-headers-strategy=native + RemoteIpValve(trusted-proxies)
+    """
+    x_for = app.config.get("PROXY_FIX_X_FOR", 0)
+    if x_for:
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=x_for)
+
+
 def configure_extensions(app):
     """Configure flask extensions"""
+    init_json_provider(app)
+    configure_engine_options(app)
     db.init_app(app)
+    register_sqlite_pragmas(app, db)
+    register_routing_listeners()
+    app.before_request(route_reads_for_request)
     jwt.init_app(app)
     migrate.init_app(app, db)
+    check_blocklist_settings(app)
+    blocklist_cache.init_app(app)
+    register_stats("blocklist_cache", blocklist_cache.stats)
+    token_write_queue.init_app(app, "JWT_BLOCKLIST_WRITE_BEHIND")
+    register_stats("token_write_queue", token_write_queue.stats)
+    identity_cache.init_app(app)
+    register_stats("identity_cache", identity_cache.stats)
+    password_verifier.init_app(app)
+    register_stats("password_verifier", password_verifier.stats)
+    login_limiter.init_app(app)
+    register_stats("login_limiter", login_limiter.stats)
+    response_cache.init_app(app)
+    register_stats("response_cache", response_cache.stats)
+    register_invalidation_listeners()
+    register_region_index_listeners()
+    register_search_index_ddl()
+    register_table_version_listeners()
+    # 위치/공문서 변경 커밋 시 응답 캐시 무효화
+    on_tables_committed(response_cache.invalidate)
+    register_geohash_listeners()
 
 
 def configure_cli(app):
@@ -68,6 +130,9 @@ def configure_cli(app):
     from doctruck_backend.seed_data import seed_dummy_data
 
     app.cli.add_command(manage.init)
+    app.cli.add_command(manage.reindex_regions)
+    app.cli.add_command(manage.purge_issued_tokens)
+    app.cli.add_command(manage.purge_expired_tokens)
     app.cli.add_command(seed_dummy_data)
 
 
@@ -85,6 +150,7 @@ def configure_apispec(app):
                 "pages": {"type": "integer"},
                 "next": {"type": "string"},
                 "prev": {"type": "string"},
+                "next_cursor": {"type": "string", "nullable": True},
             }
         },
     )
@@ -184,6 +250,7 @@ def register_health_check(app):
                         example: healthy
           security: []
         """
+        # 공개 엔드포인트이므로 생존 여부만 반환 (내부 통계는 /api/v1/admin/stats)
         return {"status": "healthy"}, 200
 
 
@@ -2,65 +2,296 @@
 
 Heavily inspired by
 https://github.com/vimalloc/flask-jwt-extended/blob/master/examples/blocklist_database.py
+
+Two storage policies are supported (JWT_BLOCKLIST_POLICY):
+
+- ``allowlist`` (default): every issued token is stored when it is created,
+  and a token that is absent from the table is considered revoked.
+- ``revocation``: only revoked tokens are stored, with their expiry.
+  A token that is absent from the table is valid, so switching an existing
+  deployment to it is an explicit opt-in (see DEPLOYMENT.md).
+
+With the ``allowlist`` policy, ``JWT_BLOCKLIST_WRITE_BEHIND`` queues the
+records of refreshed tokens in the issuing worker. Other workers only know
+those tokens through the shared blocklist cache, so write-behind requires
+``BLOCKLIST_CACHE_REDIS_URL`` (checked by ``check_blocklist_settings``).
 """
 
-from datetime import datetime
+import uuid
+from datetime import datetime, timezone
 
-from flask_jwt_extended import decode_token
+from flask import current_app
+from flask_jwt_extended import create_access_token, create_refresh_token
+from sqlalchemy import insert, text
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm.exc import NoResultFound
+from werkzeug.exceptions import Conflict
+
+from doctruck_backend.commons.identity_cache import (
+    KIND_ADMIN,
+    LoadedIdentity,
+    parse_identity,
+    user_lookup_skipped,
+)
+from doctruck_backend.extensions import (
+    db,
+    blocklist_cache,
+    identity_cache,
+    token_write_queue,
+)
+from doctruck_backend.models import Admin, TokenBlocklist, User
+
+DEFAULT_PURGE_BATCH_SIZE = 1000
+
+POLICY_REVOCATION = "revocation"
+POLICY_ALLOWLIST = "allowlist"
+BLOCKLIST_POLICIES = (POLICY_REVOCATION, POLICY_ALLOWLIST)
+
 
-from doctruck_backend.extensions import db
-from doctruck_backend.models import TokenBlocklist
+def blocklist_policy():
+    """Returns the configured blocklist storage policy"""
+    policy = current_app.config.get("JWT_BLOCKLIST_POLICY", POLICY_ALLOWLIST)
+    if policy not in BLOCKLIST_POLICIES:
+        raise ValueError("Unknown JWT_BLOCKLIST_POLICY {}".format(policy))
+    return policy
 
 
-def add_token_to_database(encoded_token, identity_claim):
+def check_blocklist_settings(app):
+    """Validates the blocklist settings at startup
+
+    :raises ValueError: unknown policy, or write-behind without a shared
+        (Redis) blocklist cache
     """
-    Adds a new token to the database. It is not revoked when it is added.
+    policy = app.config.get("JWT_BLOCKLIST_POLICY", POLICY_ALLOWLIST)
+    if policy not in BLOCKLIST_POLICIES:
+        raise ValueError("Unknown JWT_BLOCKLIST_POLICY {}".format(policy))
+    if app.config.get("JWT_BLOCKLIST_WRITE_BEHIND") and not app.config.get(
+        "BLOCKLIST_CACHE_REDIS_URL"
+    ):
+        raise ValueError(
+            "JWT_BLOCKLIST_WRITE_BEHIND requires BLOCKLIST_CACHE_REDIS_URL "
+            "(queued tokens are unknown to the other workers until flushed)"
+        )
 
-    :param identity_claim: configured key to get user identity
+
+def issue_tokens(identity, refresh=True, write_behind=False):
     """
-    decoded_token = decode_token(encoded_token)
-    jti = decoded_token["jti"]
-    token_type = decoded_token["type"]
-    user_identity = decoded_token[identity_claim]
-    expires = datetime.fromtimestamp(decoded_token["exp"])
-    revoked = False
-
-    db_token = TokenBlocklist(
-        jti=jti,
-        token_type=token_type,
-        user_id=user_identity,
-        expires=expires,
-        revoked=revoked,
-    )
-    db.session.add(db_token)
-    db.session.commit()
+    Creates an access token (and a refresh token) for the given identity.
+
+    With the ``allowlist`` policy the tokens are recorded as not revoked. Since
+    jti and exp are generated here and passed to the token as claims, nothing
+    has to be decoded again and all the records are written with one insert
+    and one commit.
+
+    :param identity: token identity (user id or "admin:{admin_id}")
+    :param refresh: also create a refresh token
+    :param write_behind: queue the records in ``token_write_queue`` instead of
+        writing them now (for high-volume refresh traffic). Ignored when the
+        blocklist cache is not shared between workers.
+    :return: dict with ``access_token`` (and ``refresh_token``)
+    """
+    config = current_app.config
+    kinds = [("access", create_access_token, config["JWT_ACCESS_TOKEN_EXPIRES"])]
+    if refresh:
+        kinds.append(
+            ("refresh", create_refresh_token, config["JWT_REFRESH_TOKEN_EXPIRES"])
+        )
+
+    now = datetime.now(timezone.utc)
+    tokens = {}
+    records = []
+    for token_type, create_token, expires_delta in kinds:
+        jti = str(uuid.uuid4())
+        exp = int((now + expires_delta).timestamp())
+        tokens[f"{token_type}_token"] = create_token(
+            identity=identity, additional_claims={"jti": jti, "exp": exp}
+        )
+        records.append(
+            {
+                "jti": jti,
+                "token_type": token_type,
+                "user_id": identity,
+                "expires": datetime.fromtimestamp(exp),
+                "revoked": False,
+            }
+        )
+
+    if blocklist_policy() != POLICY_ALLOWLIST:
+        return tokens
+
+    if write_behind and blocklist_cache.shared:
+        for record in records:
+            token_write_queue.put(record)
+            # 저장 전에도 다른 워커가 유효한 토큰으로 인식하도록 (Redis로 공유)
+            blocklist_cache.set(record["jti"], False, record["expires"].timestamp())
+    else:
+        db.session.execute(insert(TokenBlocklist), records)
+        db.session.commit()
+    return tokens
 
 
 def is_token_revoked(jwt_payload):
     """
-    Checks if the given token is revoked or not. Because we are adding all the
-    tokens that we create into this database, if the token is not present
-    in the database we are going to consider it revoked, as we don't know where
-    it was created.
+    Checks if the given token is revoked or not.
+
+    With the ``allowlist`` policy we are adding all the tokens that we create
+    into this database, so if the token is not present in the database we are
+    going to consider it revoked, as we don't know where it was created.
+    With the ``revocation`` policy an absent token is valid.
+
+    A token revoked only because it is absent is not cached: it may still be
+    queued for write-behind in another worker and appear after the flush.
     """
     jti = jwt_payload["jti"]
+    exp = jwt_payload["exp"]
+    revoked = blocklist_cache.get(jti, exp)
+    if revoked is not None:
+        return revoked
+
     try:
         token = TokenBlocklist.query.filter_by(jti=jti).one()
-        return token.revoked
+        revoked = token.revoked
     except NoResultFound:
-        return True
+        revoked = blocklist_policy() == POLICY_ALLOWLIST and not (
+            token_write_queue.contains(jti)
+        )
+        if revoked:
+            return revoked
+    blocklist_cache.set(jti, revoked, exp)
+    return revoked
 
 
-def revoke_token(token_jti, user):
+def revoke_token(jwt_payload, identity_claim):
     """Revokes the given token
 
     Since we use it only on logout that already require a valid access token,
-    if token is not found we raise an exception
+    with the ``allowlist`` policy a missing token is still queued for
+    write-behind in another worker: we answer 409 so the client can retry.
+    With the ``revocation`` policy the token is added as revoked; if a
+    concurrent request revoked it first (unique ``jti``), this is a success.
+
+    :raises Conflict: ``allowlist`` policy and the token is not stored yet
+
+    :param jwt_payload: decoded token (``get_jwt()``)
+    :param identity_claim: configured key to get user identity
     """
-    try:
-        token = TokenBlocklist.query.filter_by(jti=token_jti, user_id=user).one()
+    token_jti = jwt_payload["jti"]
+    user = jwt_payload[identity_claim]
+    if token_write_queue.contains(token_jti):
+        token_write_queue.flush()
+    token = _find_token(token_jti, user)
+    if token is not None:
         token.revoked = True
+    elif blocklist_policy() == POLICY_REVOCATION:
+        db.session.add(
+            TokenBlocklist(
+                jti=token_jti,
+                token_type=jwt_payload["type"],
+                user_id=user,
+                expires=datetime.fromtimestamp(jwt_payload["exp"]),
+                revoked=True,
+            )
+        )
+    else:
+        raise Conflict("Token {} is not stored yet, retry shortly".format(token_jti))
+    try:
         db.session.commit()
-    except NoResultFound:
-        raise Exception("Could not find the token {}".format(token_jti))
+    except IntegrityError:
+        # another request (double logout) inserted the same jti first
+        db.session.rollback()
+        token = _find_token(token_jti, user)
+        if token is None:
+            raise
+        if not token.revoked:
+            token.revoked = True
+            db.session.commit()
+    blocklist_cache.revoke(token_jti, jwt_payload["exp"])
+
+
+def _find_token(token_jti, user):
+    return TokenBlocklist.query.filter_by(jti=token_jti, user_id=user).first()
+
+
+def purge_issued_tokens():
+    """Deletes tokens that are not revoked
+
+    Used when switching an existing database from the ``allowlist`` policy to
+    the ``revocation`` policy: rows of valid tokens are no longer needed.
+
+    :return: number of deleted rows
+    """
+    deleted = TokenBlocklist.query.filter_by(revoked=False).delete(
+        synchronize_session=False
+    )
+    db.session.commit()
+    return deleted
+
+
+def purge_expired_tokens(batch_size=DEFAULT_PURGE_BATCH_SIZE, now=None):
+    """Deletes expired tokens in batches
+
+    An expired token is rejected by its ``exp`` claim before the blocklist is
+    checked, so its row is no longer needed. Each batch is committed on its
+    own to keep write locks short (SQLite locks the whole database), then
+    table statistics are refreshed for the query planner.
+
+    :param batch_size: maximum number of rows deleted per transaction
+    :param now: purge tokens expired before this time (default: now)
+    :return: number of deleted rows
+    """
+    now = now or datetime.now()
+    deleted = 0
+    while True:
+        ids = [
+            token_id
+            for (token_id,) in db.session.query(TokenBlocklist.id)
+            .filter(TokenBlocklist.expires < now)
+            .order_by(TokenBlocklist.expires)
+            .limit(batch_size)
+        ]
+        if not ids:
+            break
+        TokenBlocklist.query.filter(TokenBlocklist.id.in_(ids)).delete(
+            synchronize_session=False
+        )
+        db.session.commit()
+        deleted += len(ids)
+        if len(ids) < batch_size:
+            break
+
+    if deleted:
+        db.session.execute(text("ANALYZE {}".format(TokenBlocklist.__tablename__)))
+        db.session.commit()
+    return deleted
+
+
+def load_identity(identity):
+    """Loads the user (or admin) of a token identity
+
+    Results are cached in ``identity_cache`` for IDENTITY_CACHE_TTL seconds.
+    Views that declared ``skip_user_lookup`` get an unloaded identity built
+    from the token only.
+
+    :param identity: user id or "admin:{admin_id}"
+    :return: LoadedIdentity, or None if the user does not exist anymore
+    """
+    if user_lookup_skipped():
+        return identity_cache.unloaded(identity)
+
+    loaded = identity_cache.get(identity)
+    if loaded is not None:
+        return loaded
+
+    kind, identity_id = parse_identity(identity)
+    if kind == KIND_ADMIN:
+        admin = db.session.get(Admin, identity_id)
+        if admin is None:
+            return None
+        loaded = LoadedIdentity(kind, identity_id, admin.name, admin.active)
+    else:
+        user = db.session.get(User, identity_id)
+        if user is None:
+            return None
+        loaded = LoadedIdentity(kind, identity_id, user.username, user.active)
+    identity_cache.set(loaded)
+    return loaded
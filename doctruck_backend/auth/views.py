@@ -1,19 +1,19 @@
 import logging
 from flask import request, jsonify, Blueprint, current_app as app
+from werkzeug.exceptions import HTTPException
 from flask_jwt_extended import (
-    create_access_token,
-    create_refresh_token,
     jwt_required,
     get_jwt_identity,
     get_jwt,
 )
 
 from doctruck_backend.models import User, Admin
-from doctruck_backend.extensions import pwd_context, jwt, apispec
+from doctruck_backend.extensions import db, jwt, apispec, login_limiter
 from doctruck_backend.auth.helpers import (
     revoke_token,
     is_token_revoked,
-    add_token_to_database,
+    issue_tokens,
+    load_identity,
 )
 
 logger = logging.getLogger(__name__)
@@ -66,6 +66,8 @@ def login():
                     example: myrefreshtoken
         400:
           description: 잘못된 요청
+        429:
+          description: 로그인 실패 횟수 초과 (Retry-After 헤더의 초만큼 대기)
       security: []
     """
     try:
@@ -85,28 +87,37 @@ def login():
 
         logger.info(f"Login attempt for username: {username}")
 
-        user = User.query.filter_by(username=username).first()
+        # 해싱 전에 실패 횟수 제한 확인 (초과 시 429)
+        login_limiter.check(username, request.remote_addr)
+
+        if login_limiter.is_unknown(username):
+            user = None
+        else:
+            user = User.query.filter_by(username=username).first()
         if user is None:
             logger.warning(f"Login failed: user not found - {username}")
+            login_limiter.remember_unknown(username)
+            login_limiter.failed(username, request.remote_addr)
             return jsonify({"msg": "Bad credentials"}), 400
 
-        if not pwd_context.verify(password, user.password):
+        if not user.check_password(password):
             logger.warning(f"Login failed: invalid password for user - {username}")
+            login_limiter.failed(username, request.remote_addr)
             return jsonify({"msg": "Bad credentials"}), 400
 
-        logger.info(f"User authenticated successfully: {username} (id={user.id})")
+        if db.session.is_modified(user):
+            logger.info(f"Password rehashed for user: {username}")
+            db.session.commit()
 
-        access_token = create_access_token(identity=user.id)
-        refresh_token = create_refresh_token(identity=user.id)
+        logger.info(f"User authenticated successfully: {username} (id={user.id})")
 
-        logger.debug(f"Tokens created for user {user.id}, adding to database")
-        add_token_to_database(access_token, app.config["JWT_IDENTITY_CLAIM"])
-        add_token_to_database(refresh_token, app.config["JWT_IDENTITY_CLAIM"])
+        ret = issue_tokens(user.id)
 
         logger.info(f"Login successful for user: {username}")
-        ret = {"access_token": access_token, "refresh_token": refresh_token}
         return jsonify(ret), 200
 
+    except HTTPException:
+        raise
     except Exception as e:
         username_val = username if "username" in locals() else "unknown"
         logger.error(
@@ -144,9 +155,11 @@ def refresh():
           description: 인증 실패
     """
     current_user = get_jwt_identity()
-    access_token = create_access_token(identity=current_user)
-    ret = {"access_token": access_token}
-    add_token_to_database(access_token, app.config["JWT_IDENTITY_CLAIM"])
+    ret = issue_tokens(
+        current_user,
+        refresh=False,
+        write_behind=app.config["JWT_BLOCKLIST_WRITE_BEHIND"],
+    )
     return jsonify(ret), 200
 
 
@@ -176,9 +189,7 @@ def revoke_access_token():
         401:
           description: 인증 실패
     """
-    jti = get_jwt()["jti"]
-    user_identity = get_jwt_identity()
-    revoke_token(jti, user_identity)
+    revoke_token(get_jwt(), app.config["JWT_IDENTITY_CLAIM"])
     return jsonify({"message": "token revoked"}), 200
 
 
@@ -208,9 +219,7 @@ def revoke_refresh_token():
         401:
           description: 인증 실패
     """
-    jti = get_jwt()["jti"]
-    user_identity = get_jwt_identity()
-    revoke_token(jti, user_identity)
+    revoke_token(get_jwt(), app.config["JWT_IDENTITY_CLAIM"])
     return jsonify({"message": "token revoked"}), 200
 
 
@@ -264,6 +273,8 @@ def admin_login():
           description: 잘못된 요청
         401:
           description: 인증 실패
+        429:
+          description: 로그인 실패 횟수 초과 (Retry-After 헤더의 초만큼 대기)
       security: []
     """
     if not request.is_json:
@@ -274,34 +285,36 @@ def admin_login():
     if not email or not password:
         return jsonify({"msg": "Missing email or password"}), 400
 
-    admin = Admin.query.filter_by(email=email).first()
+    account = f"admin:{email}"
+    login_limiter.check(account, request.remote_addr)
+
+    admin = None
+    if not login_limiter.is_unknown(account):
+        admin = Admin.query.filter_by(email=email).first()
+        if admin is None:
+            login_limiter.remember_unknown(account)
     if admin is None or not admin.check_password(password):
+        login_limiter.failed(account, request.remote_addr)
         return jsonify({"msg": "Bad admin credentials"}), 401
 
     if not admin.active:
         return jsonify({"msg": "Admin account is inactive"}), 401
 
+    if db.session.is_modified(admin):
+        db.session.commit()
+
     # admin_id를 identity로 사용하되, role을 구분하기 위해 "admin:" prefix 추가
     # Spring의 GrantedAuthority와 유사
     admin_identity = f"admin:{admin.admin_id}"
-    access_token = create_access_token(identity=admin_identity)
-    refresh_token = create_refresh_token(identity=admin_identity)
-    add_token_to_database(access_token, app.config["JWT_IDENTITY_CLAIM"])
-    add_token_to_database(refresh_token, app.config["JWT_IDENTITY_CLAIM"])
-
-    ret = {
-        "access_token": access_token,
-        "refresh_token": refresh_token,
-        "admin_id": admin.admin_id,
-        "name": admin.name,
-    }
+    ret = issue_tokens(admin_identity)
+    ret["admin_id"] = admin.admin_id
+    ret["name"] = admin.name
     return jsonify(ret), 200
 
 
 @jwt.user_lookup_loader
 def user_loader_callback(jwt_headers, jwt_payload):
-    identity = jwt_payload["sub"]
-    return User.query.get(identity)
+    return load_identity(jwt_payload[app.config["JWT_IDENTITY_CLAIM"]])
 
 
 @jwt.token_in_blocklist_loader
@@ -1,4 +1,8 @@
 from doctruck_backend.app import init_celery
 
 app = init_celery()
-app.conf.imports = app.conf.imports + ("doctruck_backend.tasks.example",)
+app.conf.imports = app.conf.imports + (
+    "doctruck_backend.tasks.example",
+    "doctruck_backend.tasks.recommendation",
+    "doctruck_backend.tasks.blocklist",
+)
@@ -0,0 +1,212 @@
+"""JWT 블록리스트 조회 캐시
+
+인증이 필요한 모든 요청에서 token_in_blocklist_loader가 TokenBlocklist를 조회하므로,
+토큰(jti)별 폐기 여부를 캐시해 DB 조회를 줄입니다.
+
+Spring Boot와 비교:
+- @Cacheable(value = "tokenBlocklist") + Caffeine(로컬) / Redis(공유) 2단계 캐시
+
+조회 순서:
+1. 프로세스 내부 LRU (TTL = min(BLOCKLIST_CACHE_TTL, 토큰 만료까지 남은 시간))
+   - Redis 없이 실행하면 다른 워커의 폐기를 전파받을 수 없으므로, 유효한 토큰은
+     BLOCKLIST_CACHE_LOCAL_TTL(기본 5초)까지만 캐시합니다 (폐기 후 다른 워커에서 허용되는 최대 시간)
+2. Redis (BLOCKLIST_CACHE_REDIS_URL 설정 시, 모든 워커가 공유)
+3. DB (결과를 1, 2에 저장)
+
+폐기(revoke) 시에는 로컬 캐시를 폐기 상태로 바꾸고, Redis를 사용하면
+Redis 값을 갱신한 뒤 pub/sub 채널로 jti를 전파합니다. 다른 워커는 다음 조회 때
+수신 대기 중인 메시지를 읽어(블로킹 없음) 로컬 캐시에서 해당 jti를 제거합니다.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from doctruck_backend.commons.metrics import Counters
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAXSIZE = 10000
+DEFAULT_TTL = 300  # 초
+DEFAULT_LOCAL_TTL = 5  # 초 (Redis 없이 실행할 때 유효 토큰 캐시 시간 상한)
+
+REDIS_KEY_PREFIX = "doctruck:blocklist:"
+REDIS_CHANNEL = "doctruck:blocklist:revoked"
+
+
+class BlocklistCache:
+    """jti -> 폐기 여부 캐시 (확장 객체: extensions.blocklist_cache)"""
+
+    def __init__(self):
+        self.maxsize = DEFAULT_MAXSIZE
+        self.ttl = DEFAULT_TTL
+        self.local_ttl = DEFAULT_LOCAL_TTL
+        self._entries = OrderedDict()  # jti -> (revoked, 만료 시각(epoch))
+        self._lock = threading.Lock()
+        self._redis = None
+        self._pubsub = None
+        self._pubsub_pid = None
+        self.counters = Counters("hits", "misses", "redis_hits", "invalidations")
+
+    def init_app(self, app):
+        self.maxsize = app.config.get("BLOCKLIST_CACHE_SIZE", DEFAULT_MAXSIZE)
+        self.ttl = app.config.get("BLOCKLIST_CACHE_TTL", DEFAULT_TTL)
+        self.local_ttl = app.config.get("BLOCKLIST_CACHE_LOCAL_TTL", DEFAULT_LOCAL_TTL)
+        self.clear()
+
+        self._redis = None
+        self._pubsub = None
+        redis_url = app.config.get("BLOCKLIST_CACHE_REDIS_URL")
+        if redis_url:
+            import redis
+
+            self._redis = redis.Redis.from_url(redis_url)
+
+    @property
+    def enabled(self):
+        return self.maxsize > 0
+
+    @property
+    def shared(self):
+        """워커 간 공유 여부 (Redis 사용)"""
+        return self._redis is not None
+
+    def get(self, jti, exp=None):
+        """캐시된 폐기 여부 (없으면 None)
+
+        Args:
+            jti: 토큰 ID
+            exp: 토큰 만료 시각 (epoch 초, Redis 값을 로컬에 저장할 때 TTL 상한)
+        """
+        if not self.enabled:
+            return None
+        self._drain_revocations()
+
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(jti)
+            if entry is not None and entry[1] > now:
+                self._entries.move_to_end(jti)
+                self.counters.incr("hits")
+                return entry[0]
+            if entry is not None:
+                del self._entries[jti]
+
+        revoked = self._redis_get(jti)
+        if revoked is not None:
+            self.counters.incr("redis_hits")
+            self._store(jti, revoked, self._local_expiry(revoked, exp, now))
+            return revoked
+
+        self.counters.incr("misses")
+        return None
+
+    def set(self, jti, revoked, exp):
+        """DB 조회 결과 저장
+
+        Args:
+            jti: 토큰 ID
+            revoked: 폐기 여부
+            exp: 토큰 만료 시각 (epoch 초)
+        """
+        if not self.enabled:
+            return
+        now = time.time()
+        if exp <= now:
+            return
+        self._store(jti, revoked, self._local_expiry(revoked, exp, now))
+        self._redis_set(jti, revoked, exp - now)
+
+    def revoke(self, jti, exp):
+        """토큰 폐기 반영 (로컬 캐시 갱신 + Redis 갱신/전파)"""
+        self.counters.incr("invalidations")
+        now = time.time()
+        if self.enabled and exp > now:
+            self._store(jti, True, exp)
+        if self._redis is None or exp <= now:
+            return
+        try:
+            self._redis.set(REDIS_KEY_PREFIX + jti, b"1", ex=max(int(exp - now), 1))
+            self._redis.publish(REDIS_CHANNEL, jti)
+        except Exception:
+            logger.warning("Blocklist cache: Redis revoke failed", exc_info=True)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+        self.counters.reset()
+
+    def stats(self):
+        stats = self.counters.snapshot()
+        lookups = stats["hits"] + stats["redis_hits"] + stats["misses"]
+        stats["size"] = len(self._entries)
+        stats["hit_ratio"] = (
+            round((stats["hits"] + stats["redis_hits"]) / lookups, 4)
+            if lookups
+            else None
+        )
+        return stats
+
+    def _local_expiry(self, revoked, exp, now):
+        # 폐기된 토큰은 다시 유효해지지 않으므로 만료 시각까지 캐시
+        if revoked and exp is not None:
+            return exp
+        # 폐기 전파가 없으면(Redis 미사용) 유효 토큰은 짧게만 캐시
+        ttl = self.ttl if self.shared else min(self.ttl, self.local_ttl)
+        expiry = now + ttl
+        return min(expiry, exp) if exp is not None else expiry
+
+    def _store(self, jti, revoked, expires_at):
+        with self._lock:
+            self._entries[jti] = (revoked, expires_at)
+            self._entries.move_to_end(jti)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def _redis_get(self, jti):
+        if self._redis is None:
+            return None
+        try:
+            value = self._redis.get(REDIS_KEY_PREFIX + jti)
+        except Exception:
+            logger.warning("Blocklist cache: Redis get failed", exc_info=True)
+            return None
+        return None if value is None else value == b"1"
+
+    def _redis_set(self, jti, revoked, ttl):
+        if self._redis is None:
+            return
+        try:
+            self._redis.set(
+                REDIS_KEY_PREFIX + jti,
+                b"1" if revoked else b"0",
+                ex=max(int(ttl), 1),
+                nx=not revoked,  # 동시에 폐기된 값을 '유효'로 덮어쓰지 않도록
+            )
+        except Exception:
+            logger.warning("Blocklist cache: Redis set failed", exc_info=True)
+
+    def _drain_revocations(self):
+        """다른 워커가 전파한 폐기 jti를 읽어 로컬 캐시에서 제거 (블로킹 없음)"""
+        if self._redis is None:
+            return
+        try:
+            # 구독 연결은 워커 프로세스마다 따로 생성 (fork 이전 연결 공유 방지)
+            if self._pubsub is None or self._pubsub_pid != os.getpid():
+                self._pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+                self._pubsub.subscribe(REDIS_CHANNEL)
+                self._pubsub_pid = os.getpid()
+            with self._lock:
+                while True:
+                    message = self._pubsub.get_message(timeout=0)
+                    if message is None:
+                        break
+                    jti = message["data"]
+                    if isinstance(jti, bytes):
+                        jti = jti.decode()
+                    self._entries.pop(jti, None)
+        except Exception:
+            self._pubsub = None
+            logger.warning("Blocklist cache: Redis pub/sub read failed", exc_info=True)
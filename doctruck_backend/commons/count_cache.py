@@ -0,0 +1,136 @@
+"""목록 전체 개수(total) 캐시
+
+paginate()는 페이지마다 필터가 적용된 쿼리로 COUNT(*)를 한 번 더 실행합니다.
+클라이언트는 대부분 같은 필터로 다음 페이지만 조회하므로,
+(테이블, 정규화된 필터) 별로 개수를 캐시하고 테이블 버전이 바뀌면 다시 계산합니다.
+
+count 파라미터:
+- 생략: 테이블 버전이 같으면 캐시된 개수 사용 (항상 정확)
+- exact: 캐시를 사용하지 않고 COUNT(*) 실행 (결과는 캐시에 저장)
+- estimate: 버전과 무관하게 마지막으로 계산된 개수 사용.
+  없으면 PostgreSQL은 실행 계획의 예상 행 수, 그 외에는 COUNT(*)
+- none: 개수를 계산하지 않음 (total/pages = null)
+"""
+
+import threading
+from collections import OrderedDict
+
+from flask import current_app, has_app_context
+
+from doctruck_backend.commons.table_versions import get_table_versions
+from doctruck_backend.extensions import db
+
+COUNT_EXACT = "exact"
+COUNT_ESTIMATE = "estimate"
+COUNT_NONE = "none"
+COUNT_MODES = (COUNT_EXACT, COUNT_ESTIMATE, COUNT_NONE)
+
+DEFAULT_CACHE_SIZE = 1024
+
+# 개수에 영향을 주지 않는 파라미터 (캐시 키에서 제외)
+NON_FILTER_ARGS = frozenset(
+    ["page", "per_page", "cursor", "include_total", "count", "sort", "fields"]
+)
+
+
+class CountCache:
+    """(테이블, 필터) -> (테이블 버전, 개수) LRU 캐시 (프로세스 단위, thread-safe)"""
+
+    def __init__(self, maxsize=DEFAULT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key, version, count):
+        with self._lock:
+            self._entries[key] = (version, count)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+count_cache = CountCache()
+
+
+def normalize_filters(args, view_args=None):
+    """요청 파라미터를 순서와 무관한 필터 키로 정규화 (빈 값, 페이지네이션 파라미터 제외)"""
+    items = [
+        (key, value.strip())
+        for key, value in args.items(multi=True)
+        if key not in NON_FILTER_ARGS and value.strip()
+    ]
+    items += [(key, str(value)) for key, value in (view_args or {}).items()]
+    return tuple(sorted(items))
+
+
+def _cache_size():
+    if has_app_context():
+        return current_app.config.get("COUNT_CACHE_SIZE", DEFAULT_CACHE_SIZE)
+    return DEFAULT_CACHE_SIZE
+
+
+def _exact_count(query):
+    return query.order_by(None).count()
+
+
+def _estimated_count(query):
+    """PostgreSQL 실행 계획의 예상 행 수 (지원하지 않으면 None)"""
+    bind = db.session.get_bind()
+    if bind.dialect.name != "postgresql":
+        return None
+    compiled = query.order_by(None).statement.compile(dialect=bind.dialect)
+    plan = (
+        db.session.connection()
+        .exec_driver_sql("EXPLAIN (FORMAT JSON) " + compiled.string, compiled.params)
+        .scalar()
+    )
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def count_total(query, table_name, filters, mode=None):
+    """목록 전체 개수 계산
+
+    Args:
+        query: 필터가 적용된 Query
+        table_name: 개수에 영향을 주는 테이블 (버전 확인용)
+        filters: normalize_filters() 결과
+        mode: None(캐시) / exact / estimate / none
+
+    Returns:
+        int | None: 전체 개수 (mode가 none이면 None)
+    """
+    if mode == COUNT_NONE:
+        return None
+
+    count_cache.maxsize = _cache_size()
+    key = (table_name, filters)
+    entry = count_cache.get(key)
+
+    if mode == COUNT_ESTIMATE:
+        if entry is not None:
+            return entry[1]
+        estimate = _estimated_count(query)
+        if estimate is not None:
+            return estimate
+
+    version = get_table_versions(table_name)[table_name]
+    if mode is None and entry is not None and entry[0] == version:
+        return entry[1]
+
+    total = _exact_count(query)
+    count_cache.set(key, version, total)
+    return total
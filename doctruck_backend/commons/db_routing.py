@@ -0,0 +1,75 @@
+"""읽기/쓰기 DB 분리 (읽기 전용 bind 라우팅)
+
+읽기 전용으로 선언한 리소스의 SELECT는 "read" bind(읽기 복제본 또는 읽기 전용
+SQLite 커넥션)로 보내고, 쓰기(flush)와 그 이후의 조회는 항상 기본(primary) DB를 사용합니다.
+"read" bind가 설정되지 않았으면 모든 쿼리가 기본 DB로 갑니다.
+
+Spring Boot와 비교:
+- AbstractRoutingDataSource + @Transactional(readOnly = true)
+
+사용법:
+- 리소스 클래스: read_only = True (또는 뷰 함수에 @read_only 데코레이터)
+- 요청별 재정의: X-DB-Consistency: strong 헤더 -> 기본 DB에서 조회
+  (방금 쓴 데이터를 바로 읽어야 하는 클라이언트용, 복제 지연 회피)
+"""
+
+from flask import current_app, g, has_request_context, request
+from flask_sqlalchemy.session import Session
+from sqlalchemy import Select, event
+from sqlalchemy.orm import Session as OrmSession
+
+READ_BIND = "read"
+CONSISTENCY_HEADER = "X-DB-Consistency"
+STRONG_CONSISTENCY = "strong"
+
+# session.info: 이 세션(요청)에서 쓰기가 발생했는지 (이후 조회는 커밋 후에도 기본 DB)
+_WROTE_KEY = "db_routing_wrote"
+
+
+def read_only(view):
+    """읽기 전용 뷰/리소스 표시 (SELECT를 read bind로 보냄)"""
+    view.read_only = True
+    return view
+
+
+def route_reads_for_request():
+    """before_request: 현재 요청의 조회를 read bind로 보낼지 결정"""
+    g.db_use_read_bind = False
+    if request.endpoint is None:
+        return
+    view = current_app.view_functions.get(request.endpoint)
+    # flask-restful 리소스는 view_class에 선언
+    view = getattr(view, "view_class", view)
+    if not getattr(view, "read_only", False):
+        return
+    if request.headers.get(CONSISTENCY_HEADER, "").lower() == STRONG_CONSISTENCY:
+        return
+    g.db_use_read_bind = True
+
+
+class RoutingSession(Session):
+    """읽기 전용 요청의 SELECT를 read bind로 보내는 세션"""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and self._use_read_bind(clause):
+            engine = self._db.engines.get(READ_BIND)
+            if engine is not None:
+                return engine
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+    def _use_read_bind(self, clause):
+        if not has_request_context() or not g.get("db_use_read_bind"):
+            return False
+        if self._flushing or self.info.get(_WROTE_KEY):
+            return False
+        return isinstance(clause, Select)
+
+
+def _after_flush(session, flush_context):
+    session.info[_WROTE_KEY] = True
+
+
+def register_routing_listeners():
+    """쓰기 이후 같은 세션의 조회는 기본 DB 사용 (read-your-writes)"""
+    if not event.contains(OrmSession, "after_flush", _after_flush):
+        event.listen(OrmSession, "after_flush", _after_flush)
@@ -0,0 +1,160 @@
+"""DB 엔진 설정 (커넥션 풀, 읽기 전용 bind, SQLite PRAGMA)
+
+여러 gunicorn 워커와 Celery가 같은 SQLite 파일에 쓰면 기본 설정(rollback journal)에서는
+쓰기 중 읽기도 막히고 'database is locked' 오류가 자주 발생합니다.
+새 커넥션마다 아래 PRAGMA를 적용해 동시성을 높입니다.
+
+Spring Boot와 비교:
+- spring.datasource.hikari.connection-init-sql / data-source-properties
+
+설정 (SQLite에만 적용):
+- SQLITE_JOURNAL_MODE: WAL (읽기와 쓰기가 서로 막지 않음, 쓰기는 한 번에 하나)
+- SQLITE_SYNCHRONOUS: NORMAL (WAL에서는 커밋마다 fsync하지 않아도 손상 위험 없음)
+- SQLITE_BUSY_TIMEOUT_MS: 잠금 대기 시간 (즉시 실패하지 않고 대기 후 재시도)
+- SQLITE_CACHE_SIZE: 페이지 캐시 (음수 = KiB 단위)
+- SQLITE_MMAP_SIZE: 메모리 맵 I/O 크기 (바이트, 0이면 사용 안 함)
+
+커넥션 풀 (모든 DB):
+- DB_POOL_SIZE / DB_MAX_OVERFLOW: 유지할 커넥션 수 / 추가로 열 수 있는 커넥션 수
+- DB_POOL_PRE_PING: 커넥션을 꺼낼 때 끊김 여부 확인
+- DB_POOL_RECYCLE: 커넥션 최대 사용 시간(초)
+
+읽기 전용 bind (commons/db_routing.py 참고):
+- DATABASE_READ_URI: 읽기 복제본 (예: PostgreSQL replica)
+- SQLITE_READ_ONLY_BIND: DATABASE_READ_URI가 없을 때 같은 SQLite 파일을 읽기 전용(mode=ro)으로 연결
+  (읽기 bind에는 busy_timeout/cache_size/mmap_size와 query_only만 적용,
+  journal_mode/synchronous는 쓰기 엔진에만 적용)
+"""
+
+import logging
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+
+from doctruck_backend.commons.db_routing import READ_BIND
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_MODES = ("DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF")
+SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+# 읽기 전용 커넥션에 적용해도 안전한 PRAGMA (커넥션 단위 설정)
+# journal_mode는 DB 파일 헤더를 바꾸는 쓰기 작업이라 mode=ro 커넥션에서는 실패하고,
+# synchronous는 쓰기에만 의미가 있음 (WAL 전환은 쓰기 엔진 커넥션이 담당)
+READ_SAFE_PRAGMAS = ("busy_timeout", "cache_size", "mmap_size")
+
+
+def sqlite_pragmas(config):
+    """앱 설정 -> [(PRAGMA 이름, 값)]
+
+    Raises:
+        ValueError: 허용되지 않는 값인 경우 (PRAGMA 문에 그대로 들어가므로 검증)
+    """
+    pragmas = []
+    journal_mode = config.get("SQLITE_JOURNAL_MODE")
+    if journal_mode:
+        journal_mode = journal_mode.upper()
+        if journal_mode not in JOURNAL_MODES:
+            raise ValueError(f"Invalid SQLITE_JOURNAL_MODE {journal_mode}")
+        pragmas.append(("journal_mode", journal_mode))
+    synchronous = config.get("SQLITE_SYNCHRONOUS")
+    if synchronous:
+        synchronous = synchronous.upper()
+        if synchronous not in SYNCHRONOUS_MODES:
+            raise ValueError(f"Invalid SQLITE_SYNCHRONOUS {synchronous}")
+        pragmas.append(("synchronous", synchronous))
+    for name, key in (
+        ("busy_timeout", "SQLITE_BUSY_TIMEOUT_MS"),
+        ("cache_size", "SQLITE_CACHE_SIZE"),
+        ("mmap_size", "SQLITE_MMAP_SIZE"),
+    ):
+        if config.get(key) is not None:
+            pragmas.append((name, int(config[key])))
+    return pragmas
+
+
+def read_only_pragmas(pragmas):
+    """읽기 전용 bind용 PRAGMA (읽기 안전한 설정 + query_only)"""
+    return [(name, value) for name, value in pragmas if name in READ_SAFE_PRAGMAS] + [
+        ("query_only", "ON")
+    ]
+
+
+def apply_pragmas(dbapi_connection, pragmas):
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in pragmas:
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+
+def _is_sqlite_memory(url):
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+
+def sqlite_read_only_uri(uri):
+    """SQLite 파일 URI -> 같은 파일의 읽기 전용 URI (메모리 DB면 None)"""
+    url = make_url(uri)
+    if url.get_backend_name() != "sqlite" or _is_sqlite_memory(url):
+        return None
+    return f"sqlite:///file:{url.database}?mode=ro&uri=true"
+
+
+def configure_engine_options(app):
+    """db.init_app() 전에 호출 - SQLALCHEMY_ENGINE_OPTIONS / SQLALCHEMY_BINDS 설정"""
+    uri = app.config.get("SQLALCHEMY_DATABASE_URI")
+    if not uri:
+        return
+    url = make_url(uri)
+    options = app.config.setdefault("SQLALCHEMY_ENGINE_OPTIONS", {})
+
+    if app.config.get("DB_POOL_PRE_PING") is not None:
+        options.setdefault("pool_pre_ping", app.config["DB_POOL_PRE_PING"])
+    if app.config.get("DB_POOL_RECYCLE") is not None:
+        options.setdefault("pool_recycle", app.config["DB_POOL_RECYCLE"])
+    # SQLite 메모리 DB는 단일 커넥션(StaticPool)이므로 풀 크기 설정 불가
+    if not _is_sqlite_memory(url):
+        for option, key in (
+            ("pool_size", "DB_POOL_SIZE"),
+            ("max_overflow", "DB_MAX_OVERFLOW"),
+        ):
+            if app.config.get(key) is not None:
+                options.setdefault(option, app.config[key])
+
+    read_uri = app.config.get("DATABASE_READ_URI")
+    if not read_uri and app.config.get("SQLITE_READ_ONLY_BIND"):
+        read_uri = sqlite_read_only_uri(uri)
+    if read_uri:
+        app.config.setdefault("SQLALCHEMY_BINDS", {})[READ_BIND] = read_uri
+
+    if url.get_backend_name() == "sqlite":
+        connect_args = options.setdefault("connect_args", {})
+        # pysqlite 자체 잠금 대기 시간(초)도 busy_timeout과 맞춤
+        busy_timeout = app.config.get("SQLITE_BUSY_TIMEOUT_MS")
+        if busy_timeout is not None:
+            connect_args.setdefault("timeout", busy_timeout / 1000)
+
+
+def register_sqlite_pragmas(app, db):
+    """db.init_app() 후 호출 - SQLite 엔진의 새 커넥션마다 PRAGMA 적용
+
+    읽기 전용 bind에는 read_only_pragmas()만 적용합니다.
+    """
+    pragmas = sqlite_pragmas(app.config)
+
+    with app.app_context():
+        for bind, engine in db.engines.items():
+            if engine.dialect.name != "sqlite":
+                continue
+            engine_pragmas = (
+                read_only_pragmas(pragmas) if bind == READ_BIND else pragmas
+            )
+            if not engine_pragmas:
+                continue
+
+            def on_connect(dbapi_connection, connection_record, pragmas=engine_pragmas):
+                apply_pragmas(dbapi_connection, pragmas)
+
+            event.listen(engine, "connect", on_connect)
+            logger.debug(f"SQLite pragmas for {engine.url}: {engine_pragmas}")
@@ -0,0 +1,341 @@
+"""위치 좌표 검색 (반경 / 영역) - geohash 격자 색인
+
+Location.latitude/longitude에는 B-tree 인덱스를 걸어도 반경 검색에 쓸 수 없으므로,
+좌표를 geohash 문자열로 인코딩해 인덱스가 있는 locations.geohash 컬럼에 저장합니다.
+geohash는 같은 접두사를 공유하는 위치가 같은 격자 셀에 속하므로,
+검색 영역을 덮는 셀 목록을 구한 뒤 "geohash >= 셀 AND geohash < 셀 + '~'"
+범위 조건(인덱스 범위 스캔)으로 후보만 조회합니다.
+
+1. 검색 영역(bbox 또는 중심 + 반경)을 덮는 geohash 셀 계산
+2. SQL: 셀 범위 조건 + 위도/경도 bbox 조건으로 후보 조회
+3. Python: 후보에만 haversine 거리 계산 (반경 필터, 거리순 정렬)
+
+PostGIS / SQLite R*Tree 없이 두 DB에서 같은 방식으로 동작합니다.
+
+추천 점수의 거리 계산처럼 많은 위치의 거리를 한 번에 구할 때는
+운영 중인 위치 좌표를 NumPy 배열로 캐시해 두고(LocationCoordinates)
+행마다 Python 계산 대신 배열 연산 한 번으로 계산합니다.
+"""
+
+import math
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+
+import numpy as np
+from sqlalchemy import and_, event, or_
+from werkzeug.exceptions import BadRequest
+
+from doctruck_backend.commons.table_versions import get_table_versions
+from doctruck_backend.extensions import db
+from doctruck_backend.models import Location
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE_LAT = 111.32
+
+# 저장 정밀도 (9자리 = 약 5m 셀)
+GEOHASH_PRECISION = 9
+# 검색 영역을 덮는 최대 셀 수 (셀이 많으면 한 단계 큰 셀 사용)
+MAX_COVER_CELLS = 16
+
+DEFAULT_RADIUS_KM = 5.0
+MAX_RADIUS_KM = 100.0
+
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+# geohash 문자보다 큰 ASCII 문자 (접두사 범위 조건의 상한)
+_RANGE_END = "~"
+
+
+def encode_geohash(latitude, longitude, precision=GEOHASH_PRECISION):
+    """위도/경도를 geohash 문자열로 인코딩"""
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    value = 0
+    even = True  # 짝수 번째 비트는 경도
+    while len(chars) < precision:
+        target, coordinate = (lon_range, longitude) if even else (lat_range, latitude)
+        middle = (target[0] + target[1]) / 2
+        value <<= 1
+        if coordinate >= middle:
+            value |= 1
+            target[0] = middle
+        else:
+            target[1] = middle
+        even = not even
+        bits += 1
+        if bits == 5:
+            chars.append(_BASE32[value])
+            bits = 0
+            value = 0
+    return "".join(chars)
+
+
+def _cell_size(precision):
+    """geohash 셀 크기 (위도 높이, 경도 너비) - 도 단위"""
+    lon_bits = math.ceil(precision * 5 / 2)
+    lat_bits = precision * 5 // 2
+    return 180.0 / 2**lat_bits, 360.0 / 2**lon_bits
+
+
+def covering_cells(min_lat, min_lon, max_lat, max_lon):
+    """영역을 덮는 geohash 셀 목록 (MAX_COVER_CELLS개 이하가 되는 가장 작은 셀)"""
+    for precision in range(GEOHASH_PRECISION, 0, -1):
+        height, width = _cell_size(precision)
+        rows = math.floor(max_lat / height) - math.floor(min_lat / height) + 1
+        cols = math.floor(max_lon / width) - math.floor(min_lon / width) + 1
+        if rows * cols <= MAX_COVER_CELLS:
+            break
+
+    cells = set()
+    for row in range(rows):
+        lat = min(min_lat + row * height, max_lat)
+        for col in range(cols):
+            lon = min(min_lon + col * width, max_lon)
+            cells.add(encode_geohash(lat, lon, precision))
+    # 셀 경계에서 반올림 오차로 빠지는 셀이 없도록 모서리 셀 포함
+    for lat in (min_lat, max_lat):
+        for lon in (min_lon, max_lon):
+            cells.add(encode_geohash(lat, lon, precision))
+    return sorted(cells)
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    """두 좌표 사이의 대원 거리 (km)"""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = (
+        math.sin(d_phi / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def haversine_km_array(lat, lon, lats_rad, lons_rad):
+    """기준 좌표(도)에서 여러 좌표(라디안 배열)까지의 대원 거리 배열 (km)"""
+    phi = math.radians(lat)
+    d_phi = lats_rad - phi
+    d_lambda = lons_rad - math.radians(lon)
+    a = (
+        np.sin(d_phi / 2) ** 2
+        + math.cos(phi) * np.cos(lats_rad) * np.sin(d_lambda / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+
+@dataclass(frozen=True)
+class LocationCoordinates:
+    """운영 중인 위치 좌표 배열 (location_id 오름차순)"""
+
+    location_ids: np.ndarray
+    lats_rad: np.ndarray
+    lons_rad: np.ndarray
+
+    def distances_km(self, lat, lon, location_ids):
+        """기준 좌표에서 위치들까지의 거리 (좌표가 없는 위치는 NaN)
+
+        Args:
+            lat, lon: 기준 좌표 (도)
+            location_ids: 거리를 구할 위치 ID 목록
+
+        Returns:
+            np.ndarray: location_ids 순서의 거리 배열 (km)
+        """
+        ids = np.asarray(location_ids, dtype=np.int64)
+        positions = np.searchsorted(self.location_ids, ids)
+        positions = np.minimum(positions, max(len(self.location_ids) - 1, 0))
+        found = (
+            self.location_ids[positions] == ids
+            if len(self.location_ids)
+            else np.zeros(len(ids), dtype=bool)
+        )
+
+        distances = np.full(len(ids), np.nan)
+        matched = positions[found]
+        distances[found] = haversine_km_array(
+            lat, lon, self.lats_rad[matched], self.lons_rad[matched]
+        )
+        return distances
+
+
+_coordinates_lock = threading.Lock()
+_coordinates_cache = {}
+
+
+def load_location_coordinates(today=None):
+    """운영 중인 위치 좌표 배열 (locations 테이블 버전 + 날짜 기준 캐시)
+
+    위치가 추가/수정/삭제되어 테이블 버전이 바뀌거나 날짜가 바뀌면 다시 조회합니다.
+    """
+    today = today or datetime.now()
+    key = (
+        get_table_versions(Location.__tablename__)[Location.__tablename__],
+        today.date(),
+    )
+    with _coordinates_lock:
+        cached = _coordinates_cache.get("entry")
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+    start_of_day = datetime.combine(today.date(), datetime.min.time())
+    rows = (
+        db.session.query(Location.location_id, Location.latitude, Location.longitude)
+        .filter(
+            Location.latitude.isnot(None),
+            Location.longitude.isnot(None),
+            or_(Location.end_datetime.is_(None), Location.end_datetime >= start_of_day),
+        )
+        .order_by(Location.location_id)
+        .all()
+    )
+    values = np.array([(lat, lon) for _, lat, lon in rows], dtype=np.float64).reshape(
+        -1, 2
+    )
+    coordinates = LocationCoordinates(
+        location_ids=np.array([row[0] for row in rows], dtype=np.int64),
+        lats_rad=np.radians(values[:, 0]),
+        lons_rad=np.radians(values[:, 1]),
+    )
+    with _coordinates_lock:
+        _coordinates_cache["entry"] = (key, coordinates)
+    return coordinates
+
+
+@dataclass(frozen=True)
+class SpatialQuery:
+    """좌표 검색 조건
+
+    bbox: (min_lat, min_lon, max_lat, max_lon)
+    center: (lat, lon) - 반경 검색/거리 계산 기준 (없으면 영역 검색만)
+    radius_km: 반경 (center가 있을 때만)
+    """
+
+    bbox: tuple
+    center: tuple = None
+    radius_km: float = None
+
+    def candidate_filter(self):
+        """후보 조회 SQL 조건 (geohash 셀 범위 + 위도/경도 영역)"""
+        min_lat, min_lon, max_lat, max_lon = self.bbox
+        cells = covering_cells(min_lat, min_lon, max_lat, max_lon)
+        return and_(
+            or_(
+                *(
+                    and_(Location.geohash >= cell, Location.geohash < cell + _RANGE_END)
+                    for cell in cells
+                )
+            ),
+            Location.latitude.between(min_lat, max_lat),
+            Location.longitude.between(min_lon, max_lon),
+        )
+
+    def distance_km(self, location):
+        return haversine_km(
+            self.center[0],
+            self.center[1],
+            float(location.latitude),
+            float(location.longitude),
+        )
+
+    def refine(self, locations, sort_by_distance=False):
+        """후보 위치에 거리 계산 후 반경 필터 (및 거리순 정렬)
+
+        Returns:
+            list: (location, distance_km) 튜플 목록
+        """
+        results = []
+        for location in locations:
+            distance = self.distance_km(location)
+            if self.radius_km is None or distance <= self.radius_km:
+                results.append((location, distance))
+        if sort_by_distance:
+            # 거리가 같으면 기존 정렬 순서 유지 (stable sort)
+            results.sort(key=lambda pair: pair[1])
+        return results
+
+
+def _parse_float(args, name, low, high):
+    value = args.get(name)
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        raise BadRequest(f"Invalid {name}: {value}")
+    if not low <= number <= high or math.isnan(number):
+        raise BadRequest(f"{name} must be between {low} and {high}")
+    return number
+
+
+def parse_spatial_args(args):
+    """lat/lon/radius_km, bbox 파라미터 파싱
+
+    - lat, lon (+ radius_km, 기본 5km): 중심 좌표 반경 검색
+    - bbox=min_lon,min_lat,max_lon,max_lat: 영역 검색 (GeoJSON 순서)
+    - 둘 다 지정하면 영역 안에서 반경 검색
+
+    Returns:
+        SpatialQuery | None: 좌표 조건이 없으면 None
+
+    Raises:
+        BadRequest: 잘못된 파라미터
+    """
+    has_center = "lat" in args or "lon" in args
+    bbox_value = args.get("bbox")
+    if not has_center and not bbox_value:
+        if "radius_km" in args:
+            raise BadRequest("radius_km requires lat and lon")
+        return None
+
+    bbox = None
+    if bbox_value:
+        try:
+            min_lon, min_lat, max_lon, max_lat = (
+                float(v) for v in bbox_value.split(",")
+            )
+        except ValueError:
+            raise BadRequest("bbox must be min_lon,min_lat,max_lon,max_lat")
+        if not (-90 <= min_lat <= max_lat <= 90 and -180 <= min_lon <= max_lon <= 180):
+            raise BadRequest("bbox must be min_lon,min_lat,max_lon,max_lat")
+        bbox = (min_lat, min_lon, max_lat, max_lon)
+
+    if not has_center:
+        return SpatialQuery(bbox=bbox)
+
+    lat = _parse_float(args, "lat", -90, 90)
+    lon = _parse_float(args, "lon", -180, 180)
+    radius_km = DEFAULT_RADIUS_KM
+    if "radius_km" in args:
+        radius_km = _parse_float(args, "radius_km", 0, MAX_RADIUS_KM)
+
+    # 반경을 덮는 영역 (경도 1도의 거리는 위도에 따라 줄어듦)
+    d_lat = radius_km / KM_PER_DEGREE_LAT
+    d_lon = radius_km / (KM_PER_DEGREE_LAT * max(math.cos(math.radians(lat)), 1e-6))
+    radius_bbox = (
+        max(lat - d_lat, -90.0),
+        max(lon - d_lon, -180.0),
+        min(lat + d_lat, 90.0),
+        min(lon + d_lon, 180.0),
+    )
+    if bbox is not None:
+        radius_bbox = (
+            max(bbox[0], radius_bbox[0]),
+            max(bbox[1], radius_bbox[1]),
+            min(bbox[2], radius_bbox[2]),
+            min(bbox[3], radius_bbox[3]),
+        )
+    return SpatialQuery(bbox=radius_bbox, center=(lat, lon), radius_km=radius_km)
+
+
+def _set_geohash(mapper, connection, target):
+    if target.latitude is None or target.longitude is None:
+        target.geohash = None
+    else:
+        target.geohash = encode_geohash(float(target.latitude), float(target.longitude))
+
+
+def register_geohash_listeners():
+    """Location 저장 시 좌표로 geohash 컬럼 계산 (애플리케이션 팩토리에서 한 번 호출)"""
+    if not event.contains(Location, "before_insert", _set_geohash):
+        event.listen(Location, "before_insert", _set_geohash)
+        event.listen(Location, "before_update", _set_geohash)
@@ -0,0 +1,185 @@
+"""조건부 GET (ETag / Last-Modified -> 304 Not Modified) + Cache-Control + 응답 캐시
+
+공개 조회 API(위치/공문서 상세, 목록)는 폴링이 잦지만 데이터는 관리자 작업 때만 바뀝니다.
+응답 검증자(ETag)를 쿼리/직렬화 없이 테이블 버전(commons/table_versions.py)만으로
+계산하므로, 클라이언트나 CDN이 If-None-Match로 재검증하면 버전 한 행만 읽고
+본문 없는 304를 반환합니다.
+
+ETag = hash(엔드포인트, 경로/쿼리 파라미터, 테이블 버전, JSON 인코더)
+- 테이블 버전은 데이터 변경(커밋) 시 함께 바뀌므로 같은 ETag = 같은 응답 본문 (strong ETag)
+- Last-Modified = 테이블 버전 변경 시각 (If-None-Match가 없을 때만 If-Modified-Since 비교)
+
+Spring Boot와 비교:
+- ShallowEtagHeaderFilter (단, 본문을 만들기 전에 ETag 계산)
+- WebRequest.checkNotModified(etag, lastModified)
+- ResponseEntity.ok().cacheControl(CacheControl.maxAge(...).sMaxAge(...))
+
+설정:
+- HTTP_CACHE_MAX_AGE: 브라우저 캐시 시간 (기본 0 = 매번 ETag로 재검증)
+- HTTP_CACHE_S_MAXAGE: CDN(공유 캐시) 캐시 시간
+- HTTP_CACHE_STALE_WHILE_REVALIDATE: 만료 후 재검증하는 동안 이전 응답 제공 시간
+
+응답 캐시(commons/response_cache.py)는 304로 끝나지 않은 요청의 쿼리/직렬화를 생략합니다.
+캐시 키에는 ETag와 같은 테이블 버전을 사용하므로(요청당 한 번 조회), 캐시된 본문은
+항상 그 ETag의 데이터와 같습니다.
+
+사용법:
+    class LocationList(Resource):
+        @conditional_get(Location.__tablename__)
+        @cached_response(Location.__tablename__)
+        def get(self):
+            ...
+"""
+
+import hashlib
+from functools import wraps
+
+from flask import current_app, request
+from werkzeug.http import http_date, parse_date, quote_etag
+
+from doctruck_backend.commons.response_cache import cache_key
+from doctruck_backend.commons.table_versions import get_table_version_info
+from doctruck_backend.extensions import response_cache
+
+_VERSION_INFO_KEY = "doctruck.table_version_info"
+
+
+def cache_control():
+    """설정값 -> 공개 응답 Cache-Control 헤더 값"""
+    config = current_app.config
+    directives = ["public", f"max-age={config.get('HTTP_CACHE_MAX_AGE', 0)}"]
+    s_maxage = config.get("HTTP_CACHE_S_MAXAGE")
+    if s_maxage is not None:
+        directives.append(f"s-maxage={s_maxage}")
+    stale = config.get("HTTP_CACHE_STALE_WHILE_REVALIDATE")
+    if stale:
+        directives.append(f"stale-while-revalidate={stale}")
+    return ", ".join(directives)
+
+
+def request_table_version_info(table_names):
+    """현재 요청의 테이블 버전 정보 (conditional_get / cached_response가 같은 값 사용)
+
+    Returns:
+        dict: 테이블 이름 -> (버전, 변경 시각)
+    """
+    # 요청 단위 저장 (g는 앱 컨텍스트 단위라 요청 간에 공유될 수 있음)
+    info = request.environ.setdefault(_VERSION_INFO_KEY, {})
+    missing = [name for name in table_names if name not in info]
+    if missing:
+        info.update(get_table_version_info(*missing))
+    return {name: info[name] for name in table_names}
+
+
+def compute_validators(table_names, view_args):
+    """현재 요청의 (ETag, Last-Modified) 계산
+
+    Returns:
+        tuple: (ETag 값 - 따옴표 제외, 마지막 변경 시각 또는 None)
+    """
+    info = request_table_version_info(table_names)
+    key = "\n".join(
+        [
+            request.endpoint or "",
+            repr(sorted(view_args.items())),
+            repr(sorted(request.args.items(multi=True))),
+            repr(sorted((name, version) for name, (version, _) in info.items())),
+            getattr(current_app.json, "encoder", ""),
+        ]
+    )
+    etag = hashlib.sha1(key.encode("utf-8")).hexdigest()
+    modified = [updated_at for _, updated_at in info.values() if updated_at]
+    return etag, max(modified) if modified else None
+
+
+def is_not_modified(etag, last_modified):
+    """If-None-Match / If-Modified-Since 조건 확인 (RFC 9110 13.2.2 순서)"""
+    if "If-None-Match" in request.headers:
+        return request.if_none_match.contains(etag)
+    since = parse_date(request.headers.get("If-Modified-Since"))
+    if since is None or last_modified is None:
+        return False
+    # HTTP 날짜는 초 단위 (테이블 버전 시각은 UTC naive datetime)
+    return last_modified.replace(microsecond=0) <= since.replace(tzinfo=None)
+
+
+def _cache_headers(etag, last_modified):
+    headers = {"ETag": quote_etag(etag), "Cache-Control": cache_control()}
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+    return headers
+
+
+def _with_headers(rv, headers):
+    """Resource 반환값((data, code[, headers]))에 헤더 추가 (200 응답만)"""
+    if not isinstance(rv, tuple):
+        return rv, 200, headers
+    code = rv[1] if len(rv) > 1 else 200
+    if code != 200:
+        return rv
+    return rv[0], code, {**headers, **(rv[2] if len(rv) > 2 else {})}
+
+
+def conditional_get(*table_names):
+    """공개 GET 핸들러에 조건부 GET + Cache-Control 적용
+
+    테이블 버전을 데이터보다 먼저 읽습니다. 그 사이 데이터가 바뀌면 새 본문에 이전 ETag가
+    붙지만 다음 요청에서 버전이 달라 200으로 다시 받습니다 (반대 순서면 이전 본문에
+    새 ETag가 붙어 다음 변경 전까지 오래된 응답이 304로 유지될 수 있음).
+
+    Args:
+        table_names: 응답이 의존하는 테이블 (table_versions.TRACKED_TABLES)
+    """
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            etag, last_modified = compute_validators(table_names, kwargs)
+            headers = _cache_headers(etag, last_modified)
+            if is_not_modified(etag, last_modified):
+                # 쿼리/직렬화 없이 본문 없는 304 반환 (flask-restful은 Response를 그대로 반환)
+                return current_app.response_class(status=304, headers=headers)
+            return _with_headers(view(*args, **kwargs), headers)
+
+        return wrapper
+
+    return decorator
+
+
+def cached_response(*table_names):
+    """공개 GET 핸들러의 200 응답 데이터를 (엔드포인트, 파라미터, 테이블 버전)별로 캐시
+
+    테이블 버전을 데이터보다 먼저 읽으므로, 그 사이 커밋된 데이터가 이전 버전 키에
+    저장될 수는 있어도 이전 데이터가 새 버전 키에 저장되지는 않습니다.
+
+    Args:
+        table_names: 응답이 의존하는 테이블 (변경 커밋 시 무효화되는 태그)
+    """
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if not response_cache.enabled:
+                return view(*args, **kwargs)
+            versions = {
+                name: version
+                for name, (version, _) in request_table_version_info(
+                    table_names
+                ).items()
+            }
+            key = cache_key(request.endpoint, request.args, kwargs, versions)
+            data = response_cache.get(key)
+            if data is not None:
+                return data, 200
+            # 뷰 실행 중 무효화되면 저장하지 않도록 실행 전 generation 기록
+            generation = response_cache.generation(table_names)
+            rv = view(*args, **kwargs)
+            if isinstance(rv, dict):
+                rv = rv, 200
+            if isinstance(rv, tuple) and len(rv) == 2 and rv[1] == 200:
+                response_cache.set(key, table_names, rv[0], generation)
+            return rv
+
+        return wrapper
+
+    return decorator
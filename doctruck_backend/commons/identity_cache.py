@@ -0,0 +1,143 @@
+"""JWT identity(사용자/관리자) 조회 캐시
+
+jwt_required가 붙은 모든 요청에서 user_lookup_loader가 호출되므로,
+identity별 조회 결과를 짧은 TTL 동안 캐시해 User/Admin 조회를 줄입니다.
+
+Spring Boot와 비교:
+- UserDetailsService + UserCache (CachingUserDetailsService)
+- @CacheEvict = invalidate() (사용자 수정/삭제 시 명시적으로 호출)
+
+identity 형식:
+- 일반 사용자: user.id (예: 1)
+- 관리자: "admin:{admin_id}" (예: "admin:1")
+
+로드된 사용자 정보가 필요 없는 리소스는 @skip_user_lookup(또는 클래스 속성
+skip_user_lookup = True)으로 표시하면 DB/캐시 조회 없이 JWT claim만 사용합니다.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from flask import current_app, has_request_context, request
+
+from doctruck_backend.commons.metrics import Counters
+
+DEFAULT_MAXSIZE = 10000
+DEFAULT_TTL = 30  # 초
+
+KIND_USER = "user"
+KIND_ADMIN = "admin"
+ADMIN_PREFIX = "admin:"
+
+
+@dataclass(frozen=True)
+class LoadedIdentity:
+    """current_user로 사용되는 identity 정보 (세션과 무관한 값 객체)"""
+
+    kind: str
+    id: int
+    name: Optional[str] = None
+    active: Optional[bool] = None
+    loaded: bool = True
+
+    @property
+    def is_admin(self):
+        return self.kind == KIND_ADMIN
+
+
+def parse_identity(identity):
+    """JWT identity -> (종류, ID)
+
+    Args:
+        identity: user.id 또는 "admin:{admin_id}"
+
+    Returns:
+        tuple: (KIND_USER | KIND_ADMIN, int)
+    """
+    if isinstance(identity, str) and identity.startswith(ADMIN_PREFIX):
+        return KIND_ADMIN, int(identity.split(":", 1)[1])
+    return KIND_USER, int(identity)
+
+
+def skip_user_lookup(view):
+    """로드된 사용자가 필요 없는 뷰/리소스 표시 (user_lookup_loader 조회 생략)"""
+    view.skip_user_lookup = True
+    return view
+
+
+def user_lookup_skipped():
+    """현재 요청의 뷰가 사용자 조회 생략을 선언했는지"""
+    if not has_request_context() or request.endpoint is None:
+        return False
+    view = current_app.view_functions.get(request.endpoint)
+    # flask-restful 리소스는 view_class에 선언
+    view = getattr(view, "view_class", view)
+    return getattr(view, "skip_user_lookup", False)
+
+
+class IdentityCache:
+    """(종류, ID) -> LoadedIdentity 캐시 (확장 객체: extensions.identity_cache)"""
+
+    def __init__(self):
+        self.maxsize = DEFAULT_MAXSIZE
+        self.ttl = DEFAULT_TTL
+        self._entries = OrderedDict()  # key -> (LoadedIdentity, 만료 시각)
+        self._lock = threading.Lock()
+        self.counters = Counters("hits", "misses", "skipped", "invalidations")
+
+    def init_app(self, app):
+        self.maxsize = app.config.get("IDENTITY_CACHE_SIZE", DEFAULT_MAXSIZE)
+        self.ttl = app.config.get("IDENTITY_CACHE_TTL", DEFAULT_TTL)
+        self.clear()
+
+    def get(self, identity):
+        """캐시된 identity 정보 (없거나 만료되면 None)"""
+        key = parse_identity(identity)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > now:
+                self._entries.move_to_end(key)
+                self.counters.incr("hits")
+                return entry[0]
+            if entry is not None:
+                del self._entries[key]
+        self.counters.incr("misses")
+        return None
+
+    def set(self, loaded):
+        if self.maxsize <= 0 or self.ttl <= 0:
+            return
+        key = (loaded.kind, loaded.id)
+        with self._lock:
+            self._entries[key] = (loaded, time.time() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, identity):
+        """identity 캐시 제거 (사용자 수정/삭제 후 호출)"""
+        self.counters.incr("invalidations")
+        with self._lock:
+            self._entries.pop(parse_identity(identity), None)
+
+    def unloaded(self, identity):
+        """조회를 생략한 요청용 identity (JWT claim만 사용)"""
+        self.counters.incr("skipped")
+        kind, identity_id = parse_identity(identity)
+        return LoadedIdentity(kind=kind, id=identity_id, loaded=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+        self.counters.reset()
+
+    def stats(self):
+        stats = self.counters.snapshot()
+        lookups = stats["hits"] + stats["misses"]
+        stats["size"] = len(self._entries)
+        stats["hit_ratio"] = round(stats["hits"] / lookups, 4) if lookups else None
+        return stats
@@ -0,0 +1,143 @@
+"""JSON 응답 인코더 (orjson / 미리 생성한 stdlib 인코더)
+
+flask-restful 응답과 jsonify()는 호출마다 json.JSONEncoder를 새로 만들고,
+ASCII 이스케이프와 default 콜백 변환을 거쳐 인코딩합니다. 목록 응답처럼 큰 페이지에서는
+인코딩 시간이 커지므로 app.json(Flask JSON provider)을 교체하고
+flask-restful도 같은 provider를 사용하게 합니다.
+
+Spring Boot와 비교:
+- HttpMessageConverter 교체 (MappingJackson2HttpMessageConverter 설정)
+
+설정:
+- JSON_ENCODER: orjson (기본값, 설치되어 있지 않으면 json으로 대체) | json
+  - orjson: C 확장 인코더 (datetime/date/Enum/UUID/dataclass 기본 지원)
+  - json: 표준 라이브러리 C 인코더를 앱 시작 시 한 번만 생성해 재사용
+
+두 방식 모두 datetime/date는 ISO 8601, Decimal은 float, Enum은 value로 변환합니다.
+orjson은 한글을 UTF-8 그대로 쓰고, json은 기존처럼 \\uXXXX로 이스케이프합니다
+(표준 라이브러리 C 인코더는 ASCII 출력이 더 빠름).
+
+이전(flask-restful 기본 인코더)과 달라지는 출력:
+- orjson(기본값): 한글 등 비ASCII 문자가 \\uXXXX 대신 UTF-8 그대로 출력됨
+- 디버그 모드 들여쓰기: 4칸 -> 2칸
+- RESTFUL_JSON 설정(flask-restful json.dumps 옵션)은 더 이상 적용되지 않음
+"""
+
+import dataclasses
+import decimal
+import enum
+import json
+import logging
+import uuid
+from datetime import date, datetime, time
+
+from flask import current_app, make_response
+from flask.json.provider import JSONProvider
+
+logger = logging.getLogger(__name__)
+
+ENCODER_ORJSON = "orjson"
+ENCODER_JSON = "json"
+ENCODERS = (ENCODER_ORJSON, ENCODER_JSON)
+
+
+def _default(obj):
+    """기본 인코더가 지원하지 않는 타입 변환"""
+    if isinstance(obj, decimal.Decimal):
+        return float(obj)
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if hasattr(obj, "__html__"):
+        return str(obj.__html__())
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class FastJSONProvider(JSONProvider):
+    """app.json 교체용 provider (jsonify, flask-restful 응답 공통)"""
+
+    #: jsonify() 응답의 키 정렬 (Flask 기본값과 동일)
+    sort_keys = True
+
+    def __init__(self, app, encoder=ENCODER_ORJSON):
+        super().__init__(app)
+        self._orjson = None
+        if encoder == ENCODER_ORJSON:
+            try:
+                import orjson
+
+                self._orjson = orjson
+            except ImportError:
+                logger.warning("JSON_ENCODER=orjson but orjson is not installed")
+                encoder = ENCODER_JSON
+        self.encoder = encoder
+        # (sort_keys, indent) -> 미리 생성한 JSONEncoder
+        self._encoders = {
+            (sort_keys, indent): json.JSONEncoder(
+                default=_default,
+                sort_keys=sort_keys,
+                indent=indent,
+                separators=(",", ": ") if indent else (",", ":"),
+            )
+            for sort_keys in (False, True)
+            for indent in (None, 2)
+        }
+
+    def dumps_bytes(self, obj, sort_keys=None, indent=False):
+        """obj -> UTF-8 JSON bytes (응답 본문)"""
+        sort_keys = self.sort_keys if sort_keys is None else sort_keys
+        if self._orjson is not None:
+            option = self._orjson.OPT_NON_STR_KEYS
+            if sort_keys:
+                option |= self._orjson.OPT_SORT_KEYS
+            if indent:
+                option |= self._orjson.OPT_INDENT_2
+            return self._orjson.dumps(obj, default=_default, option=option)
+        encoder = self._encoders[(bool(sort_keys), 2 if indent else None)]
+        return encoder.encode(obj).encode("utf-8")
+
+    def dumps(self, obj, **kwargs):
+        return self.dumps_bytes(
+            obj, kwargs.get("sort_keys"), indent=bool(kwargs.get("indent"))
+        ).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        if self._orjson is not None and not kwargs:
+            return self._orjson.loads(s)
+        return json.loads(s, **kwargs)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        body = self.dumps_bytes(obj, indent=self._app.debug) + b"\n"
+        return self._app.response_class(body, mimetype="application/json")
+
+
+def init_json_provider(app):
+    """JSON_ENCODER 설정에 따라 app.json 교체"""
+    encoder = app.config.get("JSON_ENCODER", ENCODER_ORJSON)
+    if encoder not in ENCODERS:
+        raise ValueError(f"Unknown JSON_ENCODER {encoder}")
+    app.json = FastJSONProvider(app, encoder)
+
+
+def output_json(data, code, headers=None):
+    """flask-restful application/json representation (app.json provider 사용)
+
+    flask-restful 기본 구현처럼 응답 순서(스키마 필드 순서)를 유지하고
+    디버그 모드에서는 들여쓰기합니다.
+    """
+    provider = current_app.json
+    if isinstance(provider, FastJSONProvider):
+        body = provider.dumps_bytes(data, sort_keys=False, indent=current_app.debug)
+    else:
+        body = provider.dumps(data, sort_keys=False).encode("utf-8")
+    response = make_response(body + b"\n", code)
+    response.headers.extend(headers or {})
+    return response
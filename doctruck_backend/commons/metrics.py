@@ -0,0 +1,54 @@
+"""프로세스 내부 캐시/제한기 통계 수집
+
+각 캐시는 register_stats()로 통계 함수를 등록하고,
+관리자 통계 API(/api/v1/admin/stats)가 collect_stats()로 모아서 응답합니다.
+(통계는 워커 프로세스 단위입니다)
+"""
+
+import threading
+
+_lock = threading.Lock()
+_providers = {}
+
+
+def register_stats(name, provider):
+    """통계 함수 등록 (같은 이름이면 교체)
+
+    Args:
+        name: 통계 이름 (예: "blocklist_cache")
+        provider: 인자 없이 dict를 반환하는 함수
+    """
+    with _lock:
+        _providers[name] = provider
+
+
+def collect_stats():
+    """등록된 모든 통계
+
+    Returns:
+        dict: 이름 -> 통계 dict
+    """
+    with _lock:
+        providers = dict(_providers)
+    return {name: provider() for name, provider in sorted(providers.items())}
+
+
+class Counters:
+    """thread-safe 카운터 묶음"""
+
+    def __init__(self, *names):
+        self._lock = threading.Lock()
+        self._values = dict.fromkeys(names, 0)
+
+    def incr(self, name, amount=1):
+        with self._lock:
+            self._values[name] = self._values.get(name, 0) + amount
+
+    def snapshot(self):
+        with self._lock:
+            return dict(self._values)
+
+    def reset(self):
+        with self._lock:
+            for name in self._values:
+                self._values[name] = 0
@@ -1,33 +1,115 @@
-"""Simple helper to paginate query"""
+"""Simple helper to paginate query
+
+두 가지 모드를 지원합니다.
+
+- page 모드 (기본): ?page=2&per_page=10 -> OFFSET/LIMIT + 전체 개수(COUNT) 조회
+- cursor 모드: ?cursor=&per_page=10 -> 정렬 키 기준 keyset(seek) 조회
+
+cursor 모드는 이전 페이지의 마지막 행 정렬 키 이후부터 조회하므로
+뒤 페이지로 갈수록 느려지는 OFFSET 스캔이 없고, 전체 개수는
+include_total=true일 때만 조회합니다. 첫 페이지는 빈 cursor로 요청하고,
+응답의 next_cursor(없으면 null = 마지막 페이지)로 다음 페이지를 요청합니다.
+
+결과는 컴파일된 직렬화 함수(commons/serializers.py)로 생성합니다.
+
+count_table을 지정한 엔드포인트는 전체 개수를 캐시하고 count 파라미터
+(exact / estimate / none)를 지원합니다 (commons/count_cache.py 참고).
+"""
+
+import base64
+import json
+import math
+from datetime import date, datetime
 
 from flask import url_for, request
+from sqlalchemy import and_, or_
+from werkzeug.exceptions import BadRequest, NotFound
+
+from doctruck_backend.commons.count_cache import (
+    COUNT_MODES,
+    COUNT_NONE,
+    count_total,
+    normalize_filters,
+)
+from doctruck_backend.commons.serializers import dump
 
 DEFAULT_PAGE_SIZE = 50
 DEFAULT_PAGE_NUMBER = 1
+MAX_PAGE_SIZE = 100
+
+
+def _positive_int(name, value, default, maximum=None):
+    """페이지 파라미터 검증 (1 이상 maximum 이하 정수)
+
+    Raises:
+        BadRequest: 정수가 아니거나 범위를 벗어난 경우
+    """
+    if value is None:
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        raise BadRequest(f"Invalid {name}: {value}")
+    if number < 1 or (maximum is not None and number > maximum):
+        limit = f"between 1 and {maximum}" if maximum else "at least 1"
+        raise BadRequest(f"Invalid {name}: {value} (must be {limit})")
+    return number
 
 
-def extract_pagination(page=None, per_page=None, **request_args):
-    page = int(page) if page is not None else DEFAULT_PAGE_NUMBER
-    per_page = int(per_page) if per_page is not None else DEFAULT_PAGE_SIZE
+def extract_pagination(
+    page=None, per_page=None, cursor=None, include_total=None, **request_args
+):
+    """요청 파라미터 -> (page, per_page, 나머지 파라미터)
+
+    Raises:
+        BadRequest: page가 1 미만이거나 per_page가 1~MAX_PAGE_SIZE 범위가 아닌 경우
+    """
+    page = _positive_int("page", page, DEFAULT_PAGE_NUMBER)
+    per_page = _positive_int("per_page", per_page, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE)
     return page, per_page, request_args
 
 
-def paginate(query, schema):
+def paginate(query, schema, cursor_keys=None, count_table=None):
+    """쿼리 결과 페이지네이션
+
+    Args:
+        query: 정렬이 적용된 Query
+        schema: 결과 직렬화 스키마 (many=True)
+        cursor_keys: cursor 모드 정렬 키 (정렬 컬럼, PK) - 둘 다 내림차순.
+            None이면 cursor 모드를 지원하지 않는 엔드포인트
+        count_table: 전체 개수 캐시 기준 테이블 이름.
+            None이면 매 요청 COUNT(*) 실행 (count 파라미터 미지원)
+    """
+    if "cursor" in request.args:
+        if cursor_keys is None:
+            raise BadRequest("Cursor pagination is not supported for this request")
+        return paginate_cursor(query, schema, cursor_keys, count_table)
+
     page, per_page, other_request_args = extract_pagination(**request.args)
-    page_obj = query.paginate(page=page, per_page=per_page)
+    if count_table is None:
+        page_obj = query.paginate(page=page, per_page=per_page)
+    else:
+        mode = _count_mode()
+        # 개수를 계산하지 않으면 마지막 페이지를 알 수 없으므로 빈 페이지도 허용
+        page_obj = query.paginate(
+            page=page, per_page=per_page, error_out=mode != COUNT_NONE, count=False
+        )
+        page_obj.total = _count(query, count_table, mode)
+        if page_obj.total is None:
+            return _uncounted_page(page_obj, schema, other_request_args)
     next_ = url_for(
         request.endpoint,
         page=page_obj.next_num if page_obj.has_next else page_obj.page,
         per_page=per_page,
         **other_request_args,
-        **request.view_args
+        **request.view_args,
     )
     prev = url_for(
         request.endpoint,
         page=page_obj.prev_num if page_obj.has_prev else page_obj.page,
         per_page=per_page,
         **other_request_args,
-        **request.view_args
+        **request.view_args,
     )
 
     return {
@@ -35,5 +117,187 @@ def paginate(query, schema):
         "pages": page_obj.pages,
         "next": next_,
         "prev": prev,
-        "results": schema.dump(page_obj.items),
+        "results": dump(schema, page_obj.items),
+    }
+
+
+def _count_mode():
+    mode = request.args.get("count")
+    if mode is not None and mode not in COUNT_MODES:
+        raise BadRequest(f"Invalid count: {mode}")
+    return mode
+
+
+def _count(query, count_table, mode):
+    filters = normalize_filters(request.args, request.view_args)
+    return count_total(query, count_table, filters, mode)
+
+
+def _uncounted_page(page_obj, schema, other_request_args):
+    """전체 개수 없이 페이지 응답 생성 (결과가 per_page개면 다음 페이지가 있다고 간주)"""
+    has_next = len(page_obj.items) == page_obj.per_page
+    next_ = url_for(
+        request.endpoint,
+        page=page_obj.page + 1 if has_next else page_obj.page,
+        per_page=page_obj.per_page,
+        **other_request_args,
+        **request.view_args,
+    )
+    prev = url_for(
+        request.endpoint,
+        page=page_obj.prev_num if page_obj.has_prev else page_obj.page,
+        per_page=page_obj.per_page,
+        **other_request_args,
+        **request.view_args,
+    )
+    return {
+        "total": None,
+        "pages": None,
+        "next": next_,
+        "prev": prev,
+        "results": dump(schema, page_obj.items),
+    }
+
+
+def paginate_list(items, dump):
+    """이미 조회/정렬된 목록의 page 모드 페이지네이션
+
+    거리순 정렬처럼 DB에서 정렬/필터를 끝낼 수 없어 Python에서 처리한 결과에 사용합니다.
+    cursor 모드는 지원하지 않습니다 (cursor 파라미터가 있으면 400).
+
+    Args:
+        items: 전체 결과 목록
+        dump: 현재 페이지 항목 목록 -> 직렬화 결과 목록
+    """
+    if "cursor" in request.args:
+        raise BadRequest("Cursor pagination is not supported for this request")
+    page, per_page, other_request_args = extract_pagination(**request.args)
+
+    total = len(items)
+    pages = math.ceil(total / per_page)
+    start, end = (page - 1) * per_page, page * per_page
+    page_items = items[start:end]
+    if not page_items and page != 1:
+        raise NotFound()
+
+    next_ = url_for(
+        request.endpoint,
+        page=page + 1 if page < pages else page,
+        per_page=per_page,
+        **other_request_args,
+        **request.view_args,
+    )
+    prev = url_for(
+        request.endpoint,
+        page=page - 1 if page > 1 else page,
+        per_page=per_page,
+        **other_request_args,
+        **request.view_args,
+    )
+
+    return {
+        "total": total,
+        "pages": pages,
+        "next": next_,
+        "prev": prev,
+        "results": dump(page_items),
     }
+
+
+def paginate_cursor(query, schema, cursor_keys, count_table=None):
+    """keyset(cursor) 페이지네이션
+
+    (sort_column DESC NULLS LAST, pk DESC) 순으로 정렬하고,
+    cursor가 가리키는 행 이후의 per_page + 1개를 조회해 다음 페이지 여부를 판단합니다.
+    """
+    sort_column, pk_column = cursor_keys
+    _, per_page, other_request_args = extract_pagination(**request.args)
+    include_total = request.args.get("include_total", "").lower() == "true"
+
+    total = None
+    if include_total:
+        if count_table is None:
+            total = query.order_by(None).count()
+        else:
+            total = _count(query, count_table, _count_mode())
+
+    page_query = query.order_by(None).order_by(
+        sort_column.desc().nulls_last(), pk_column.desc()
+    )
+    cursor = request.args.get("cursor")
+    if cursor:
+        sort_value, pk_value = decode_cursor(cursor, sort_column)
+        page_query = page_query.filter(
+            _after_cursor(sort_column, pk_column, sort_value, pk_value)
+        )
+
+    rows = page_query.limit(per_page + 1).all()
+    items = rows[:per_page]
+
+    next_cursor = None
+    next_ = None
+    if len(rows) > per_page:
+        last = items[-1]
+        next_cursor = encode_cursor(
+            getattr(last, sort_column.key), getattr(last, pk_column.key)
+        )
+        if include_total:
+            other_request_args["include_total"] = "true"
+        next_ = url_for(
+            request.endpoint,
+            cursor=next_cursor,
+            per_page=per_page,
+            **other_request_args,
+            **request.view_args,
+        )
+
+    result = {
+        "next_cursor": next_cursor,
+        "next": next_,
+        "results": dump(schema, items),
+    }
+    if include_total:
+        result["total"] = total
+    return result
+
+
+def _after_cursor(sort_column, pk_column, sort_value, pk_value):
+    """(sort_column DESC NULLS LAST, pk DESC) 순서에서 cursor 이후 행 조건"""
+    if sort_value is None:
+        return and_(sort_column.is_(None), pk_column < pk_value)
+
+    condition = or_(
+        sort_column < sort_value,
+        and_(sort_column == sort_value, pk_column < pk_value),
+    )
+    if sort_column.expression.nullable:
+        condition = or_(condition, sort_column.is_(None))
+    return condition
+
+
+def encode_cursor(sort_value, pk_value):
+    """정렬 키 값을 불투명한 cursor 문자열로 인코딩"""
+    if isinstance(sort_value, (date, datetime)):
+        sort_value = sort_value.isoformat()
+    payload = json.dumps([sort_value, pk_value], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor, sort_column):
+    """cursor 문자열을 (정렬 키 값, PK 값)으로 디코딩
+
+    Raises:
+        BadRequest: 형식이 잘못된 cursor
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, pk_value = json.loads(base64.urlsafe_b64decode(padded))
+        if sort_value is not None:
+            python_type = sort_column.type.python_type
+            if python_type in (date, datetime):
+                sort_value = python_type.fromisoformat(sort_value)
+        if not isinstance(pk_value, int):
+            raise ValueError(pk_value)
+    except (ValueError, TypeError):
+        raise BadRequest("Invalid cursor")
+    return sort_value, pk_value
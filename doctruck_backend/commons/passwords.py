@@ -0,0 +1,192 @@
+"""비밀번호 해싱 설정 및 검증 작업 풀
+
+Spring Boot와 비교:
+- DelegatingPasswordEncoder (기본 알고리즘 + 기존 해시 검증 + upgradeEncoding)
+- 검증 풀 = @Async 전용 ThreadPoolTaskExecutor (queueCapacity 제한)
+
+설정:
+- PASSWORD_SCHEMES: 사용할 알고리즘 (쉼표 구분). 첫 번째가 새 해시에 사용되고
+  나머지는 기존 해시 검증용입니다. 로그인 성공 시 기본 알고리즘이 아니거나
+  비용 설정이 바뀐 해시는 needs_update()로 감지해 다시 해싱합니다.
+- PASSWORD_ARGON2_* / PASSWORD_BCRYPT_ROUNDS / PASSWORD_PBKDF2_ROUNDS: 알고리즘별 비용
+- PASSWORD_VERIFY_POOL: none(요청 스레드에서 검증) | thread | process
+- PASSWORD_VERIFY_POOL_SIZE / PASSWORD_VERIFY_MAX_PENDING: 풀 크기 / 대기 포함 최대 동시 검증 수
+
+검증 풀은 동시 해싱 수를 제한하는 입장 제어(admission control)입니다.
+요청 스레드는 검증이 끝날 때까지 기다리므로 gunicorn 워커를 비워 주지는 않으며,
+대기 자리(MAX_PENDING)가 가득 차면 해싱 없이 바로 503을 반환해 로그인 폭주가
+워커를 오래 점유하지 않도록 합니다.
+
+풀은 프로세스별로 첫 검증 때 생성합니다 (gunicorn --preload에서 fork 전에 만든
+풀을 자식 프로세스가 물려받으면 동작하지 않으므로).
+"""
+
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from passlib.context import CryptContext
+from passlib.exc import MissingBackendError
+from passlib.registry import get_crypt_handler
+from werkzeug.exceptions import ServiceUnavailable
+
+from doctruck_backend.commons.metrics import Counters
+
+POOL_NONE = "none"
+POOL_THREAD = "thread"
+POOL_PROCESS = "process"
+POOLS = (POOL_NONE, POOL_THREAD, POOL_PROCESS)
+
+# 설정 키 -> CryptContext 옵션 (알고리즘별 비용)
+COST_SETTINGS = {
+    "argon2": {
+        "PASSWORD_ARGON2_TIME_COST": "time_cost",
+        "PASSWORD_ARGON2_MEMORY_COST": "memory_cost",
+        "PASSWORD_ARGON2_PARALLELISM": "parallelism",
+    },
+    "bcrypt": {"PASSWORD_BCRYPT_ROUNDS": "rounds"},
+    "pbkdf2_sha256": {"PASSWORD_PBKDF2_ROUNDS": "rounds"},
+}
+
+# 프로세스 풀 워커에서 사용하는 CryptContext
+_worker_context = None
+
+
+def context_settings(config):
+    """앱 설정 -> CryptContext.load()용 dict
+
+    Raises:
+        RuntimeError: 설정한 알고리즘의 라이브러리가 설치되지 않은 경우
+    """
+    schemes = [s.strip() for s in config["PASSWORD_SCHEMES"].split(",") if s.strip()]
+    settings = {"schemes": schemes, "default": schemes[0], "deprecated": "auto"}
+    for scheme in schemes:
+        handler = get_crypt_handler(scheme)
+        try:
+            # argon2/bcrypt 등 외부 라이브러리가 필요한 알고리즘만 backend 확인
+            if hasattr(handler, "get_backend"):
+                handler.get_backend()
+        except MissingBackendError:
+            raise RuntimeError(
+                f"Password scheme {scheme} requires an extra package "
+                f"(pip install passlib[{scheme}])"
+            )
+        for key, option in COST_SETTINGS.get(scheme, {}).items():
+            if config.get(key) is None:
+                continue
+            if option == "rounds":
+                # min/max를 함께 지정해야 다른 rounds의 해시가 needs_update 대상이 됨
+                for bound in ("default_rounds", "min_rounds", "max_rounds"):
+                    settings[f"{scheme}__{bound}"] = config[key]
+            else:
+                settings[f"{scheme}__{option}"] = config[key]
+    return settings
+
+
+def _init_worker(context_string):
+    global _worker_context
+    _worker_context = CryptContext.from_string(context_string)
+
+
+def _verify_in_worker(secret, hashed):
+    return _worker_context.verify_and_update(secret, hashed)
+
+
+class PasswordVerifier:
+    """비밀번호 검증 + 재해싱 (확장 객체: extensions.password_verifier)"""
+
+    def __init__(self, context):
+        self.context = context
+        self.pool = POOL_NONE
+        self.pool_size = 0
+        self.max_pending = 0
+        self._executor = None
+        self._slots = None
+        self._pid = None  # _executor/_slots를 만든 프로세스
+        self._lock = threading.Lock()
+        self.counters = Counters("verified", "rehashed", "rejected")
+
+    def init_app(self, app):
+        """pwd_context 재설정 및 검증 풀 설정 (풀은 verify_and_update()에서 생성)"""
+        self.context.load(context_settings(app.config))
+
+        if self._executor is not None and self._pid == os.getpid():
+            self._executor.shutdown(wait=False)
+        self._executor = None
+        self.pool = app.config.get("PASSWORD_VERIFY_POOL", POOL_NONE)
+        if self.pool not in POOLS:
+            raise ValueError(f"Unknown PASSWORD_VERIFY_POOL {self.pool}")
+        if self.pool == POOL_NONE:
+            return
+
+        self.pool_size = app.config.get("PASSWORD_VERIFY_POOL_SIZE", 2)
+        self.max_pending = (
+            app.config.get("PASSWORD_VERIFY_MAX_PENDING") or self.pool_size * 4
+        )
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._pid = os.getpid()
+
+    def verify_and_update(self, secret, hashed):
+        """비밀번호 검증
+
+        Args:
+            secret: 입력한 비밀번호
+            hashed: 저장된 해시
+
+        Returns:
+            tuple: (일치 여부, 새 해시 또는 None) - 새 해시가 있으면 저장해야 함
+
+        Raises:
+            ServiceUnavailable: 검증 풀이 가득 찬 경우 (503, Retry-After)
+        """
+        if self.pool == POOL_NONE:
+            valid, new_hash = self.context.verify_and_update(secret, hashed)
+        else:
+            executor, slots = self._process_pool()
+            if not slots.acquire(blocking=False):
+                self.counters.incr("rejected")
+                raise ServiceUnavailable(
+                    "Too many concurrent logins, try again later", retry_after=1
+                )
+            try:
+                # 요청 스레드는 결과를 기다림 (풀은 동시 해싱 수만 제한)
+                future = executor.submit(self._verify_task(), secret, hashed)
+                valid, new_hash = future.result()
+            finally:
+                slots.release()
+
+        self.counters.incr("verified")
+        if new_hash is not None:
+            self.counters.incr("rehashed")
+        return valid, new_hash
+
+    def _process_pool(self):
+        """현재 프로세스의 (executor, 대기 자리 semaphore) - 없거나 fork 후면 새로 생성"""
+        with self._lock:
+            if self._pid != os.getpid():
+                # fork 이전 프로세스의 풀/semaphore는 사용하지 않음 (종료도 하지 않음)
+                self._executor = None
+                self._slots = threading.BoundedSemaphore(self.max_pending)
+                self._pid = os.getpid()
+            if self._executor is None:
+                if self.pool == POOL_THREAD:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.pool_size, thread_name_prefix="password-verify"
+                    )
+                else:
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.pool_size,
+                        initializer=_init_worker,
+                        initargs=(self.context.to_string(),),
+                    )
+            return self._executor, self._slots
+
+    def _verify_task(self):
+        if self.pool == POOL_PROCESS:
+            return _verify_in_worker
+        return self.context.verify_and_update
+
+    def stats(self):
+        stats = self.counters.snapshot()
+        stats["pool"] = self.pool
+        return stats
@@ -0,0 +1,82 @@
+"""목록 조회 컬럼 projection + sparse fieldset (fields= 파라미터)
+
+목록 엔드포인트는 ORM 엔티티 전체(예: Document.ai_summary 같은 큰 Text 컬럼)를
+로드한 뒤 스키마 필드만 직렬화했습니다. projection 모드에서는 스키마 필드에 해당하는
+컬럼만 SELECT해 Row 튜플로 받으므로 identity map 등록, 변경 추적 상태 생성 없이
+필요한 값만 읽습니다. Row는 속성 접근을 지원하므로 같은 스키마로 직렬화됩니다.
+
+Spring Boot와 비교:
+- Spring Data JPA interface/DTO projection (SELECT new ...Dto(...))
+- JSON:API sparse fieldsets (?fields=title,published_at)
+
+사용법:
+    schema = requested_schema(documents_schema)  # ?fields=doc_id,title
+    query = project(query, schema, Document.published_at, Document.doc_id)
+    return paginate(query, schema, ...)
+"""
+
+from functools import lru_cache
+
+from flask import request
+from werkzeug.exceptions import BadRequest
+
+FIELDS_ARG = "fields"
+
+
+@lru_cache(maxsize=256)
+def _restricted_schema(schema_class, many, names):
+    return schema_class(many=many, only=names)
+
+
+def requested_schema(schema):
+    """fields= 파라미터로 필드를 제한한 스키마 (없으면 schema 그대로)
+
+    필드 순서는 요청 순서와 무관하게 스키마 순서를 따르며,
+    제한된 스키마 인스턴스는 필드 조합별로 캐시합니다.
+
+    Raises:
+        BadRequest: 스키마에 없는 필드를 요청한 경우
+    """
+    value = request.args.get(FIELDS_ARG)
+    if value is None:
+        return schema
+    requested = {name.strip() for name in value.split(",") if name.strip()}
+    unknown = requested - set(schema.dump_fields)
+    if unknown:
+        raise BadRequest(f"Invalid fields: {', '.join(sorted(unknown))}")
+    if not requested or requested == set(schema.dump_fields):
+        return schema
+    names = tuple(name for name in schema.dump_fields if name in requested)
+    return _restricted_schema(type(schema), schema.many, names)
+
+
+def projected_columns(model, schema):
+    """스키마 dump 필드 -> 모델 컬럼 목록 (컬럼이 아닌 필드가 있으면 None)"""
+    column_attrs = model.__mapper__.column_attrs
+    columns = []
+    for name, field in schema.dump_fields.items():
+        attr = field.attribute or name
+        if attr not in column_attrs:
+            return None
+        columns.append(getattr(model, attr))
+    return columns
+
+
+def project(query, schema, *required):
+    """엔티티 쿼리 -> 스키마 필드 컬럼만 조회하는 쿼리
+
+    Args:
+        query: 단일 모델 엔티티 Query (필터/조인/정렬 유지)
+        schema: 직렬화 스키마 (requested_schema() 결과)
+        required: 응답에는 없어도 조회해야 하는 컬럼 (cursor 정렬 키, 거리 계산 좌표 등)
+
+    Returns:
+        Query: Row 튜플을 반환하는 Query (projection할 수 없으면 원래 query)
+    """
+    model = query.column_descriptions[0]["entity"]
+    columns = projected_columns(model, schema)
+    if columns is None:
+        return query
+    keys = {column.key for column in columns}
+    columns += [column for column in required if column.key not in keys]
+    return query.with_entities(*columns)
@@ -0,0 +1,226 @@
+"""로그인 시도 제한 (token bucket) + 존재하지 않는 계정 캐시
+
+무차별 대입(brute-force) 요청이 실제 로그인과 같은 비용(사용자 조회 + 비밀번호 해싱)을
+쓰지 않도록, 해싱 전에 제한 여부를 확인하고 실패한 시도만 버킷에서 차감합니다.
+
+Spring Boot와 비교:
+- Bucket4j (로컬 ConcurrentHashMap / Redis ProxyManager)
+- AuthenticationFailureHandler에서 실패 횟수 차감
+
+버킷:
+- 계정 + IP: LOGIN_RATE_LIMIT (예: "5/60" = 60초에 5회 실패 허용, 점진적으로 회복)
+- IP 단독: LOGIN_RATE_LIMIT_IP (여러 계정을 번갈아 시도하는 경우, 기본 사용 안 함)
+
+IP는 request.remote_addr입니다. 리버스 프록시 뒤에서는 PROXY_FIX_X_FOR로
+X-Forwarded-For의 클라이언트 IP를 사용해야 합니다 (app.configure_proxy 참고).
+
+LOGIN_RATE_LIMIT_REDIS_URL을 설정하면 버킷을 Redis에 저장해 모든 워커가 공유합니다.
+존재하지 않는 계정은 LOGIN_NEGATIVE_CACHE_TTL초 동안 DB 조회 없이 실패 처리합니다.
+이 캐시도 Redis를 사용하면 Redis에 저장하므로, 계정 생성 시 forget_unknown()이
+모든 워커에 반영됩니다 (Redis가 없으면 기본 TTL은 0 = 사용 안 함, config.py 참고).
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from werkzeug.exceptions import TooManyRequests
+
+from doctruck_backend.commons.metrics import Counters
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_KEYS = 100000
+REDIS_KEY_PREFIX = "doctruck:login:"
+REDIS_UNKNOWN_PREFIX = REDIS_KEY_PREFIX + "unknown:"
+
+# KEYS[1]: 버킷 키, ARGV: 용량, 초당 회복량, 현재 시각, 차감량
+# 반환: 차감 후 남은 토큰 수
+_REDIS_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local cost = tonumber(ARGV[4])
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1]) or capacity
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+if cost > 0 then
+    tokens = math.max(0, tokens - cost)
+    redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+    redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate))
+end
+return tostring(tokens)
+"""
+
+
+def parse_rate(value):
+    """ "횟수/초" -> (용량, 초당 회복량), 빈 값이면 None"""
+    if not value:
+        return None
+    count, _, seconds = value.partition("/")
+    count, seconds = int(count), float(seconds or 60)
+    if count <= 0 or seconds <= 0:
+        raise ValueError(f"Invalid rate limit {value}")
+    return count, count / seconds
+
+
+class LoginRateLimiter:
+    """로그인 실패 제한 (확장 객체: extensions.login_limiter)"""
+
+    def __init__(self):
+        self.rate = None
+        self.ip_rate = None
+        self.negative_ttl = 0
+        self.max_keys = DEFAULT_MAX_KEYS
+        self._buckets = OrderedDict()  # key -> (tokens, 갱신 시각)
+        self._unknown = OrderedDict()  # 계정 -> 만료 시각
+        self._lock = threading.Lock()
+        self._redis = None
+        self._script = None
+        self.counters = Counters("allowed", "rejected", "failures", "negative_hits")
+
+    def init_app(self, app):
+        self.rate = parse_rate(app.config.get("LOGIN_RATE_LIMIT"))
+        self.ip_rate = parse_rate(app.config.get("LOGIN_RATE_LIMIT_IP"))
+        self.negative_ttl = app.config.get("LOGIN_NEGATIVE_CACHE_TTL", 0)
+        self.max_keys = app.config.get("LOGIN_RATE_LIMIT_MAX_KEYS", DEFAULT_MAX_KEYS)
+        self.reset()
+
+        self._redis = None
+        redis_url = app.config.get("LOGIN_RATE_LIMIT_REDIS_URL")
+        if redis_url:
+            import redis
+
+            self._redis = redis.Redis.from_url(redis_url)
+            self._script = self._redis.register_script(_REDIS_BUCKET_SCRIPT)
+
+    def check(self, account, ip):
+        """제한 초과 시 TooManyRequests (429, Retry-After) 발생 - 해싱 전에 호출
+
+        Args:
+            account: 계정 식별자 (예: username, "admin:{email}")
+            ip: 요청 IP
+        """
+        retry_after = 0
+        for key, rate in self._limits(account, ip):
+            tokens = self._take(key, rate, 0)
+            if tokens < 1:
+                retry_after = max(retry_after, (1 - tokens) / rate[1])
+        if retry_after:
+            self.counters.incr("rejected")
+            logger.warning(f"Login rate limited: account={account} ip={ip}")
+            raise TooManyRequests(
+                "Too many failed login attempts, try again later",
+                retry_after=max(int(retry_after + 0.999), 1),
+            )
+        self.counters.incr("allowed")
+
+    def failed(self, account, ip):
+        """로그인 실패 기록 (버킷에서 1 차감)"""
+        self.counters.incr("failures")
+        for key, rate in self._limits(account, ip):
+            self._take(key, rate, 1)
+
+    def is_unknown(self, account):
+        """최근 존재하지 않는 것으로 확인된 계정인지"""
+        if self.negative_ttl <= 0:
+            return False
+        if self._redis is not None:
+            try:
+                unknown = bool(self._redis.exists(REDIS_UNKNOWN_PREFIX + account))
+            except Exception:
+                # Redis 장애 시 DB 조회 (캐시 없이 처리)
+                logger.warning("Login negative cache: Redis failed", exc_info=True)
+                return False
+            if unknown:
+                self.counters.incr("negative_hits")
+            return unknown
+        with self._lock:
+            expires_at = self._unknown.get(account)
+            if expires_at is None:
+                return False
+            if expires_at <= time.time():
+                del self._unknown[account]
+                return False
+        self.counters.incr("negative_hits")
+        return True
+
+    def remember_unknown(self, account):
+        if self.negative_ttl <= 0:
+            return
+        if self._redis is not None:
+            try:
+                self._redis.set(
+                    REDIS_UNKNOWN_PREFIX + account,
+                    b"1",
+                    ex=max(int(self.negative_ttl), 1),
+                )
+            except Exception:
+                logger.warning("Login negative cache: Redis failed", exc_info=True)
+            return
+        with self._lock:
+            self._unknown[account] = time.time() + self.negative_ttl
+            self._unknown.move_to_end(account)
+            while len(self._unknown) > self.max_keys:
+                self._unknown.popitem(last=False)
+
+    def forget_unknown(self, account):
+        """계정 생성 시 호출 (존재하지 않는 계정 캐시에서 제거)"""
+        with self._lock:
+            self._unknown.pop(account, None)
+        if self._redis is not None:
+            try:
+                self._redis.delete(REDIS_UNKNOWN_PREFIX + account)
+            except Exception:
+                logger.warning("Login negative cache: Redis failed", exc_info=True)
+
+    def reset(self):
+        with self._lock:
+            self._buckets.clear()
+            self._unknown.clear()
+        self.counters.reset()
+
+    def stats(self):
+        stats = self.counters.snapshot()
+        stats["backend"] = "redis" if self._redis is not None else "local"
+        return stats
+
+    def _limits(self, account, ip):
+        limits = []
+        if self.rate:
+            limits.append((f"account:{account}|{ip}", self.rate))
+        if self.ip_rate:
+            limits.append((f"ip:{ip}", self.ip_rate))
+        return limits
+
+    def _take(self, key, rate, cost):
+        """버킷을 회복시킨 뒤 cost만큼 차감하고 남은 토큰 수 반환"""
+        if self._redis is not None:
+            try:
+                return float(
+                    self._script(
+                        keys=[REDIS_KEY_PREFIX + key],
+                        args=[rate[0], rate[1], time.time(), cost],
+                    )
+                )
+            except Exception:
+                # Redis 장애 시 로컬 버킷으로 대체
+                logger.warning("Login rate limit: Redis failed", exc_info=True)
+
+        capacity, refill = rate
+        now = time.time()
+        with self._lock:
+            tokens, updated_at = self._buckets.get(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - updated_at) * refill)
+            if cost:
+                tokens = max(0, tokens - cost)
+                if tokens >= capacity:
+                    self._buckets.pop(key, None)
+                else:
+                    self._buckets[key] = (tokens, now)
+                    self._buckets.move_to_end(key)
+                    while len(self._buckets) > self.max_keys:
+                        self._buckets.popitem(last=False)
+        return tokens
@@ -0,0 +1,191 @@
+"""지역(시/도, 시/군/구) 정규화 및 지역 색인
+
+주소/출처 문자열을 지역 코드로 정규화해 region_index 테이블에 저장하고,
+추천/목록 API에서 문자열 부분 일치 대신 지역 코드 동등 비교로 검색합니다.
+
+지역 코드 형식:
+- 시/도: 행정구역 코드 2자리 (예: "11" = 서울특별시)
+- 시/군/구: "{시/도 코드}:{시/군/구}" (예: "11:영등포구")
+- 시/도를 알 수 없는 시/군/구: "*:{시/군/구}" (모든 시/군/구에 함께 저장)
+
+예: "서울시 영등포구 여의동로 330" -> ["11", "11:영등포구", "*:영등포구"]
+"""
+
+import re
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from doctruck_backend.extensions import db
+from doctruck_backend.models import Location, Document, RegionIndex
+
+# 시/도 코드 -> 별칭 ("광주시"는 경기도 광주시와 겹치므로 제외)
+SIDO_ALIASES = {
+    "11": ("서울", "서울시", "서울특별시"),
+    "26": ("부산", "부산시", "부산광역시"),
+    "27": ("대구", "대구시", "대구광역시"),
+    "28": ("인천", "인천시", "인천광역시"),
+    "29": ("광주", "광주광역시"),
+    "30": ("대전", "대전시", "대전광역시"),
+    "31": ("울산", "울산시", "울산광역시"),
+    "36": ("세종", "세종시", "세종특별자치시"),
+    "41": ("경기", "경기도"),
+    "43": ("충북", "충청북도"),
+    "44": ("충남", "충청남도"),
+    "46": ("전남", "전라남도"),
+    "47": ("경북", "경상북도"),
+    "48": ("경남", "경상남도"),
+    "50": ("제주", "제주도", "제주특별자치도"),
+    "51": ("강원", "강원도", "강원특별자치도"),
+    "52": ("전북", "전라북도", "전북특별자치도"),
+}
+
+SIDO_BY_ALIAS = {
+    alias: code for code, aliases in SIDO_ALIASES.items() for alias in aliases
+}
+
+ENTITY_LOCATION = "location"
+ENTITY_DOCUMENT = "document"
+
+_TOKEN_SPLIT = re.compile(r"[\s,/()·]+")
+_SIGUNGU_SUFFIXES = ("시", "군", "구")
+# 시/군/구는 주소 앞부분에만 나오므로 앞쪽 토큰만 확인 (도로명 등 오탐 방지)
+_MAX_REGION_TOKENS = 3
+
+
+def _normalize_token(token):
+    """관공서 접미사 제거 (예: '서울시청' -> '서울시', '영등포구청' -> '영등포구')"""
+    if token.endswith("청") and token[:-1].endswith(_SIGUNGU_SUFFIXES + ("도",)):
+        return token[:-1]
+    return token
+
+
+def parse_region_codes(text):
+    """주소/출처 문자열에서 지역 코드 목록 추출
+
+    Returns:
+        list: 지역 코드 목록 (중복 없음, 상위 지역부터)
+    """
+    if not text:
+        return []
+
+    codes = []
+    sido = None
+    tokens = [t for t in _TOKEN_SPLIT.split(text.strip()) if t]
+    for token in tokens[:_MAX_REGION_TOKENS]:
+        token = _normalize_token(token)
+        if token in SIDO_BY_ALIAS:
+            if sido is None:
+                sido = SIDO_BY_ALIAS[token]
+                codes.append(sido)
+            continue
+        if len(token) >= 2 and token.endswith(_SIGUNGU_SUFFIXES):
+            if sido is not None:
+                codes.append(f"{sido}:{token}")
+            codes.append(f"*:{token}")
+
+    return list(dict.fromkeys(codes))
+
+
+def region_code(text):
+    """활동 지역 문자열의 가장 구체적인 지역 코드 (알 수 없으면 None)
+
+    예: "서울" -> "11", "서울 영등포구" -> "11:영등포구", "영등포구" -> "*:영등포구"
+    """
+    codes = parse_region_codes(text)
+    for code in reversed(codes):
+        if ":" in code and not code.startswith("*:"):
+            return code
+    if codes and not codes[0].startswith("*:"):
+        return codes[0]
+    return codes[-1] if codes else None
+
+
+def indexed_entity_ids(entity_type, code):
+    """지역 코드에 해당하는 엔티티 ID 서브쿼리"""
+    return db.select(RegionIndex.entity_id).where(
+        RegionIndex.entity_type == entity_type,
+        RegionIndex.region_code == code,
+    )
+
+
+def _indexed_text(obj):
+    """색인 대상 (entity_type, entity_id, text, 변경 여부 속성명)"""
+    if isinstance(obj, Location):
+        return ENTITY_LOCATION, obj.location_id, obj.address, "address"
+    if isinstance(obj, Document):
+        return ENTITY_DOCUMENT, obj.doc_id, obj.source, "source"
+    return None
+
+
+def _insert_rows(connection, entity_type, entity_id, text):
+    codes = parse_region_codes(text)
+    if codes:
+        connection.execute(
+            RegionIndex.__table__.insert(),
+            [
+                {"entity_type": entity_type, "entity_id": entity_id, "region_code": c}
+                for c in codes
+            ],
+        )
+
+
+def _replace_rows(connection, entity_type, entity_id, text):
+    table = RegionIndex.__table__
+    connection.execute(
+        table.delete().where(
+            table.c.entity_type == entity_type, table.c.entity_id == entity_id
+        )
+    )
+    _insert_rows(connection, entity_type, entity_id, text)
+
+
+def _after_flush(session, flush_context):
+    """Location 주소 / Document 출처 변경 시 지역 색인 갱신 (같은 트랜잭션)"""
+    changes = []
+    for obj in session.new:
+        target = _indexed_text(obj)
+        if target:
+            changes.append(target[:3])
+    for obj in session.dirty:
+        target = _indexed_text(obj)
+        if target and inspect(obj).attrs[target[3]].history.has_changes():
+            changes.append(target[:3])
+    for obj in session.deleted:
+        target = _indexed_text(obj)
+        if target:
+            changes.append((target[0], target[1], None))
+
+    if not changes:
+        return
+
+    connection = session.connection()
+    for entity_type, entity_id, text in changes:
+        _replace_rows(connection, entity_type, entity_id, text)
+
+
+def register_region_index_listeners():
+    """세션 이벤트 리스너 등록 (애플리케이션 팩토리에서 한 번 호출)"""
+    if not event.contains(Session, "after_flush", _after_flush):
+        event.listen(Session, "after_flush", _after_flush)
+
+
+def rebuild_region_index():
+    """전체 지역 색인 재생성 (기존 데이터 backfill)
+
+    Returns:
+        tuple: (색인된 위치 수, 색인된 문서 수)
+    """
+    connection = db.session.connection()
+    connection.execute(RegionIndex.__table__.delete())
+
+    locations = db.session.query(Location.location_id, Location.address).all()
+    for location_id, address in locations:
+        _insert_rows(connection, ENTITY_LOCATION, location_id, address)
+
+    documents = db.session.query(Document.doc_id, Document.source).all()
+    for doc_id, source in documents:
+        _insert_rows(connection, ENTITY_DOCUMENT, doc_id, source)
+
+    db.session.commit()
+    return len(locations), len(documents)
@@ -0,0 +1,248 @@
+"""공개 목록 응답 캐시
+
+/api/v1/locations?location_type=FESTIVAL&page=1 처럼 같은 조회가 트래픽 대부분을 차지하므로,
+(엔드포인트, 정규화된 파라미터)별로 직렬화된 응답 데이터를 캐시해 목록/개수 쿼리와
+직렬화를 생략합니다.
+
+Spring Boot와 비교:
+- @Cacheable(value = "locations", key = "#request") + Caffeine(로컬) / Redis(공유) 2단계 캐시
+- @CacheEvict(allEntries = true) = 태그(테이블) 단위 무효화
+
+조회 순서:
+1. 프로세스 내부 LRU (TTL = RESPONSE_CACHE_TTL)
+2. Redis (RESPONSE_CACHE_REDIS_URL 설정 시, 모든 워커가 공유)
+3. 뷰 실행 (200 응답을 1, 2에 저장)
+
+무효화:
+- 캐시 키에 응답이 의존하는 테이블의 버전(commons/table_versions.py)을 포함합니다.
+  버전은 DB에 있으므로 어느 워커에서 쓰기가 커밋되든 다음 요청은 새 키로 조회합니다
+  (Redis 없이 여러 워커를 실행해도 이전 응답을 새 ETag로 반환하지 않음)
+- 각 항목은 응답이 의존하는 테이블 이름(태그)과 함께 저장됩니다
+- 추적 테이블(commons/table_versions.py) 변경이 커밋되면 해당 태그의 항목을 삭제합니다
+  (관리자 위치 등록/수정/삭제, 공문서 검증 등 모든 쓰기 경로,
+  app.py에서 on_tables_committed(response_cache.invalidate)로 연결)
+- Redis를 사용하면 태그별 키 목록(set)의 키를 삭제하고 pub/sub 채널로 태그를 전파합니다.
+  다른 워커는 다음 조회 때 수신 대기 중인 메시지를 읽어(블로킹 없음) 로컬 항목을 제거합니다
+  (태그 무효화는 이전 버전 항목의 메모리를 바로 반환하기 위한 것이며, 정확성은 버전 키로 보장)
+- 조회 중 무효화되면 결과는 저장하지 않습니다
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from doctruck_backend.commons.metrics import Counters
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAXSIZE = 1024
+DEFAULT_TTL = 60  # 초
+
+REDIS_KEY_PREFIX = "doctruck:response:"
+REDIS_TAG_PREFIX = "doctruck:response-tag:"
+REDIS_CHANNEL = "doctruck:response:invalidated"
+
+
+def cache_key(endpoint, args, view_args=None, versions=None):
+    """(엔드포인트, 파라미터, 테이블 버전) -> 캐시 키 (파라미터 순서와 무관)
+
+    빈 값도 의미가 있으므로(cursor= 등) 그대로 포함합니다.
+
+    Args:
+        versions: 응답이 의존하는 테이블 이름 -> 버전 (get_table_versions() 결과)
+    """
+    return (
+        endpoint,
+        tuple(sorted(args.items(multi=True))),
+        tuple(sorted((view_args or {}).items())),
+        tuple(sorted((versions or {}).items())),
+    )
+
+
+class ResponseCache:
+    """캐시 키 -> 응답 데이터 캐시 (확장 객체: extensions.response_cache)"""
+
+    def __init__(self):
+        self.maxsize = DEFAULT_MAXSIZE
+        self.ttl = DEFAULT_TTL
+        self._entries = OrderedDict()  # key -> (data, tags, 만료 시각(epoch))
+        self._generations = {}  # tag -> 무효화 횟수
+        self._lock = threading.Lock()
+        self._redis = None
+        self._pubsub = None
+        self._pubsub_pid = None
+        self.counters = Counters(
+            "hits", "redis_hits", "misses", "stores", "invalidations"
+        )
+
+    def init_app(self, app):
+        self.maxsize = app.config.get("RESPONSE_CACHE_SIZE", DEFAULT_MAXSIZE)
+        self.ttl = app.config.get("RESPONSE_CACHE_TTL", DEFAULT_TTL)
+        self.clear()
+
+        self._redis = None
+        self._pubsub = None
+        redis_url = app.config.get("RESPONSE_CACHE_REDIS_URL")
+        if redis_url:
+            import redis
+
+            self._redis = redis.Redis.from_url(redis_url)
+
+    @property
+    def enabled(self):
+        return self.maxsize > 0
+
+    def generation(self, tags):
+        """태그별 무효화 횟수 (조회 전에 받아 set()에 전달)"""
+        with self._lock:
+            return tuple(self._generations.get(tag, 0) for tag in tags)
+
+    def get(self, key):
+        """캐시된 응답 데이터 (없으면 None)"""
+        if not self.enabled:
+            return None
+        self._drain_invalidations()
+
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] > now:
+                self._entries.move_to_end(key)
+                self.counters.incr("hits")
+                return entry[0]
+            if entry is not None:
+                del self._entries[key]
+
+        cached = self._redis_get(key)
+        if cached is not None:
+            data, tags = cached
+            self.counters.incr("redis_hits")
+            self._store(key, data, tags, now + self.ttl)
+            return data
+
+        self.counters.incr("misses")
+        return None
+
+    def set(self, key, tags, data, generation):
+        """뷰 실행 결과 저장
+
+        Args:
+            key: cache_key() 결과
+            tags: 응답이 의존하는 테이블 이름
+            data: 응답 데이터 (JSON 직렬화 가능한 값)
+            generation: 조회 전에 받은 generation(tags) - 그 사이 무효화되면 저장하지 않음
+        """
+        if not self.enabled or generation != self.generation(tags):
+            return
+        self.counters.incr("stores")
+        self._store(key, data, tuple(tags), time.time() + self.ttl)
+        self._redis_set(key, tags, data)
+
+    def invalidate(self, tags):
+        """태그에 해당하는 항목 삭제 (로컬 + Redis 삭제/전파)"""
+        self.counters.incr("invalidations")
+        self._evict_local(tags)
+        if self._redis is None:
+            return
+        try:
+            for tag in tags:
+                tag_key = REDIS_TAG_PREFIX + tag
+                keys = self._redis.smembers(tag_key)
+                self._redis.delete(tag_key, *keys)
+                self._redis.publish(REDIS_CHANNEL, tag)
+        except Exception:
+            logger.warning("Response cache: Redis invalidate failed", exc_info=True)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+        self.counters.reset()
+
+    def stats(self):
+        stats = self.counters.snapshot()
+        lookups = stats["hits"] + stats["redis_hits"] + stats["misses"]
+        stats["size"] = len(self._entries)
+        stats["hit_ratio"] = (
+            round((stats["hits"] + stats["redis_hits"]) / lookups, 4)
+            if lookups
+            else None
+        )
+        return stats
+
+    def _store(self, key, data, tags, expires_at):
+        with self._lock:
+            self._entries[key] = (data, tags, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def _evict_local(self, tags):
+        tags = set(tags)
+        with self._lock:
+            for tag in tags:
+                self._generations[tag] = self._generations.get(tag, 0) + 1
+            stale = [
+                key for key, entry in self._entries.items() if tags & set(entry[1])
+            ]
+            for key in stale:
+                del self._entries[key]
+
+    @staticmethod
+    def _redis_key(key):
+        digest = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+        return REDIS_KEY_PREFIX + digest
+
+    def _redis_get(self, key):
+        if self._redis is None:
+            return None
+        try:
+            value = self._redis.get(self._redis_key(key))
+        except Exception:
+            logger.warning("Response cache: Redis get failed", exc_info=True)
+            return None
+        if value is None:
+            return None
+        payload = json.loads(value)
+        return payload["data"], tuple(payload["tags"])
+
+    def _redis_set(self, key, tags, data):
+        if self._redis is None:
+            return
+        redis_key = self._redis_key(key)
+        try:
+            payload = json.dumps({"tags": list(tags), "data": data})
+            pipeline = self._redis.pipeline(transaction=False)
+            pipeline.set(redis_key, payload, ex=max(int(self.ttl), 1))
+            for tag in tags:
+                pipeline.sadd(REDIS_TAG_PREFIX + tag, redis_key)
+                pipeline.expire(REDIS_TAG_PREFIX + tag, max(int(self.ttl), 1))
+            pipeline.execute()
+        except Exception:
+            logger.warning("Response cache: Redis set failed", exc_info=True)
+
+    def _drain_invalidations(self):
+        """다른 워커가 전파한 태그를 읽어 로컬 항목 제거 (블로킹 없음)"""
+        if self._redis is None:
+            return
+        try:
+            # 구독 연결은 워커 프로세스마다 따로 생성 (fork 이전 연결 공유 방지)
+            if self._pubsub is None or self._pubsub_pid != os.getpid():
+                self._pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+                self._pubsub.subscribe(REDIS_CHANNEL)
+                self._pubsub_pid = os.getpid()
+            tags = set()
+            while True:
+                message = self._pubsub.get_message(timeout=0)
+                if message is None:
+                    break
+                tag = message["data"]
+                tags.add(tag.decode() if isinstance(tag, bytes) else tag)
+            if tags:
+                self._evict_local(tags)
+        except Exception:
+            self._pubsub = None
+            logger.warning("Response cache: Redis pub/sub read failed", exc_info=True)
@@ -0,0 +1,261 @@
+"""위치 추천 점수 계산 엔진
+
+Spring Boot와 비교:
+- RecommendationService의 점수 계산 로직을 별도 컴포넌트로 분리한 것과 유사
+
+위치별 신청자 수를 위치마다 COUNT 쿼리로 조회하지 않고,
+GROUP BY 집계 한 번으로 모든 후보 위치의 신청자 수를 함께 가져옵니다.
+후보는 필요한 컬럼만 조회하고, 상위 N개에 선택된 위치만 Location 객체로 로드합니다.
+트럭 거점 좌표가 있으면 캐시된 위치 좌표 배열로 모든 후보의 거리를 한 번에 계산합니다.
+"""
+
+import heapq
+import math
+from datetime import datetime
+
+import numpy as np
+from sqlalchemy import false, func, or_
+
+from doctruck_backend.commons.geo import load_location_coordinates
+from doctruck_backend.commons.regions import (
+    ENTITY_LOCATION,
+    indexed_entity_ids,
+    region_code,
+)
+from doctruck_backend.extensions import db
+from doctruck_backend.models import Location, LocationType, FoodTruckLocation
+
+# 음식 카테고리별 선호 위치 유형 (예: 디저트 -> FESTIVAL, 한식 -> PARK)
+CATEGORY_LOCATION_MAP = {
+    "디저트": "FESTIVAL",
+    "한식": "PARK",
+    "분식": "MARKET",
+}
+
+# 거점과의 거리별 점수 (km 이하, 점수) - 가까운 구간부터
+DISTANCE_SCORE_BANDS = ((5, 20), (15, 10), (30, 5))
+
+
+def applicant_counts_subquery():
+    """위치별 신청자 수 집계 서브쿼리 (location_id, applicant_count)"""
+    return (
+        db.session.query(
+            FoodTruckLocation.location_id.label("location_id"),
+            func.count(FoodTruckLocation.application_id).label("applicant_count"),
+        )
+        .group_by(FoodTruckLocation.location_id)
+        .subquery()
+    )
+
+
+def _region_match(truck):
+    """활동 지역이 위치 주소와 일치하는지 여부 (SQL 표현식)
+
+    지역 코드로 정규화되는 활동 지역은 region_index 동등 비교로,
+    정규화되지 않는 활동 지역은 주소 부분 일치로 판단합니다.
+    """
+    if not truck.operating_region:
+        return false()
+    code = region_code(truck.operating_region)
+    if code:
+        return Location.location_id.in_(indexed_entity_ids(ENTITY_LOCATION, code))
+    return Location.address.contains(truck.operating_region.strip(), autoescape=True)
+
+
+def _category_match(truck):
+    """음식 카테고리에 적합한 위치 유형인지 여부 (SQL 표현식)"""
+    preferred_type = CATEGORY_LOCATION_MAP.get(truck.food_category)
+    if not preferred_type:
+        return false()
+    return Location.location_type == LocationType[preferred_type]
+
+
+def candidate_query(trucks, exclude_location_ids=(), today=None):
+    """추천 후보 위치 조회 쿼리
+
+    종료일/관심 등록 제외 필터와 트럭별 지역/카테고리 일치 여부를 SQL에서 처리하고,
+    점수 계산에 필요한 컬럼만 조회합니다 (Location 객체는 로드하지 않음).
+
+    Row 컬럼: location_id, start_datetime, applicant_count,
+    region_{i}, category_{i} (i = trucks 인덱스)
+    """
+    today = today or datetime.now()
+    counts = applicant_counts_subquery()
+
+    columns = [
+        Location.location_id,
+        Location.start_datetime,
+        func.coalesce(counts.c.applicant_count, 0).label("applicant_count"),
+    ]
+    for index, truck in enumerate(trucks):
+        columns.append(_region_match(truck).label(f"region_{index}"))
+        columns.append(_category_match(truck).label(f"category_{index}"))
+
+    # 추천 가능한 위치 (운영 종료일이 지나지 않은 위치) + 신청자 수
+    query = (
+        db.session.query(*columns)
+        .outerjoin(counts, counts.c.location_id == Location.location_id)
+        .filter(
+            or_(
+                Location.end_datetime.is_(None),  # 종료일 없음 = 상시 운영
+                Location.end_datetime >= today,  # 아직 종료 안 됨
+            )
+        )
+    )
+
+    # 이미 관심 등록한 위치는 제외
+    if exclude_location_ids:
+        query = query.filter(Location.location_id.notin_(exclude_location_ids))
+
+    # 정렬하지 않음 (ORDER BY location_id가 있으면 종료일 인덱스 대신 전체 스캔을 선택하므로
+    # 동점 처리는 top_candidates()에서 location_id로 함)
+    return query
+
+
+def has_home(truck):
+    return truck.home_latitude is not None and truck.home_longitude is not None
+
+
+def candidate_distances(trucks, location_ids, today=None):
+    """트럭 거점에서 후보 위치까지의 거리 행렬 (NumPy 배열 연산)
+
+    Returns:
+        np.ndarray | None: (트럭 수, 후보 수) 거리 행렬 (km, 알 수 없으면 NaN).
+            거점 좌표가 있는 트럭이 없으면 None
+    """
+    if not location_ids or not any(has_home(truck) for truck in trucks):
+        return None
+
+    coordinates = load_location_coordinates(today)
+    distances = np.full((len(trucks), len(location_ids)), np.nan)
+    for index, truck in enumerate(trucks):
+        if has_home(truck):
+            distances[index] = coordinates.distances_km(
+                float(truck.home_latitude), float(truck.home_longitude), location_ids
+            )
+    return distances
+
+
+def score_candidate(row, trucks, today, distances=None):
+    """후보 위치 하나의 추천 점수와 추천 이유 계산
+
+    Args:
+        row: candidate_query()의 결과 Row
+        trucks: 점수 계산 기준이 되는 FoodTruck 목록
+        today: 기준 일시
+        distances: 트럭별 거점에서 이 위치까지의 거리 (km, 없으면 None/NaN)
+
+    Returns:
+        tuple: (score, reasons)
+    """
+    score = 0
+    reasons = []
+
+    for index, truck in enumerate(trucks):
+        # 1. 지역 매칭 (30점)
+        if getattr(row, f"region_{index}"):
+            score += 30
+            reasons.append(f"활동 지역({truck.operating_region}) 일치")
+
+        # 2. 카테고리 매칭 (20점)
+        if getattr(row, f"category_{index}"):
+            score += 20
+            reasons.append(f"{truck.food_category} 카테고리에 적합한 위치")
+
+        # 3. 거점과의 거리 (최대 20점)
+        distance = distances[index] if distances is not None else None
+        if distance is not None and not math.isnan(distance):
+            for max_km, points in DISTANCE_SCORE_BANDS:
+                if distance <= max_km:
+                    score += points
+                    reasons.append(f"거점에서 {distance:.1f}km")
+                    break
+
+    # 4. 운영 기간 임박 (10점)
+    if row.start_datetime:
+        days_until_start = (row.start_datetime.date() - today.date()).days
+        if 0 <= days_until_start <= 30:
+            score += 10
+            reasons.append(f"{days_until_start}일 후 시작")
+
+    # 5. 신청자 수 (경쟁도)
+    applicant_count = row.applicant_count
+    if applicant_count < 10:  # 임의의 제한 (10명)
+        score += 10
+        reasons.append(f"신청자 {applicant_count}명")
+    elif applicant_count < 20:
+        score += 5
+        reasons.append(f"신청자 {applicant_count}명 (경쟁 중간)")
+
+    # 6. 기본 점수 (모든 위치에 5점 - 최소 추천)
+    score += 5
+    if not reasons:
+        reasons.append("새로운 사업 기회")
+
+    return score, reasons
+
+
+def _rank_key(candidate):
+    score, location_id, _ = candidate
+    return score, -location_id
+
+
+def top_candidates(trucks, exclude_location_ids=(), limit=10, today=None):
+    """상위 N개 추천 후보 계산
+
+    후보 Row를 순회하며 크기 limit의 힙으로 상위 N개만 유지합니다.
+
+    Args:
+        trucks: 점수 계산 기준이 되는 FoodTruck 목록
+        exclude_location_ids: 추천에서 제외할 위치 ID (이미 관심 등록한 위치)
+        limit: 추천 개수
+        today: 기준 일시 (기본값: 현재 시각)
+
+    Returns:
+        list: (score, location_id, reasons) 튜플 목록 (점수 내림차순)
+    """
+    today = today or datetime.now()
+    rows = candidate_query(trucks, exclude_location_ids, today).all()
+    distances = candidate_distances(trucks, [row.location_id for row in rows], today)
+
+    def scored_rows():
+        for position, row in enumerate(rows):
+            score, reasons = score_candidate(
+                row,
+                trucks,
+                today,
+                distances[:, position] if distances is not None else None,
+            )
+            yield score, row.location_id, reasons
+
+    # 점수 내림차순, 동점이면 먼저 등록된 위치(작은 location_id) 우선
+    return heapq.nlargest(limit, scored_rows(), key=_rank_key)
+
+
+def recommend_locations(trucks, exclude_location_ids=(), limit=10, today=None):
+    """상위 N개 추천 위치 계산
+
+    top_candidates()로 순위를 계산한 뒤 선택된 위치만 Location 객체로 조회합니다.
+
+    Returns:
+        list: {"location", "score", "reason"} 딕셔너리 목록 (점수 내림차순)
+    """
+    top = top_candidates(trucks, exclude_location_ids, limit, today)
+    if not top:
+        return []
+
+    # 선택된 위치만 Location 객체로 로드
+    location_ids = [location_id for _, location_id, _ in top]
+    locations = {
+        location.location_id: location
+        for location in Location.query.filter(Location.location_id.in_(location_ids))
+    }
+
+    return [
+        {
+            "location": locations[location_id],
+            "score": score,
+            "reason": ", ".join(reasons),
+        }
+        for score, location_id, reasons in top
+    ]
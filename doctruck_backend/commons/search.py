@@ -0,0 +1,193 @@
+"""전문 검색 (Full-Text Search) 색인
+
+LocationList / DocumentList의 search 파라미터는 '%검색어%' ILIKE로 검색하면
+항상 전체 테이블을 스캔하므로, DB별 n-gram 색인을 사용합니다.
+
+- SQLite: FTS5 가상 테이블 (trigram 토크나이저) + 트리거로 원본 테이블과 동기화
+- PostgreSQL: pg_trgm GIN 인덱스 (ILIKE가 인덱스를 사용하고 similarity()로 정렬)
+
+한국어는 띄어쓰기 단위 토큰화로는 '공원'으로 '한강공원'을 찾을 수 없으므로
+3글자 n-gram(trigram)으로 색인합니다. trigram 색인은 3글자 미만 검색어를
+처리할 수 없으므로 이 경우에는 기존 ILIKE 검색으로 대체합니다.
+"""
+
+import sqlite3
+
+from sqlalchemy import column, event, func, inspect, literal_column, or_, select, table
+
+from doctruck_backend.extensions import db
+from doctruck_backend.models import Location, Document
+
+# trigram 색인으로 검색 가능한 최소 검색어 길이
+MIN_NGRAM_LENGTH = 3
+
+# 검색 대상 테이블 -> (PK 컬럼, 검색 컬럼)
+SEARCH_INDEXES = {
+    Location.__tablename__: ("location_id", ("location_name", "address")),
+    Document.__tablename__: ("doc_id", ("title", "ai_summary")),
+}
+
+
+# 존재가 확인된 FTS5 테이블 (엔진 URL, 테이블 이름)
+_existing_fts_tables = set()
+
+
+def _fts_table(table_name):
+    return f"{table_name}_fts"
+
+
+def _fts_table_exists(engine, table_name):
+    """FTS5 테이블 존재 여부
+
+    SQLite 3.34 미만에서 마이그레이션한 DB에는 FTS5 테이블이 없으므로, 실행 중인
+    SQLite 버전이 아니라 실제 테이블 존재 여부로 판단합니다.
+    (있음은 캐시하고, 없음은 이후 마이그레이션될 수 있으므로 매번 확인)
+    """
+    key = (str(engine.url), _fts_table(table_name))
+    if key in _existing_fts_tables:
+        return True
+    if not inspect(engine).has_table(key[1]):
+        return False
+    _existing_fts_tables.add(key)
+    return True
+
+
+def fts5_trigram_supported(dialect_name):
+    # trigram 토크나이저는 SQLite 3.34.0부터 지원
+    return dialect_name == "sqlite" and sqlite3.sqlite_version_info >= (3, 34, 0)
+
+
+def sqlite_ddl(table_name):
+    """SQLite FTS5 가상 테이블 + 동기화 트리거 생성 DDL 목록"""
+    pk, columns = SEARCH_INDEXES[table_name]
+    fts = _fts_table(table_name)
+    names = ", ".join(columns)
+    new_values = ", ".join(f"new.{c}" for c in columns)
+    old_values = ", ".join(f"old.{c}" for c in columns)
+    insert_new = f"INSERT INTO {fts}(rowid, {names}) VALUES (new.{pk}, {new_values});"
+    delete_old = (
+        f"INSERT INTO {fts}({fts}, rowid, {names}) "
+        f"VALUES ('delete', old.{pk}, {old_values});"
+    )
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+        f"{names}, content='{table_name}', content_rowid='{pk}', tokenize='trigram')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table_name} "
+        f"BEGIN {insert_new} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table_name} "
+        f"BEGIN {delete_old} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE ON {table_name} "
+        f"BEGIN {delete_old} {insert_new} END",
+        # 기존 데이터 색인 (external content 테이블 재구성)
+        f"INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+    ]
+
+
+def sqlite_drop_ddl(table_name):
+    return [f"DROP TABLE IF EXISTS {_fts_table(table_name)}"]
+
+
+def postgresql_ddl(table_name):
+    """PostgreSQL pg_trgm GIN 인덱스 생성 DDL 목록"""
+    _, columns = SEARCH_INDEXES[table_name]
+    document = " || ' ' || ".join(f"coalesce({c}, '')" for c in columns)
+    return [
+        "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+        f"CREATE INDEX IF NOT EXISTS ix_{table_name}_search_trgm "
+        f"ON {table_name} USING gin (({document}) gin_trgm_ops)",
+    ]
+
+
+def postgresql_drop_ddl(table_name):
+    return [f"DROP INDEX IF EXISTS ix_{table_name}_search_trgm"]
+
+
+def _search_document(model):
+    """PostgreSQL 검색 대상 표현식 (GIN 인덱스 표현식과 동일해야 인덱스 사용)"""
+    _, columns = SEARCH_INDEXES[model.__tablename__]
+    expressions = [func.coalesce(getattr(model, c), "") for c in columns]
+    document = expressions[0]
+    for expression in expressions[1:]:
+        document = document.op("||")(" ").op("||")(expression)
+    return document
+
+
+def _fts_phrase(search):
+    """FTS5 MATCH 구문으로 이스케이프 (검색어 전체를 하나의 구문으로 검색)"""
+    return '"' + search.replace('"', '""') + '"'
+
+
+def apply_search(query, model, search, order_by_rank=False):
+    """검색어 필터 적용
+
+    Args:
+        query: 검색 대상 Query
+        model: Location 또는 Document
+        search: 검색어
+        order_by_rank: 관련도 순 정렬 여부 (기존 정렬보다 우선)
+
+    Returns:
+        Query: 검색 조건이 적용된 Query
+    """
+    table_name = model.__tablename__
+    pk, columns = SEARCH_INDEXES[table_name]
+    dialect_name = db.engine.dialect.name
+    term = search.strip()
+
+    if (
+        len(term) >= MIN_NGRAM_LENGTH
+        and fts5_trigram_supported(dialect_name)
+        and _fts_table_exists(db.engine, table_name)
+    ):
+        fts_name = _fts_table(table_name)
+        fts = table(fts_name, column("rowid"), column("rank"))
+        matched = (
+            select(fts.c.rowid, fts.c.rank)
+            .where(literal_column(fts_name).op("MATCH")(_fts_phrase(term)))
+            .subquery()
+        )
+        query = query.join(matched, matched.c.rowid == getattr(model, pk))
+        if order_by_rank:
+            # FTS5 rank = bm25() (값이 작을수록 관련도 높음)
+            query = query.order_by(matched.c.rank)
+        return query
+
+    if len(term) >= MIN_NGRAM_LENGTH and dialect_name == "postgresql":
+        document = _search_document(model)
+        query = query.filter(document.ilike(f"%{term}%"))
+        if order_by_rank:
+            query = query.order_by(func.similarity(document, term).desc())
+        return query
+
+    # trigram 색인을 쓸 수 없는 경우 (짧은 검색어 등): 기존 ILIKE 검색
+    return query.filter(or_(*(getattr(model, c).ilike(f"%{search}%") for c in columns)))
+
+
+def register_search_index_ddl():
+    """create_all/drop_all 시 검색 색인도 함께 생성/삭제되도록 DDL 등록"""
+    for model in (Location, Document):
+        target = model.__table__
+        if event.contains(target, "after_create", _after_create):
+            continue
+        event.listen(target, "after_create", _after_create)
+        event.listen(target, "before_drop", _before_drop)
+
+
+def _run_ddl(connection, statements):
+    for statement in statements:
+        connection.exec_driver_sql(statement)
+
+
+def _after_create(target, connection, **kw):
+    if fts5_trigram_supported(connection.dialect.name):
+        _run_ddl(connection, sqlite_ddl(target.name))
+    elif connection.dialect.name == "postgresql":
+        _run_ddl(connection, postgresql_ddl(target.name))
+
+
+def _before_drop(target, connection, **kw):
+    _existing_fts_tables.discard((str(connection.engine.url), _fts_table(target.name)))
+    if fts5_trigram_supported(connection.dialect.name):
+        _run_ddl(connection, sqlite_drop_ddl(target.name))
+    elif connection.dialect.name == "postgresql":
+        _run_ddl(connection, postgresql_drop_ddl(target.name))
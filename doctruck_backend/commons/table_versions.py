@@ -0,0 +1,145 @@
+"""테이블 데이터 버전 (table_versions) 관리
+
+목록 개수 캐시 등 조회 결과 캐시의 무효화 기준으로 사용합니다.
+
+Spring Boot와 비교:
+- @CacheEvict 대신, 캐시 키에 테이블 버전을 포함해 쓰기 후 이전 캐시를 자연스럽게 무효화
+- 버전은 DB에 저장하므로 여러 워커(gunicorn) 프로세스가 같은 버전을 봅니다
+
+동작 방식:
+1. 세션 flush에 추적 대상 테이블의 INSERT/UPDATE/DELETE가 포함되면
+   같은 트랜잭션에서 해당 테이블의 version을 새 uuid로 변경
+2. Query.update()/delete() 같은 일괄 쓰기도 실행 전에 version 변경
+3. 롤백되면 version 변경도 함께 롤백됨
+4. 커밋되면 on_tables_committed()로 등록한 함수에 변경된 테이블 이름을 전달
+   (응답 캐시처럼 버전을 조회하지 않는 캐시의 무효화용)
+"""
+
+import uuid
+from datetime import datetime
+from itertools import chain
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from doctruck_backend.extensions import db
+from doctruck_backend.models import Location, Document, TableVersion
+
+# 버전을 추적하는 테이블
+TRACKED_TABLES = frozenset([Location.__tablename__, Document.__tablename__])
+
+# 버전 행이 아직 없는 테이블의 버전
+INITIAL_VERSION = "0"
+
+# 현재 트랜잭션에서 변경된 테이블 (session.info 키)
+_CHANGED_KEY = "table_versions.changed"
+
+# 커밋 후 호출할 함수 (변경된 테이블 이름 set을 인자로 받음)
+_commit_callbacks = []
+
+
+def on_tables_committed(callback):
+    """추적 테이블 변경이 커밋된 후 호출할 함수 등록 (같은 함수는 한 번만)
+
+    Args:
+        callback: 변경된 테이블 이름 frozenset을 받는 함수
+    """
+    if callback not in _commit_callbacks:
+        _commit_callbacks.append(callback)
+
+
+def bump_table_versions(connection, table_names):
+    """테이블 버전을 새 값으로 변경 (행이 없으면 생성)"""
+    table = TableVersion.__table__
+    now = datetime.utcnow()
+    for table_name in sorted(table_names):
+        values = {"version": uuid.uuid4().hex, "updated_at": now}
+        result = connection.execute(
+            table.update().where(table.c.table_name == table_name).values(**values)
+        )
+        if result.rowcount == 0:
+            connection.execute(table.insert().values(table_name=table_name, **values))
+
+
+def get_table_versions(*table_names):
+    """테이블 버전 조회
+
+    Returns:
+        dict: 테이블 이름 -> 버전
+    """
+    return {
+        name: version
+        for name, (version, _) in get_table_version_info(*table_names).items()
+    }
+
+
+def get_table_version_info(*table_names):
+    """테이블 버전 + 마지막 변경 시각 조회
+
+    Returns:
+        dict: 테이블 이름 -> (버전, 변경 시각) - 버전 행이 없으면 (INITIAL_VERSION, None)
+    """
+    table = TableVersion.__table__
+    rows = db.session.execute(
+        db.select(table.c.table_name, table.c.version, table.c.updated_at).where(
+            table.c.table_name.in_(table_names)
+        )
+    )
+    info = dict.fromkeys(table_names, (INITIAL_VERSION, None))
+    info.update((name, (version, updated_at)) for name, version, updated_at in rows)
+    return info
+
+
+def _tables_of(objects):
+    tables = set()
+    for obj in objects:
+        mapper = inspect(obj, raiseerr=False)
+        if mapper is None:
+            continue
+        table_name = mapper.mapper.persist_selectable.name
+        if table_name in TRACKED_TABLES:
+            tables.add(table_name)
+    return tables
+
+
+def _after_flush(session, flush_context):
+    # dirty에는 실제 변경 없이 속성만 설정된 객체도 포함되므로 변경 여부 확인
+    modified = (obj for obj in session.dirty if session.is_modified(obj))
+    tables = _tables_of(chain(session.new, modified, session.deleted))
+    if tables:
+        bump_table_versions(session.connection(), tables)
+        session.info.setdefault(_CHANGED_KEY, set()).update(tables)
+
+
+def _do_orm_execute(orm_execute_state):
+    """Query.update()/delete() 등 ORM 일괄 쓰기"""
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    tables = {
+        mapper.persist_selectable.name for mapper in orm_execute_state.all_mappers
+    } & TRACKED_TABLES
+    if tables:
+        session = orm_execute_state.session
+        bump_table_versions(session.connection(), tables)
+        session.info.setdefault(_CHANGED_KEY, set()).update(tables)
+
+
+def _after_commit(session):
+    tables = session.info.pop(_CHANGED_KEY, None)
+    if not tables:
+        return
+    for callback in _commit_callbacks:
+        callback(frozenset(tables))
+
+
+def _after_rollback(session):
+    session.info.pop(_CHANGED_KEY, None)
+
+
+def register_table_version_listeners():
+    """세션 이벤트 리스너 등록 (애플리케이션 팩토리에서 한 번 호출)"""
+    if not event.contains(Session, "after_flush", _after_flush):
+        event.listen(Session, "after_flush", _after_flush)
+        event.listen(Session, "do_orm_execute", _do_orm_execute)
+        event.listen(Session, "after_commit", _after_commit)
+        event.listen(Session, "after_rollback", _after_rollback)
@@ -0,0 +1,258 @@
+"""푸드트럭별 추천 위치 사전 계산 (truck_recommendations 테이블)
+
+Spring Boot와 비교:
+- 배치(@Scheduled)로 갱신하는 집계 테이블 + 엔티티 리스너(@EntityListeners)로 무효화
+
+동작 방식:
+1. Celery 작업이 트럭별 상위 N개 추천 결과를 truck_recommendations에 저장
+2. FoodTruck / Location / FoodTruckLocation의 점수 관련 값이 바뀌면 같은 트랜잭션 안에서
+   영향받는 트럭의 추천 결과를 삭제 (조회 시 실시간 계산으로 대체됨)
+   - 위치 등록/삭제, 위치의 날짜/좌표/주소/유형 변경: 전체 트럭
+   - 관심 등록/삭제: 해당 트럭 + 그 위치를 추천 중인 트럭
+     (삭제로 신청자 수 구간이 올라가면 상위 N개에서 잘린 트럭도 포함)
+3. 커밋 후 RECOMMENDATION_REFRESH_ASYNC가 켜져 있으면 재계산 작업을 큐에 등록
+4. 날짜가 바뀌면 '운영 기간 임박' 점수가 달라지므로 당일 계산된 결과만 사용
+"""
+
+from datetime import datetime
+from itertools import chain
+
+from flask import current_app, has_app_context
+from sqlalchemy import event, func, inspect
+from sqlalchemy.orm import Session
+
+from doctruck_backend.commons.scoring import top_candidates
+from doctruck_backend.extensions import db
+from doctruck_backend.models import (
+    FoodTruck,
+    Location,
+    FoodTruckLocation,
+    TruckRecommendation,
+)
+
+DEFAULT_TOP_N = 50
+
+# 신청자 수 점수 구간 경계 (scoring.score_candidate 기준: <10, <20)
+_APPLICANT_THRESHOLDS = (10, 20)
+
+# 추천 점수/후보 필터가 읽는 컬럼 (이름/설명 등 표시용 컬럼 변경은 무효화하지 않음,
+# 조회 시 Location을 조인하므로 항상 최신 값으로 응답)
+_LOCATION_SCORING_COLUMNS = (
+    "start_datetime",
+    "end_datetime",
+    "latitude",
+    "longitude",
+    "geohash",
+    "address",
+    "location_type",
+)
+_TRUCK_SCORING_COLUMNS = (
+    "food_category",
+    "operating_region",
+    "home_latitude",
+    "home_longitude",
+)
+
+# session.info에 재계산 대상 트럭을 모아두는 키 (ALL_TRUCKS = 전체 트럭)
+_PENDING_KEY = "truck_recommendations_pending"
+ALL_TRUCKS = "all"
+
+
+def _top_n():
+    if has_app_context():
+        return current_app.config.get(
+            "RECOMMENDATION_MATERIALIZED_TOP_N", DEFAULT_TOP_N
+        )
+    return DEFAULT_TOP_N
+
+
+def rebuild_truck_recommendations(truck_id, today=None):
+    """트럭 하나의 추천 결과 재계산 후 저장
+
+    Returns:
+        int: 저장된 추천 개수
+    """
+    today = today or datetime.now()
+    TruckRecommendation.query.filter_by(truck_id=truck_id).delete()
+
+    truck = db.session.get(FoodTruck, truck_id)
+    if truck is None:
+        db.session.commit()
+        return 0
+
+    interested_location_ids = [
+        location_id
+        for (location_id,) in db.session.query(FoodTruckLocation.location_id).filter(
+            FoodTruckLocation.truck_id == truck_id
+        )
+    ]
+    top = top_candidates([truck], interested_location_ids, _top_n(), today)
+
+    db.session.add_all(
+        TruckRecommendation(
+            truck_id=truck_id,
+            location_id=location_id,
+            rank=rank,
+            score=score,
+            reason=", ".join(reasons),
+            computed_at=today,
+        )
+        for rank, (score, location_id, reasons) in enumerate(top)
+    )
+    db.session.commit()
+    return len(top)
+
+
+def load_truck_recommendations(truck, limit, today=None):
+    """사전 계산된 추천 결과 조회
+
+    결과가 없거나, 오늘 계산된 것이 아니거나, limit개를 채울 수 없으면 None을 반환합니다.
+    (호출 측에서 실시간 계산으로 대체)
+
+    Returns:
+        list | None: {"location", "score", "reason"} 딕셔너리 목록
+    """
+    today = today or datetime.now()
+    rows = (
+        db.session.query(TruckRecommendation, Location)
+        .join(Location, Location.location_id == TruckRecommendation.location_id)
+        .filter(TruckRecommendation.truck_id == truck.truck_id)
+        .order_by(TruckRecommendation.rank)
+        .all()
+    )
+    if not rows:
+        return None
+    if any(rec.computed_at.date() != today.date() for rec, _ in rows):
+        return None
+
+    # 계산 이후 운영이 종료된 위치 제외
+    available = [
+        (rec, location)
+        for rec, location in rows
+        if location.end_datetime is None or location.end_datetime >= today
+    ]
+
+    # 저장된 목록이 상위 N개에서 잘린 경우, 부족분을 채울 수 없으므로 실시간 계산
+    if len(available) < limit and len(rows) >= _top_n():
+        return None
+
+    return [
+        {"location": location, "score": rec.score, "reason": rec.reason}
+        for rec, location in available[:limit]
+    ]
+
+
+def _score_rises(connection, location_id):
+    """관심 등록 삭제로 신청자 수 점수 구간이 올라갔는지 확인 (20 -> 19, 10 -> 9)
+
+    신청자 수가 늘어 구간이 내려가는 경우는 점수가 낮아질 뿐이므로,
+    이 위치를 추천 중인 트럭만 갱신하면 됩니다.
+    """
+    count = connection.execute(
+        db.select(func.count())
+        .select_from(FoodTruckLocation.__table__)
+        .where(FoodTruckLocation.__table__.c.location_id == location_id)
+    ).scalar()
+    return any(count == threshold - 1 for threshold in _APPLICANT_THRESHOLDS)
+
+
+def _recommending_trucks(connection, location_id):
+    """이 위치를 추천 결과에 저장한 트럭 ID"""
+    table = TruckRecommendation.__table__
+    return connection.execute(
+        db.select(table.c.truck_id).where(table.c.location_id == location_id)
+    ).scalars()
+
+
+def _truncated_trucks(connection):
+    """추천 결과가 상위 N개에서 잘린 트럭 ID
+
+    잘리지 않은 트럭은 모든 후보를 저장하고 있으므로, 점수가 오른 위치가 새로 들어올 수
+    있는 것은 잘린 트럭뿐입니다.
+    """
+    table = TruckRecommendation.__table__
+    return connection.execute(
+        db.select(table.c.truck_id)
+        .group_by(table.c.truck_id)
+        .having(func.count() >= _top_n())
+    ).scalars()
+
+
+def _changed(obj, columns):
+    """columns 중 값이 실제로 바뀐 컬럼이 있는지 (같은 값 대입은 변경 아님)"""
+    state = inspect(obj)
+    return any(state.attrs[column].history.has_changes() for column in columns)
+
+
+def _collect_stale_trucks(session, connection):
+    """flush된 변경 사항에서 추천 결과가 무효화되는 트럭 ID 수집"""
+    truck_ids = set()
+    dirty = (obj for obj in session.dirty if session.is_modified(obj))
+    for obj in chain(session.new, dirty, session.deleted):
+        if isinstance(obj, Location):
+            if obj not in session.dirty or _changed(obj, _LOCATION_SCORING_COLUMNS):
+                # 위치 등록/삭제, 점수 관련 컬럼 변경은 모든 트럭의 후보/점수에 영향
+                return ALL_TRUCKS
+        elif isinstance(obj, FoodTruck):
+            if obj in session.dirty and not _changed(obj, _TRUCK_SCORING_COLUMNS):
+                continue
+            truck_ids.add(obj.truck_id)
+        elif isinstance(obj, FoodTruckLocation):
+            # 상태(status)는 신청자 수 집계에 포함되지 않음
+            if obj in session.dirty and not _changed(obj, ("truck_id", "location_id")):
+                continue
+            truck_ids.add(obj.truck_id)
+            # 신청자 수가 추천 이유에 포함되므로 이 위치를 추천 중인 트럭도 갱신
+            truck_ids.update(_recommending_trucks(connection, obj.location_id))
+            if obj in session.deleted and _score_rises(connection, obj.location_id):
+                truck_ids.update(_truncated_trucks(connection))
+    return truck_ids
+
+
+def _after_flush(session, flush_context):
+    if session.info.get(_PENDING_KEY) == ALL_TRUCKS:
+        return
+
+    connection = session.connection()
+    stale = _collect_stale_trucks(session, connection)
+    if not stale:
+        return
+
+    table = TruckRecommendation.__table__
+    if stale == ALL_TRUCKS:
+        connection.execute(table.delete())
+        session.info[_PENDING_KEY] = ALL_TRUCKS
+    else:
+        connection.execute(table.delete().where(table.c.truck_id.in_(stale)))
+        session.info.setdefault(_PENDING_KEY, set()).update(stale)
+
+
+def _after_commit(session):
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending or not has_app_context():
+        return
+    if not current_app.config.get("RECOMMENDATION_REFRESH_ASYNC"):
+        return
+
+    from doctruck_backend.tasks.recommendation import (
+        refresh_truck_recommendations,
+        refresh_all_truck_recommendations,
+    )
+
+    if pending == ALL_TRUCKS:
+        refresh_all_truck_recommendations.delay()
+    else:
+        for truck_id in pending:
+            refresh_truck_recommendations.delay(truck_id)
+
+
+def _after_rollback(session):
+    session.info.pop(_PENDING_KEY, None)
+
+
+def register_invalidation_listeners():
+    """세션 이벤트 리스너 등록 (애플리케이션 팩토리에서 한 번 호출)"""
+    if not event.contains(Session, "after_flush", _after_flush):
+        event.listen(Session, "after_flush", _after_flush)
+        event.listen(Session, "after_commit", _after_commit)
+        event.listen(Session, "after_rollback", _after_rollback)
@@ -0,0 +1,117 @@
+"""지연 일괄 쓰기(write-behind) 큐
+
+요청마다 INSERT + 커밋하는 대신 행을 메모리에 모았다가 한 번에 저장합니다.
+토큰 갱신(refresh)처럼 쓰기가 많고 몇 초 늦게 저장되어도 되는 데이터에 사용합니다.
+
+Spring Boot와 비교:
+- JdbcTemplate.batchUpdate + @Scheduled(fixedDelay) 플러시
+
+플러시 시점:
+1. 대기 행이 WRITE_BEHIND_SIZE개가 되었을 때 (요청 스레드에서 즉시)
+2. 첫 행이 들어온 뒤 WRITE_BEHIND_DELAY초가 지났을 때 (타이머 스레드)
+3. 프로세스 종료 시 (atexit)
+
+요청 세션(db.session)과 섞이지 않도록 별도 커넥션/트랜잭션으로 저장합니다.
+아직 저장되지 않은 행은 contains()로 확인할 수 있습니다.
+"""
+
+import atexit
+import logging
+import threading
+
+from sqlalchemy import insert
+
+from doctruck_backend.commons.metrics import Counters
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_SIZE = 100
+DEFAULT_MAX_DELAY = 1.0  # 초
+
+
+class WriteBehindQueue:
+    """테이블 하나에 대한 지연 일괄 INSERT 큐 (확장 객체: extensions.token_write_queue)"""
+
+    def __init__(self, table_name, key):
+        """
+        Args:
+            table_name: 저장할 테이블 이름
+            key: contains()로 조회할 컬럼 이름 (예: "jti")
+        """
+        self.table_name = table_name
+        self.key = key
+        self.max_size = DEFAULT_MAX_SIZE
+        self.max_delay = DEFAULT_MAX_DELAY
+        self._rows = []
+        self._lock = threading.Lock()
+        self._timer = None
+        self._app = None
+        self.counters = Counters("queued", "flushes", "written", "failed")
+
+    def init_app(self, app, prefix):
+        """설정 읽기 ({prefix}_SIZE, {prefix}_DELAY)"""
+        self.max_size = app.config.get(f"{prefix}_SIZE", DEFAULT_MAX_SIZE)
+        self.max_delay = app.config.get(f"{prefix}_DELAY", DEFAULT_MAX_DELAY)
+        if self._app is None:
+            atexit.register(self.flush)
+        self._app = app
+
+    def put(self, row):
+        """행 추가 (조건을 만족하면 바로 플러시)"""
+        with self._lock:
+            self._rows.append(row)
+            self.counters.incr("queued")
+            full = len(self._rows) >= self.max_size
+            if not full and self._timer is None:
+                self._timer = threading.Timer(self.max_delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        if full:
+            self.flush()
+
+    def contains(self, value):
+        """아직 저장되지 않은 행 중 key 컬럼 값이 value인 행이 있는지"""
+        with self._lock:
+            return any(row[self.key] == value for row in self._rows)
+
+    def flush(self):
+        """대기 중인 행을 한 번의 INSERT로 저장
+
+        Returns:
+            int: 저장한 행 수
+        """
+        with self._lock:
+            rows, self._rows = self._rows, []
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        if not rows or self._app is None:
+            return 0
+
+        from doctruck_backend.extensions import db
+
+        try:
+            with self._app.app_context():
+                table = db.metadata.tables[self.table_name]
+                with db.engine.begin() as connection:
+                    connection.execute(insert(table), rows)
+        except Exception:
+            self.counters.incr("failed", len(rows))
+            logger.error(
+                f"Write-behind flush to {self.table_name} failed, "
+                f"dropped {len(rows)} rows",
+                exc_info=True,
+            )
+            return 0
+        self.counters.incr("flushes")
+        self.counters.incr("written", len(rows))
+        return len(rows)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._rows)
+
+    def stats(self):
+        stats = self.counters.snapshot()
+        stats["pending"] = len(self)
+        return stats
@@ -5,13 +5,158 @@ Use env var to override
 
 import os
 
+from celery.schedules import crontab
+
+
+def _optional_int(name):
+    value = os.getenv(name)
+    return int(value) if value else None
+
+
 ENV = os.getenv("FLASK_ENV")
 DEBUG = ENV == "development"
 SECRET_KEY = os.getenv("SECRET_KEY")
 
 SQLALCHEMY_DATABASE_URI = os.getenv("DATABASE_URI")
 SQLALCHEMY_TRACK_MODIFICATIONS = False
+
+# 커넥션 풀 (미설정 시 SQLAlchemy 기본값, SQLite 메모리 DB에는 풀 크기 미적용)
+DB_POOL_SIZE = _optional_int("DB_POOL_SIZE")
+DB_MAX_OVERFLOW = _optional_int("DB_MAX_OVERFLOW")
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+DB_POOL_RECYCLE = _optional_int("DB_POOL_RECYCLE")  # 초
+
+# 읽기 전용 리소스(목록/상세/추천 조회)용 DB
+# - DATABASE_READ_URI: 읽기 복제본 URI
+# - SQLITE_READ_ONLY_BIND: 같은 SQLite 파일을 읽기 전용 커넥션으로 사용
+DATABASE_READ_URI = os.getenv("DATABASE_READ_URI")
+SQLITE_READ_ONLY_BIND = os.getenv("SQLITE_READ_ONLY_BIND", "false").lower() == "true"
+
+# SQLite 커넥션 설정 (commons/engine.py, 여러 워커/Celery 동시 쓰기 대응)
+SQLITE_JOURNAL_MODE = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+SQLITE_CACHE_SIZE = int(
+    os.getenv("SQLITE_CACHE_SIZE", "-20000")
+)  # 음수 = KiB (약 20MB)
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
 CELERY = {
     "broker_url": os.getenv("CELERY_BROKER_URL"),
     "result_backend": os.getenv("CELERY_RESULT_BACKEND_URL"),
+    "beat_schedule": {
+        # 날짜 경과에 따른 추천 점수 변화('운영 기간 임박') 반영
+        "refresh-all-truck-recommendations": {
+            "task": "doctruck_backend.tasks.recommendation.refresh_all_truck_recommendations",
+            "schedule": crontab(hour=0, minute=5),
+        },
+        # 만료된 토큰을 블록리스트에서 삭제 (테이블 크기를 활성 세션 수준으로 유지)
+        "purge-expired-tokens": {
+            "task": "doctruck_backend.tasks.blocklist.purge_expired_tokens",
+            "schedule": crontab(minute=15),
+        },
+    },
 }
+
+# 추천 위치 사전 계산 (truck_recommendations)
+RECOMMENDATION_MATERIALIZED_TOP_N = int(
+    os.getenv("RECOMMENDATION_MATERIALIZED_TOP_N", "50")
+)
+# 데이터 변경 시 커밋 후 Celery 재계산 작업 등록 여부
+RECOMMENDATION_REFRESH_ASYNC = (
+    os.getenv("RECOMMENDATION_REFRESH_ASYNC", "false").lower() == "true"
+)
+
+# 목록 전체 개수 캐시 항목 수 (프로세스당, 테이블 버전 기준 무효화)
+COUNT_CACHE_SIZE = int(os.getenv("COUNT_CACHE_SIZE", "1024"))
+
+# 공개 조회 API HTTP 캐시 (ETag는 테이블 버전 기준, commons/http_cache.py)
+# 브라우저는 매번 ETag로 재검증 (304), CDN은 S_MAXAGE 동안 캐시 후 재검증
+HTTP_CACHE_MAX_AGE = int(os.getenv("HTTP_CACHE_MAX_AGE", "0"))
+HTTP_CACHE_S_MAXAGE = int(os.getenv("HTTP_CACHE_S_MAXAGE", "30"))
+HTTP_CACHE_STALE_WHILE_REVALIDATE = int(
+    os.getenv("HTTP_CACHE_STALE_WHILE_REVALIDATE", "30")
+)
+
+# 공개 목록 응답 캐시 (프로세스당 항목 수(0이면 사용 안 함), 캐시 시간(초))
+# 위치/공문서 변경이 커밋되면 해당 테이블의 캐시 항목을 삭제
+# 캐시 키에 테이블 버전을 포함하므로 다른 워커의 쓰기도 다음 요청부터 반영
+RESPONSE_CACHE_SIZE = int(os.getenv("RESPONSE_CACHE_SIZE", "1024"))
+RESPONSE_CACHE_TTL = int(os.getenv("RESPONSE_CACHE_TTL", "60"))
+# 설정 시 Redis로 워커 간 캐시 공유 + 무효화 전파 (예: redis://redis:6379/3)
+RESPONSE_CACHE_REDIS_URL = os.getenv("RESPONSE_CACHE_REDIS_URL")
+
+# 비밀번호 해싱 (첫 번째 알고리즘으로 새 해시 생성, 나머지는 기존 해시 검증용)
+# 로그인 성공 시 기본 알고리즘/비용과 다른 해시는 자동으로 다시 해싱
+# 예: argon2,pbkdf2_sha256 (argon2/bcrypt는 pip install passlib[argon2] / passlib[bcrypt] 필요)
+PASSWORD_SCHEMES = os.getenv("PASSWORD_SCHEMES", "pbkdf2_sha256")
+# 알고리즘별 비용 (미설정 시 passlib 기본값, 변경 시 다음 로그인에서 다시 해싱)
+PASSWORD_ARGON2_TIME_COST = _optional_int("PASSWORD_ARGON2_TIME_COST")
+PASSWORD_ARGON2_MEMORY_COST = _optional_int("PASSWORD_ARGON2_MEMORY_COST")  # KiB
+PASSWORD_ARGON2_PARALLELISM = _optional_int("PASSWORD_ARGON2_PARALLELISM")
+PASSWORD_BCRYPT_ROUNDS = _optional_int("PASSWORD_BCRYPT_ROUNDS")
+PASSWORD_PBKDF2_ROUNDS = _optional_int("PASSWORD_PBKDF2_ROUNDS")
+# 비밀번호 검증 실행 위치: none(요청 스레드) | thread | process
+# 풀은 동시 해싱 수를 제한하는 입장 제어이며 워커를 비워 주지는 않음
+# (요청 스레드는 검증 결과를 기다리고, 대기 자리가 가득 차면 즉시 503)
+PASSWORD_VERIFY_POOL = os.getenv("PASSWORD_VERIFY_POOL", "none")
+PASSWORD_VERIFY_POOL_SIZE = int(os.getenv("PASSWORD_VERIFY_POOL_SIZE", "2"))
+# 대기 포함 최대 동시 검증 수 (초과 시 503, 미설정 시 POOL_SIZE * 4)
+PASSWORD_VERIFY_MAX_PENDING = _optional_int("PASSWORD_VERIFY_MAX_PENDING")
+
+# 앞단 리버스 프록시(Nginx 등) 수 - X-Forwarded-For에서 신뢰할 값 개수 (0이면 사용 안 함)
+# 프록시 뒤에서 0이면 모든 요청의 IP가 프록시 IP가 되어 로그인 제한이 모든 사용자에게 적용됨
+# 프록시 없이 1 이상으로 설정하면 클라이언트가 보낸 헤더로 IP를 속일 수 있음
+PROXY_FIX_X_FOR = int(os.getenv("PROXY_FIX_X_FOR", "0"))
+
+# 로그인 실패 제한 ("횟수/초", 빈 값이면 사용 안 함, IP = PROXY_FIX_X_FOR 적용 후 클라이언트 IP)
+LOGIN_RATE_LIMIT = os.getenv("LOGIN_RATE_LIMIT", "5/60")  # 계정 + IP
+# IP 단독 버킷은 기본 사용 안 함 (NAT/사내망 사용자가 같은 IP를 공유하므로 필요 시 설정)
+LOGIN_RATE_LIMIT_IP = os.getenv("LOGIN_RATE_LIMIT_IP", "")  # IP
+# 설정 시 Redis로 워커 간 버킷 공유 (예: redis://redis:6379/2)
+LOGIN_RATE_LIMIT_REDIS_URL = os.getenv("LOGIN_RATE_LIMIT_REDIS_URL")
+# 존재하지 않는 계정 캐시 시간(초, 0이면 사용 안 함)
+# Redis 없이는 계정 생성이 다른 워커의 캐시에 반영되지 않으므로 기본값 0
+# (새 계정이 이 시간 동안 다른 워커에서 "Bad credentials"를 받을 수 있음)
+LOGIN_NEGATIVE_CACHE_TTL = int(
+    os.getenv("LOGIN_NEGATIVE_CACHE_TTL", "60" if LOGIN_RATE_LIMIT_REDIS_URL else "0")
+)
+
+# JWT 블록리스트 저장 방식
+# - allowlist: 발급된 모든 토큰 저장 (없는 토큰은 폐기된 것으로 간주, 기존 방식)
+# - revocation: 폐기된 토큰만 저장 (없는 토큰은 유효, 로그인/갱신 시 DB 쓰기 없음)
+# 기존 배포의 동작이 바뀌지 않도록 기본값은 allowlist (revocation 전환은 DEPLOYMENT.md 4.5 참고)
+JWT_BLOCKLIST_POLICY = os.getenv("JWT_BLOCKLIST_POLICY", "allowlist")
+
+# allowlist 방식에서 토큰 갱신(refresh) 기록을 모아서 저장 (write-behind)
+# SIZE개가 모이거나 DELAY초가 지나면 한 번의 INSERT로 저장
+# BLOCKLIST_CACHE_REDIS_URL 필수 (저장 전 토큰을 다른 워커가 공유 캐시로 확인, 없으면 시작 시 오류)
+JWT_BLOCKLIST_WRITE_BEHIND = (
+    os.getenv("JWT_BLOCKLIST_WRITE_BEHIND", "false").lower() == "true"
+)
+JWT_BLOCKLIST_WRITE_BEHIND_SIZE = int(
+    os.getenv("JWT_BLOCKLIST_WRITE_BEHIND_SIZE", "100")
+)
+JWT_BLOCKLIST_WRITE_BEHIND_DELAY = float(
+    os.getenv("JWT_BLOCKLIST_WRITE_BEHIND_DELAY", "1.0")
+)
+
+# JWT identity(사용자/관리자) 조회 캐시 (프로세스당 항목 수, 캐시 시간(초))
+IDENTITY_CACHE_SIZE = int(os.getenv("IDENTITY_CACHE_SIZE", "10000"))
+IDENTITY_CACHE_TTL = int(os.getenv("IDENTITY_CACHE_TTL", "30"))
+
+# 만료 토큰 삭제 시 트랜잭션당 삭제 행 수 (쓰기 잠금 시간 제한)
+BLOCKLIST_PURGE_BATCH_SIZE = int(os.getenv("BLOCKLIST_PURGE_BATCH_SIZE", "1000"))
+
+# JWT 블록리스트 조회 캐시 (프로세스당 항목 수, 유효 토큰 캐시 시간(초))
+BLOCKLIST_CACHE_SIZE = int(os.getenv("BLOCKLIST_CACHE_SIZE", "10000"))
+BLOCKLIST_CACHE_TTL = int(os.getenv("BLOCKLIST_CACHE_TTL", "300"))
+# Redis 없이 실행할 때 유효 토큰 캐시 시간 상한(초)
+# 폐기(로그아웃)는 처리한 워커에만 바로 반영되므로, 다른 워커는 이 시간 동안 폐기된 토큰을
+# 허용할 수 있습니다 (길게 하면 DB 조회는 줄지만 로그아웃 반영이 늦어짐, 0이면 캐시 안 함)
+BLOCKLIST_CACHE_LOCAL_TTL = int(os.getenv("BLOCKLIST_CACHE_LOCAL_TTL", "5"))
+# 설정 시 Redis로 워커 간 캐시 공유 + 폐기 전파 (예: redis://redis:6379/1)
+BLOCKLIST_CACHE_REDIS_URL = os.getenv("BLOCKLIST_CACHE_REDIS_URL")
+
+# 응답 JSON 인코더 (orjson | json) - orjson이 설치되어 있지 않으면 json 사용
+# orjson은 비ASCII 문자를 \uXXXX 대신 UTF-8로 출력 (RESTFUL_JSON은 적용되지 않음)
+JSON_ENCODER = os.getenv("JSON_ENCODER", "orjson")
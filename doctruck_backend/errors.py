@@ -32,7 +32,9 @@ def register_error_handlers(app, jwt):
     def handle_http_exception(e):
         """모든 HTTP 예외에 대한 기본 핸들러"""
         response = {"error": e.name, "msg": e.description, "status_code": e.code}
-        return jsonify(response), e.code
+        # Retry-After 등 예외에 포함된 헤더 유지
+        headers = [(k, v) for k, v in e.get_headers() if k.lower() != "content-type"]
+        return jsonify(response), e.code, headers
 
     @app.errorhandler(400)
     def handle_bad_request(e):
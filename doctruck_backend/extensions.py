@@ -12,12 +12,27 @@ from flask_migrate import Migrate
 from celery import Celery
 
 from doctruck_backend.commons.apispec import APISpecExt
+from doctruck_backend.commons.blocklist_cache import BlocklistCache
+from doctruck_backend.commons.db_routing import RoutingSession
+from doctruck_backend.commons.identity_cache import IdentityCache
+from doctruck_backend.commons.passwords import PasswordVerifier
+from doctruck_backend.commons.rate_limit import LoginRateLimiter
+from doctruck_backend.commons.response_cache import ResponseCache
+from doctruck_backend.commons.write_behind import WriteBehindQueue
 
 
-db = SQLAlchemy()
+# 읽기 전용 리소스의 조회를 read bind로 보내는 세션 (commons/db_routing.py)
+db = SQLAlchemy(session_options={"class_": RoutingSession})
 jwt = JWTManager()
 ma = Marshmallow()
 migrate = Migrate()
 apispec = APISpecExt()
+# 알고리즘/비용은 password_verifier.init_app()에서 설정 (PASSWORD_SCHEMES)
 pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
+password_verifier = PasswordVerifier(pwd_context)
 celery = Celery("doctruck_backend")
+blocklist_cache = BlocklistCache()
+token_write_queue = WriteBehindQueue("token_blocklist", key="jti")
+identity_cache = IdentityCache()
+login_limiter = LoginRateLimiter()
+response_cache = ResponseCache()
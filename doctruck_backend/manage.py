@@ -16,3 +16,49 @@ def init():
     db.session.add(user)
     db.session.commit()
     click.echo("created user admin")
+
+
+@click.command("reindex-regions")
+@with_appcontext
+def reindex_regions():
+    """Rebuild region_index from location addresses and document sources"""
+    from doctruck_backend.commons.regions import rebuild_region_index
+
+    click.echo("rebuild region index")
+    location_count, document_count = rebuild_region_index()
+    click.echo(f"indexed {location_count} locations and {document_count} documents")
+
+
+@click.command("purge-issued-tokens")
+@with_appcontext
+def purge_issued_tokens():
+    """Delete non-revoked tokens (after switching to JWT_BLOCKLIST_POLICY=revocation)"""
+    from doctruck_backend.auth.helpers import (
+        POLICY_REVOCATION,
+        blocklist_policy,
+        purge_issued_tokens as purge,
+    )
+
+    if blocklist_policy() != POLICY_REVOCATION:
+        raise click.ClickException(
+            "JWT_BLOCKLIST_POLICY must be 'revocation' before purging issued tokens"
+        )
+    click.echo("purge issued tokens")
+    deleted = purge()
+    click.echo(f"deleted {deleted} tokens")
+
+
+@click.command("purge-expired-tokens")
+@click.option(
+    "--batch-size", default=None, type=int, help="Rows deleted per transaction"
+)
+@with_appcontext
+def purge_expired_tokens(batch_size):
+    """Delete expired tokens from the blocklist in batches"""
+    from flask import current_app
+    from doctruck_backend.auth.helpers import purge_expired_tokens as purge
+
+    batch_size = batch_size or current_app.config["BLOCKLIST_PURGE_BATCH_SIZE"]
+    click.echo("purge expired tokens")
+    deleted = purge(batch_size)
+    click.echo(f"deleted {deleted} tokens")
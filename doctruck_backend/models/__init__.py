@@ -9,6 +9,9 @@ from doctruck_backend.models.food_truck_location import (
     FoodTruckLocation,
     ApplicationStatus,
 )
+from doctruck_backend.models.truck_recommendation import TruckRecommendation
+from doctruck_backend.models.region_index import RegionIndex
+from doctruck_backend.models.table_version import TableVersion
 
 
 __all__ = [
@@ -22,6 +25,9 @@ __all__ = [
     "Document",
     "DocumentLocation",
     "FoodTruckLocation",
+    "TruckRecommendation",
+    "RegionIndex",
+    "TableVersion",
     # Enums
     "LocationType",
     "DocumentType",
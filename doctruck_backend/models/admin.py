@@ -1,7 +1,7 @@
 from sqlalchemy.ext.hybrid import hybrid_property
 from datetime import datetime
 
-from doctruck_backend.extensions import db, pwd_context
+from doctruck_backend.extensions import db, pwd_context, password_verifier
 
 
 class Admin(db.Model):
@@ -37,8 +37,11 @@ class Admin(db.Model):
         self._password = pwd_context.hash(value)
 
     def check_password(self, value):
-        """비밀번호 검증"""
-        return pwd_context.verify(value, self._password)
+        """비밀번호 검증 (해시 알고리즘/비용 설정이 바뀌었으면 새 해시로 교체, 커밋은 호출자)"""
+        valid, new_hash = password_verifier.verify_and_update(value, self._password)
+        if valid and new_hash is not None:
+            self._password = new_hash
+        return valid
 
     def __repr__(self):
         return f"<Admin {self.name} ({self.email})>"
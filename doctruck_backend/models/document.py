@@ -77,5 +77,20 @@ class Document(db.Model):
         cascade="all, delete-orphan",
     )
 
+    # 조회/정렬용 복합 인덱스 (Spring의 @Table(indexes = {...})와 동일)
+    # 상태 필터 + 정렬 컬럼 순서로 두어 정렬 없이 인덱스 순서대로 페이지를 읽음
+    __table_args__ = (
+        # 공개 목록: VERIFIED + 게시일 범위/최신순 (cursor 동점 처리용 PK 포함)
+        db.Index(
+            "ix_documents_status_published_at", "status", "published_at", "doc_id"
+        ),
+        # 관리자 목록: 상태 필터(PENDING 등) + 등록일 최신순
+        db.Index("ix_documents_status_created_at", "status", "created_at", "doc_id"),
+        # 관리자 목록(상태 필터 없음): 등록일 최신순
+        db.Index("ix_documents_created_at", "created_at", "doc_id"),
+        # 추천: 최근 N일 내 VERIFIED 문서
+        db.Index("ix_documents_status_verified_at", "status", "verified_at"),
+    )
+
     def __repr__(self):
         return f"<Document {self.title} ({self.status.value})>"
@@ -21,10 +21,12 @@ class DocumentLocation(db.Model):
         db.ForeignKey("documents.doc_id", ondelete="CASCADE"),
         nullable=False,
     )
+    # 위치 기준 조회용 인덱스 (unique 제약은 doc_id가 앞이라 위치로는 사용 불가)
     location_id = db.Column(
         db.Integer,
         db.ForeignKey("locations.location_id", ondelete="CASCADE"),
         nullable=False,
+        index=True,
     )
 
     # 관계 생성 일시
@@ -11,9 +11,12 @@ class FoodTruck(db.Model):
     # Primary Key
     truck_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
 
-    # Foreign Key - 소유자 (User)
+    # Foreign Key - 소유자 (User), 내 푸드트럭 조회용 인덱스
     owner_id = db.Column(
-        db.Integer, db.ForeignKey("user.id", ondelete="CASCADE"), nullable=False
+        db.Integer,
+        db.ForeignKey("user.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
 
     # 푸드트럭 기본 정보
@@ -27,6 +30,9 @@ class FoodTruck(db.Model):
     operating_region = db.Column(
         db.String(100), nullable=True
     )  # 주 활동 지역 (예: '서울', '경기')
+    # 거점(차고지) 좌표 - 추천 시 위치까지의 거리 점수에 사용 (선택)
+    home_latitude = db.Column(db.Numeric(9, 6), nullable=True)  # 위도
+    home_longitude = db.Column(db.Numeric(9, 6), nullable=True)  # 경도
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
 
     # Relationships
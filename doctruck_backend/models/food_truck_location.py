@@ -32,10 +32,12 @@ class FoodTruckLocation(db.Model):
         db.ForeignKey("food_trucks.truck_id", ondelete="CASCADE"),
         nullable=False,
     )
+    # 위치 기준 조회용 인덱스 (unique 제약은 truck_id가 앞이라 위치로는 사용 불가)
     location_id = db.Column(
         db.Integer,
         db.ForeignKey("locations.location_id", ondelete="CASCADE"),
         nullable=False,
+        index=True,
     )
 
     # 상태 정보 - 단순 관계가 아니라 비즈니스 로직이 포함된 관계
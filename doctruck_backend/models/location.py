@@ -35,6 +35,8 @@ class Location(db.Model):
     # DECIMAL(9,6) = 소수점 이하 6자리 (약 10cm 정밀도)
     latitude = db.Column(db.Numeric(9, 6), nullable=True)  # 위도
     longitude = db.Column(db.Numeric(9, 6), nullable=True)  # 경도
+    # 좌표의 geohash (반경/영역 검색용 격자 색인, 저장 시 자동 계산)
+    geohash = db.Column(db.String(12), nullable=True, index=True)
 
     # 행사 일정 정보
     start_datetime = db.Column(db.DateTime, nullable=True)  # 행사 시작 일시
@@ -62,5 +64,17 @@ class Location(db.Model):
         cascade="all, delete-orphan",
     )
 
+    # 조회/정렬용 복합 인덱스 (Spring의 @Table(indexes = {...})와 동일)
+    __table_args__ = (
+        # 목록: 등록일 최신순 (cursor 동점 처리용 PK 포함)
+        db.Index("ix_locations_created_at", "created_at", "location_id"),
+        # 목록: 위치 유형 필터 + 등록일 최신순
+        db.Index(
+            "ix_locations_type_created_at", "location_type", "created_at", "location_id"
+        ),
+        # 추천 후보/날짜 범위 필터: 종료일 (시작일은 인덱스 안에서 함께 비교)
+        db.Index("ix_locations_end_start", "end_datetime", "start_datetime"),
+    )
+
     def __repr__(self):
         return f"<Location {self.location_name} ({self.location_type.value})>"
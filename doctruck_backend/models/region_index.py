@@ -0,0 +1,25 @@
+from doctruck_backend.extensions import db
+
+
+class RegionIndex(db.Model):
+    """RegionIndex model - 지역 코드 색인 (위치/공문서 -> 시/도, 시/군/구)
+
+    Location.address, Document.source를 정규화한 지역 코드를 저장합니다.
+    문자열 부분 일치(LIKE '%서울%') 대신 region_code 동등 비교로 검색하기 위한 역색인
+    (지역 코드 형식은 doctruck_backend.commons.regions 참고)
+    """
+
+    __tablename__ = "region_index"
+
+    # 복합 Primary Key (엔티티 유형, 엔티티 ID, 지역 코드)
+    entity_type = db.Column(db.String(20), primary_key=True)  # 'location' / 'document'
+    entity_id = db.Column(db.Integer, primary_key=True)
+    region_code = db.Column(db.String(50), primary_key=True)  # 예: '11', '11:영등포구'
+
+    # 지역 코드로 엔티티를 찾는 조회용 인덱스
+    __table_args__ = (
+        db.Index("ix_region_index_code", "region_code", "entity_type", "entity_id"),
+    )
+
+    def __repr__(self):
+        return f"<RegionIndex {self.entity_type}:{self.entity_id} {self.region_code}>"
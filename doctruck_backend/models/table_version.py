@@ -0,0 +1,20 @@
+from doctruck_backend.extensions import db
+
+
+class TableVersion(db.Model):
+    """TableVersion model - 테이블별 데이터 버전 (캐시 무효화용)
+
+    추적 대상 테이블에 쓰기가 flush될 때마다 같은 트랜잭션에서 version이
+    새 값으로 바뀝니다. 캐시 키에 version을 포함하면 여러 워커 프로세스에서도
+    데이터가 바뀐 뒤 이전 캐시를 사용하지 않습니다.
+    (추적 대상은 doctruck_backend.commons.table_versions 참고)
+    """
+
+    __tablename__ = "table_versions"
+
+    table_name = db.Column(db.String(50), primary_key=True)
+    version = db.Column(db.String(32), nullable=False)  # uuid4 hex
+    updated_at = db.Column(db.DateTime, nullable=False)
+
+    def __repr__(self):
+        return f"<TableVersion {self.table_name} {self.version}>"
@@ -0,0 +1,48 @@
+from datetime import datetime
+
+from doctruck_backend.extensions import db
+
+
+class TruckRecommendation(db.Model):
+    """TruckRecommendation model - 푸드트럭별 추천 위치 사전 계산 결과
+
+    Spring에서 배치로 갱신하는 집계(materialized) 테이블과 동일한 역할
+    Celery 작업이 트럭별 상위 N개 추천 위치를 미리 계산해 저장합니다.
+    """
+
+    __tablename__ = "truck_recommendations"
+
+    # Primary Key
+    recommendation_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+
+    # Foreign Keys
+    truck_id = db.Column(
+        db.Integer,
+        db.ForeignKey("food_trucks.truck_id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    location_id = db.Column(
+        db.Integer,
+        db.ForeignKey("locations.location_id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    # 추천 결과
+    rank = db.Column(db.Integer, nullable=False)  # 추천 순위 (0부터 시작)
+    score = db.Column(db.Integer, nullable=False)  # 추천 점수
+    reason = db.Column(db.String(500), nullable=False)  # 추천 이유
+
+    # 계산 일시 (날짜가 바뀌면 '운영 기간 임박' 점수가 달라지므로 재계산 필요)
+    computed_at = db.Column(db.DateTime, default=datetime.now, nullable=False)
+
+    # Relationships
+    location = db.relationship("Location")
+
+    # Unique constraint - 동일한 트럭-위치 조합 중복 방지
+    __table_args__ = (
+        db.UniqueConstraint("truck_id", "location_id", name="uq_truck_recommendation"),
+        db.Index("ix_truck_recommendations_truck_rank", "truck_id", "rank"),
+    )
+
+    def __repr__(self):
+        return f"<TruckRecommendation truck_id={self.truck_id} location_id={self.location_id} score={self.score}>"
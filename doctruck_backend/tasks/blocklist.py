@@ -0,0 +1,16 @@
+"""JWT 블록리스트 정리 작업
+
+- purge_expired_tokens: 만료된 토큰 삭제 (매시간 Celery beat 실행)
+"""
+
+from flask import current_app
+
+from doctruck_backend.extensions import celery
+from doctruck_backend.auth import helpers
+
+
+@celery.task
+def purge_expired_tokens():
+    return helpers.purge_expired_tokens(
+        current_app.config["BLOCKLIST_PURGE_BATCH_SIZE"]
+    )
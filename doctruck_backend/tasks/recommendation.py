@@ -0,0 +1,24 @@
+"""추천 위치 사전 계산 작업
+
+- refresh_truck_recommendations: 트럭 하나의 추천 결과 재계산 (변경 발생 시)
+- refresh_all_truck_recommendations: 전체 트럭 재계산 (매일 밤 Celery beat 실행)
+"""
+
+from doctruck_backend.extensions import celery, db
+from doctruck_backend.models import FoodTruck
+from doctruck_backend.commons.truck_recommendations import (
+    rebuild_truck_recommendations,
+)
+
+
+@celery.task
+def refresh_truck_recommendations(truck_id):
+    return rebuild_truck_recommendations(truck_id)
+
+
+@celery.task
+def refresh_all_truck_recommendations():
+    truck_ids = [truck_id for (truck_id,) in db.session.query(FoodTruck.truck_id)]
+    for truck_id in truck_ids:
+        rebuild_truck_recommendations(truck_id)
+    return len(truck_ids)
@@ -1,4 +1,5 @@
 import logging
+import re
 from logging.config import fileConfig
 
 from flask import current_app
@@ -90,9 +91,19 @@ def run_migrations_online():
                 directives[:] = []
                 logger.info('No changes in schema detected.')
 
+    # 전문 검색 색인(FTS5 가상 테이블/섀도 테이블, pg_trgm 인덱스)은
+    # 모델 메타데이터 밖에서 관리하므로 autogenerate 비교 대상에서 제외
+    def include_name(name, type_, parent_names):
+        if type_ == 'table':
+            return not re.search(r'_fts(_\w+)?$', name)
+        if type_ == 'index':
+            return not name.endswith('_search_trgm')
+        return True
+
     conf_args = current_app.extensions['migrate'].configure_args
     if conf_args.get("process_revision_directives") is None:
         conf_args["process_revision_directives"] = process_revision_directives
+    conf_args.setdefault("include_name", include_name)
 
     connectable = get_engine()
 
@@ -0,0 +1,94 @@
+"""Add full-text search indexes for locations and documents
+
+Revision ID: 3e9c5a7d2b18
+Revises: 8d3a6c1e4f27
+Create Date: 2026-10-17 13:24:51.310277
+
+"""
+import sqlite3
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '3e9c5a7d2b18'
+down_revision = '8d3a6c1e4f27'
+branch_labels = None
+depends_on = None
+
+# SQLite: FTS5 가상 테이블 (trigram 토크나이저) + 동기화 트리거, 생성 후 기존 데이터 색인 (rebuild)
+SQLITE_UPGRADE = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS locations_fts USING fts5(location_name, address, "
+    "content='locations', content_rowid='location_id', tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS locations_fts_ai AFTER INSERT ON locations BEGIN "
+    "INSERT INTO locations_fts(rowid, location_name, address) "
+    "VALUES (new.location_id, new.location_name, new.address); END",
+    "CREATE TRIGGER IF NOT EXISTS locations_fts_ad AFTER DELETE ON locations BEGIN "
+    "INSERT INTO locations_fts(locations_fts, rowid, location_name, address) "
+    "VALUES ('delete', old.location_id, old.location_name, old.address); END",
+    "CREATE TRIGGER IF NOT EXISTS locations_fts_au AFTER UPDATE ON locations BEGIN "
+    "INSERT INTO locations_fts(locations_fts, rowid, location_name, address) "
+    "VALUES ('delete', old.location_id, old.location_name, old.address); "
+    "INSERT INTO locations_fts(rowid, location_name, address) "
+    "VALUES (new.location_id, new.location_name, new.address); END",
+    "INSERT INTO locations_fts(locations_fts) VALUES ('rebuild')",
+    "CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(title, ai_summary, "
+    "content='documents', content_rowid='doc_id', tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS documents_fts_ai AFTER INSERT ON documents BEGIN "
+    "INSERT INTO documents_fts(rowid, title, ai_summary) "
+    "VALUES (new.doc_id, new.title, new.ai_summary); END",
+    "CREATE TRIGGER IF NOT EXISTS documents_fts_ad AFTER DELETE ON documents BEGIN "
+    "INSERT INTO documents_fts(documents_fts, rowid, title, ai_summary) "
+    "VALUES ('delete', old.doc_id, old.title, old.ai_summary); END",
+    "CREATE TRIGGER IF NOT EXISTS documents_fts_au AFTER UPDATE ON documents BEGIN "
+    "INSERT INTO documents_fts(documents_fts, rowid, title, ai_summary) "
+    "VALUES ('delete', old.doc_id, old.title, old.ai_summary); "
+    "INSERT INTO documents_fts(rowid, title, ai_summary) "
+    "VALUES (new.doc_id, new.title, new.ai_summary); END",
+    "INSERT INTO documents_fts(documents_fts) VALUES ('rebuild')",
+]
+
+# FTS5 가상 테이블을 삭제하면 동기화 트리거도 함께 삭제해야 함
+SQLITE_DOWNGRADE = [
+    f"DROP TRIGGER IF EXISTS {table}_fts_{suffix}"
+    for table in ('locations', 'documents')
+    for suffix in ('ai', 'ad', 'au')
+] + [
+    "DROP TABLE IF EXISTS locations_fts",
+    "DROP TABLE IF EXISTS documents_fts",
+]
+
+# PostgreSQL: pg_trgm 확장 + GIN 인덱스
+POSTGRESQL_UPGRADE = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS ix_locations_search_trgm ON locations USING gin "
+    "((coalesce(location_name, '') || ' ' || coalesce(address, '')) gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_documents_search_trgm ON documents USING gin "
+    "((coalesce(title, '') || ' ' || coalesce(ai_summary, '')) gin_trgm_ops)",
+]
+
+POSTGRESQL_DOWNGRADE = [
+    "DROP INDEX IF EXISTS ix_locations_search_trgm",
+    "DROP INDEX IF EXISTS ix_documents_search_trgm",
+]
+
+
+def _statements(sqlite_statements, postgresql_statements):
+    dialect_name = op.get_bind().dialect.name
+    # trigram 토크나이저는 SQLite 3.34.0부터 지원 (이전 버전은 색인 없이 ILIKE 검색,
+    # 애플리케이션은 locations_fts/documents_fts 테이블 존재 여부로 판단)
+    if dialect_name == 'sqlite' and sqlite3.sqlite_version_info >= (3, 34, 0):
+        return sqlite_statements
+    if dialect_name == 'postgresql':
+        return postgresql_statements
+    return []
+
+
+def upgrade():
+    for statement in _statements(SQLITE_UPGRADE, POSTGRESQL_UPGRADE):
+        op.execute(statement)
+
+
+def downgrade():
+    for statement in _statements(SQLITE_DOWNGRADE, POSTGRESQL_DOWNGRADE):
+        op.execute(statement)
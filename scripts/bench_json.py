@@ -0,0 +1,92 @@
+"""응답 JSON 인코딩 벤치마크 (페이지 크기별)
+
+목록 응답({"total", "pages", "next", "prev", "results"})을 인코딩하는 데 걸린 시간을 비교합니다.
+- restful: 변경 전 flask-restful 기본 인코딩 (json.dumps, ASCII 이스케이프)
+- json: JSON_ENCODER=json (미리 생성한 표준 라이브러리 인코더)
+- orjson: JSON_ENCODER=orjson
+
+사용법:
+    python scripts/bench_json.py [--sizes 10,50,100,500,1000] [--repeat 200]
+"""
+
+import argparse
+import json
+import time
+from functools import partial
+
+from flask import Flask
+
+from doctruck_backend.api.schemas import DocumentSchema, LocationSchema
+from doctruck_backend.commons.json_provider import (
+    ENCODER_JSON,
+    ENCODER_ORJSON,
+    FastJSONProvider,
+)
+from doctruck_backend.commons.serializers import dump
+from scripts.bench_serializers import make_documents, make_locations
+
+
+def page(schema, rows):
+    return {
+        "total": len(rows) * 10,
+        "pages": 10,
+        "next": "/api/v1/locations?page=2&per_page=50",
+        "prev": "/api/v1/locations?page=1&per_page=50",
+        "results": dump(schema, rows),
+    }
+
+
+def measure(func, repeat, rounds=5):
+    """rounds번 측정 중 가장 빠른 회차의 평균 시간"""
+    func()
+    best = None
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for _ in range(repeat):
+            func()
+        elapsed = (time.perf_counter() - started) / repeat
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def run(name, schema, make_rows, sizes, repeat):
+    app = Flask(__name__)
+    encoders = {
+        "restful": lambda data: (json.dumps(data) + "\n").encode(),
+        # flask-restful 응답(output_json)과 같은 옵션 (키 정렬 없음)
+        "json": partial(
+            FastJSONProvider(app, ENCODER_JSON).dumps_bytes, sort_keys=False
+        ),
+        "orjson": partial(
+            FastJSONProvider(app, ENCODER_ORJSON).dumps_bytes, sort_keys=False
+        ),
+    }
+    for size in sizes:
+        data = page(schema, make_rows(size))
+        timings = {
+            label: measure(lambda: encode(data), repeat)
+            for label, encode in encoders.items()
+        }
+        baseline = timings["restful"]
+        print(
+            f"{name:<9} rows={size:<5} "
+            + " ".join(
+                f"{label}={elapsed * 1000:7.3f}ms(x{baseline / elapsed:4.1f})"
+                for label, elapsed in timings.items()
+            )
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="10,50,100,500,1000")
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+    sizes = [int(size) for size in args.sizes.split(",")]
+    print(f"repeat={args.repeat} (mean per page, best of 5 rounds)")
+    run("location", LocationSchema(many=True), make_locations, sizes, args.repeat)
+    run("document", DocumentSchema(many=True), make_documents, sizes, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
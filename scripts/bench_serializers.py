@@ -0,0 +1,96 @@
+"""목록 직렬화 벤치마크 (marshmallow dump vs 컴파일된 직렬화 함수)
+
+LocationSchema / DocumentSchema로 N개 행을 직렬화하는 데 걸린 시간과 초당 행 수를 비교합니다.
+"schema.dump"는 변경 전처럼 요청마다 스키마를 생성해 dump하는 경우입니다.
+
+사용법:
+    python scripts/bench_serializers.py [--rows 10000] [--repeat 5]
+"""
+
+import argparse
+import time
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+from doctruck_backend.api.schemas import DocumentSchema, LocationSchema
+from doctruck_backend.commons.serializers import dump
+from doctruck_backend.models import Document, Location
+from doctruck_backend.models.document import DocumentStatus, DocumentType
+from doctruck_backend.models.location import LocationType
+
+
+def make_locations(count):
+    created_at = datetime(2026, 10, 1, 12, 0)
+    return [
+        Location(
+            location_id=i,
+            location_name=f"location{i}",
+            location_type=LocationType.FESTIVAL,
+            address="서울시 영등포구 여의동로 330",
+            latitude=Decimal("37.526920"),
+            longitude=Decimal("126.934550"),
+            start_datetime=created_at + timedelta(days=i % 30),
+            end_datetime=None if i % 3 else created_at + timedelta(days=60),
+            description_summary="한강 축제",
+            created_at=created_at,
+        )
+        for i in range(count)
+    ]
+
+
+def make_documents(count):
+    created_at = datetime(2026, 10, 1, 12, 0)
+    return [
+        Document(
+            doc_id=i,
+            title=f"document{i}",
+            source="서울시청",
+            ai_summary="푸드트럭 영업 구역 안내",
+            document_type=DocumentType.NOTICE,
+            status=DocumentStatus.VERIFIED,
+            published_at=date(2026, 10, 1),
+            created_at=created_at,
+            verified_at=created_at,
+        )
+        for i in range(count)
+    ]
+
+
+def measure(func, repeat):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def run(name, schema_class, rows, repeat):
+    schema = schema_class(many=True)
+    assert dump(schema, rows) == schema.dump(rows)
+
+    results = {
+        "schema.dump": measure(lambda: schema_class(many=True).dump(rows), repeat),
+        "compiled": measure(lambda: dump(schema, rows), repeat),
+    }
+    baseline = results["schema.dump"]
+    for label, elapsed in results.items():
+        print(
+            f"{name:<9} {label:<12} {elapsed * 1000:>8.1f} ms "
+            f"rows/s={len(rows) / elapsed:>10.0f} x{baseline / elapsed:.1f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    print(f"rows={args.rows} repeat={args.repeat} (best of)")
+    run("location", LocationSchema, make_locations(args.rows), args.repeat)
+    run("document", DocumentSchema, make_documents(args.rows), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -17,6 +17,8 @@ setup(
         "marshmallow-sqlalchemy",
         "python-dotenv",
         "passlib",
+        "numpy",
+        "orjson",
         "apispec[yaml]",
         "apispec-webframeworks",
     ]
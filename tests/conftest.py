@@ -4,12 +4,20 @@ from dotenv import load_dotenv
 
 from doctruck_backend.models import User
 from doctruck_backend.app import create_app
-from doctruck_backend.extensions import db as _db
+from doctruck_backend.extensions import db as _db, response_cache
 from pytest_factoryboy import register
-from tests.factories import UserFactory
+from tests.factories import (
+    UserFactory,
+    FoodTruckFactory,
+    LocationFactory,
+    DocumentFactory,
+)
 
 
 register(UserFactory)
+register(FoodTruckFactory)
+register(LocationFactory)
+register(DocumentFactory)
 
 
 @pytest.fixture(scope="session")
@@ -30,6 +38,8 @@ def db(app):
 
     _db.session.close()
     _db.drop_all()
+    # 테스트마다 DB를 새로 만들므로 이전 테스트의 응답 캐시 제거
+    response_cache.clear()
 
 
 @pytest.fixture
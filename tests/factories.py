@@ -1,5 +1,14 @@
+from datetime import datetime
+
 import factory
-from doctruck_backend.models import User
+from doctruck_backend.models import (
+    User,
+    FoodTruck,
+    Location,
+    LocationType,
+    Document,
+    DocumentStatus,
+)
 
 
 class UserFactory(factory.Factory):
@@ -10,3 +19,34 @@ class UserFactory(factory.Factory):
 
     class Meta:
         model = User
+
+
+class FoodTruckFactory(factory.Factory):
+
+    truck_name = factory.Sequence(lambda n: "truck%d" % n)
+    food_category = "디저트"
+    operating_region = "서울"
+
+    class Meta:
+        model = FoodTruck
+
+
+class LocationFactory(factory.Factory):
+
+    location_name = factory.Sequence(lambda n: "location%d" % n)
+    location_type = LocationType.FESTIVAL
+    address = "서울시 영등포구 여의동로 330"
+
+    class Meta:
+        model = Location
+
+
+class DocumentFactory(factory.Factory):
+
+    title = factory.Sequence(lambda n: "document%d" % n)
+    source = "부산시청"
+    status = DocumentStatus.VERIFIED
+    verified_at = factory.LazyFunction(datetime.utcnow)
+
+    class Meta:
+        model = Document
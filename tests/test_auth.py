@@ -1,3 +1,30 @@
+from datetime import datetime, timedelta
+
+import pytest
+from flask import Flask
+from flask_jwt_extended import create_access_token, decode_token
+from passlib.hash import pbkdf2_sha256
+from sqlalchemy import event
+
+from doctruck_backend.app import configure_proxy
+from doctruck_backend.auth import helpers
+from doctruck_backend.auth.helpers import (
+    check_blocklist_settings,
+    is_token_revoked,
+    purge_expired_tokens,
+)
+from doctruck_backend.commons import passwords
+from doctruck_backend.commons.blocklist_cache import BlocklistCache
+from doctruck_backend.extensions import (
+    blocklist_cache,
+    login_limiter,
+    password_verifier,
+    pwd_context,
+    token_write_queue,
+)
+from doctruck_backend.models import TokenBlocklist
+
+
 def test_revoke_access_token(client, admin_headers):
     resp = client.delete("/auth/revoke_access", headers=admin_headers)
     assert resp.status_code == 200
@@ -12,3 +39,368 @@ def test_revoke_refresh_token(client, admin_refresh_headers):
 
     resp = client.post("/auth/refresh", headers=admin_refresh_headers)
     assert resp.status_code == 401
+
+
+def test_blocklist_lookup_cached(client, db, admin_headers):
+    blocklist_cache.clear()
+    statements = []
+
+    def blocklist_select(conn, cursor, statement, parameters, context, executemany):
+        if (
+            statement.lstrip().upper().startswith("SELECT")
+            and "token_blocklist" in statement
+        ):
+            statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", blocklist_select)
+    try:
+        for _ in range(3):
+            assert client.get("/api/v1/users", headers=admin_headers).status_code == 200
+    finally:
+        event.remove(db.engine, "before_cursor_execute", blocklist_select)
+
+    assert len(statements) == 1
+    stats = blocklist_cache.stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 2
+
+    # 폐기는 캐시에 즉시 반영
+    assert (
+        client.delete("/auth/revoke_access", headers=admin_headers).status_code == 200
+    )
+    assert client.get("/api/v1/users", headers=admin_headers).status_code == 401
+
+
+def test_revocation_policy_stores_only_revoked(app, client, db, admin_user, monkeypatch):
+    monkeypatch.setitem(app.config, "JWT_BLOCKLIST_POLICY", "revocation")
+    rep = client.post("/auth/login", json={"username": "admin", "password": "admin"})
+    tokens = rep.get_json()
+    assert TokenBlocklist.query.count() == 0
+
+    headers = {"authorization": "Bearer %s" % tokens["refresh_token"]}
+    assert client.post("/auth/refresh", headers=headers).status_code == 200
+    assert TokenBlocklist.query.count() == 0
+
+    assert client.delete("/auth/revoke_refresh", headers=headers).status_code == 200
+    token = TokenBlocklist.query.one()
+    assert token.revoked is True
+    assert token.token_type == "refresh"
+    assert client.post("/auth/refresh", headers=headers).status_code == 401
+
+
+def test_concurrent_revoke_is_success(app, client, db, admin_user, monkeypatch):
+    monkeypatch.setitem(app.config, "JWT_BLOCKLIST_POLICY", "revocation")
+    rep = client.post("/auth/login", json={"username": "admin", "password": "admin"})
+    access_token = rep.get_json()["access_token"]
+    headers = {"authorization": "Bearer %s" % access_token}
+    claims = decode_token(access_token)
+
+    find_token = helpers._find_token
+    calls = []
+
+    def race(token_jti, user):
+        # 다른 요청이 조회와 저장 사이에 같은 토큰을 먼저 폐기한 경우 (jti unique)
+        calls.append(token_jti)
+        if len(calls) > 1:
+            return find_token(token_jti, user)
+        db.session.add(
+            TokenBlocklist(
+                jti=token_jti,
+                token_type="access",
+                user_id=user,
+                revoked=True,
+                expires=datetime.fromtimestamp(claims["exp"]),
+            )
+        )
+        db.session.commit()
+        return None
+
+    monkeypatch.setattr(helpers, "_find_token", race)
+    assert client.delete("/auth/revoke_access", headers=headers).status_code == 200
+    assert len(calls) == 2
+    assert TokenBlocklist.query.one().revoked is True
+
+
+def test_allowlist_policy(app, client, db, admin_user, monkeypatch):
+    monkeypatch.setitem(app.config, "JWT_BLOCKLIST_POLICY", "allowlist")
+    rep = client.post("/auth/login", json={"username": "admin", "password": "admin"})
+    headers = {"authorization": "Bearer %s" % rep.get_json()["access_token"]}
+    assert TokenBlocklist.query.filter_by(revoked=False).count() == 2
+    assert client.get("/api/v1/users", headers=headers).status_code == 200
+
+    # 발급 기록이 없는 토큰은 폐기된 것으로 간주
+    with app.app_context():
+        unknown = create_access_token(identity=admin_user.id)
+    rep = client.get("/api/v1/users", headers={"authorization": "Bearer %s" % unknown})
+    assert rep.status_code == 401
+
+    # revocation 정책으로 전환 후 발급 기록 정리
+    monkeypatch.setitem(app.config, "JWT_BLOCKLIST_POLICY", "revocation")
+    result = app.test_cli_runner().invoke(args=["purge-issued-tokens"])
+    assert "deleted 2 tokens" in result.output
+    assert TokenBlocklist.query.count() == 0
+
+
+def test_purge_expired_tokens(app, db, admin_user):
+    now = datetime.now()
+    for i, expires in enumerate([-3, -2, -1, 1]):
+        db.session.add(
+            TokenBlocklist(
+                jti="jti-%d" % i,
+                token_type="access",
+                user_id=admin_user.id,
+                revoked=True,
+                expires=now + timedelta(hours=expires),
+            )
+        )
+    db.session.commit()
+
+    assert purge_expired_tokens(batch_size=2, now=now) == 3
+    assert [token.jti for token in TokenBlocklist.query] == ["jti-3"]
+
+    result = app.test_cli_runner().invoke(args=["purge-expired-tokens"])
+    assert "deleted 0 tokens" in result.output
+
+
+def test_issue_tokens_single_insert(app, client, db, admin_user, monkeypatch):
+    monkeypatch.setitem(app.config, "JWT_BLOCKLIST_POLICY", "allowlist")
+    inserts = []
+
+    def count_insert(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT INTO token_blocklist"):
+            inserts.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", count_insert)
+    try:
+        rep = client.post(
+            "/auth/login", json={"username": "admin", "password": "admin"}
+        )
+    finally:
+        event.remove(db.engine, "before_cursor_execute", count_insert)
+    assert len(inserts) == 1
+
+    tokens = rep.get_json()
+    with app.app_context():
+        for token_type in ("access", "refresh"):
+            claims = decode_token(tokens[f"{token_type}_token"])
+            token = TokenBlocklist.query.filter_by(jti=claims["jti"]).one()
+            assert token.token_type == token_type
+            assert token.expires == datetime.fromtimestamp(claims["exp"])
+
+
+def test_refresh_write_behind(app, client, db, admin_user, monkeypatch):
+    monkeypatch.setitem(app.config, "JWT_BLOCKLIST_POLICY", "allowlist")
+    monkeypatch.setitem(app.config, "JWT_BLOCKLIST_WRITE_BEHIND", True)
+    monkeypatch.setattr(token_write_queue, "max_delay", 60)
+    # write-behind는 워커 간 공유 캐시(Redis)가 있을 때만 사용
+    monkeypatch.setattr(BlocklistCache, "shared", True)
+    rep = client.post("/auth/login", json={"username": "admin", "password": "admin"})
+    refresh_headers = {"authorization": "Bearer %s" % rep.get_json()["refresh_token"]}
+
+    rep = client.post("/auth/refresh", headers=refresh_headers)
+    headers = {"authorization": "Bearer %s" % rep.get_json()["access_token"]}
+    assert TokenBlocklist.query.count() == 2
+    assert len(token_write_queue) == 1
+
+    # 저장 전에도 유효한 토큰
+    blocklist_cache.clear()
+    assert client.get("/api/v1/users", headers=headers).status_code == 200
+
+    assert token_write_queue.flush() == 1
+    assert TokenBlocklist.query.count() == 3
+    assert client.delete("/auth/revoke_access", headers=headers).status_code == 200
+    assert client.get("/api/v1/users", headers=headers).status_code == 401
+
+
+def test_unshared_blocklist_cache_short_ttl(monkeypatch):
+    cache = BlocklistCache()
+    now = 1_000_000.0
+    monkeypatch.setattr(
+        "doctruck_backend.commons.blocklist_cache.time.time", lambda: now
+    )
+    cache.set("valid", False, now + 3600)
+    cache.set("revoked", True, now + 3600)
+
+    # Redis 없이는 다른 워커의 폐기를 알 수 없으므로 유효 토큰은 LOCAL_TTL 후 다시 조회
+    now += cache.local_ttl + 1
+    assert cache.get("valid") is None
+    assert cache.get("revoked") is True
+
+
+def test_write_behind_requires_shared_cache():
+    app = Flask(__name__)
+    app.config["JWT_BLOCKLIST_WRITE_BEHIND"] = True
+    with pytest.raises(ValueError):
+        check_blocklist_settings(app)
+    app.config["BLOCKLIST_CACHE_REDIS_URL"] = "redis://localhost:6379/1"
+    check_blocklist_settings(app)
+
+
+def test_allowlist_missing_token_not_cached(app, client, db, admin_user, monkeypatch):
+    monkeypatch.setitem(app.config, "JWT_BLOCKLIST_POLICY", "allowlist")
+    rep = client.post("/auth/login", json={"username": "admin", "password": "admin"})
+    headers = {"authorization": "Bearer %s" % rep.get_json()["access_token"]}
+    claims = decode_token(rep.get_json()["access_token"])
+
+    # 다른 워커의 write-behind 큐에 있는 토큰 (DB와 이 워커의 큐에는 없음)
+    TokenBlocklist.query.filter_by(jti=claims["jti"]).delete()
+    db.session.commit()
+    blocklist_cache.clear()
+    assert is_token_revoked(claims) is True
+    assert blocklist_cache.get(claims["jti"], claims["exp"]) is None
+
+    # 공유 캐시로는 유효하지만 아직 저장되지 않은 토큰의 폐기 요청은 409
+    blocklist_cache.set(claims["jti"], False, claims["exp"])
+    assert client.delete("/auth/revoke_access", headers=headers).status_code == 409
+
+
+def test_login_rehashes_password(app, client, db, user, monkeypatch):
+    user._password = pbkdf2_sha256.using(rounds=29000).hash("legacy-pass")
+    db.session.add(user)
+    db.session.commit()
+
+    monkeypatch.setitem(app.config, "PASSWORD_PBKDF2_ROUNDS", 1000)
+    password_verifier.init_app(app)
+    try:
+        data = {"username": user.username, "password": "legacy-pass"}
+        assert client.post("/auth/login", json=data).status_code == 200
+        assert pbkdf2_sha256.from_string(user.password).rounds == 1000
+        rehashed = user.password
+        assert client.post("/auth/login", json=data).status_code == 200
+        assert user.password == rehashed
+    finally:
+        monkeypatch.undo()
+        password_verifier.init_app(app)
+
+
+def test_password_verify_pool_bounded(app, client, db, admin_user, monkeypatch):
+    monkeypatch.setitem(app.config, "PASSWORD_VERIFY_POOL", "thread")
+    monkeypatch.setitem(app.config, "PASSWORD_VERIFY_MAX_PENDING", 1)
+    password_verifier.init_app(app)
+    try:
+        data = {"username": "admin", "password": "admin"}
+        assert client.post("/auth/login", json=data).status_code == 200
+
+        # 대기 자리가 모두 찬 경우 해싱 없이 503
+        password_verifier._slots.acquire()
+        rep = client.post("/auth/login", json=data)
+        password_verifier._slots.release()
+        assert rep.status_code == 503
+        assert rep.headers["Retry-After"] == "1"
+    finally:
+        monkeypatch.undo()
+        password_verifier.init_app(app)
+
+
+def test_password_verify_pool_created_per_process(app, monkeypatch):
+    monkeypatch.setitem(app.config, "PASSWORD_VERIFY_POOL", "thread")
+    password_verifier.init_app(app)
+    try:
+        # fork 전(init_app)에는 풀을 만들지 않음
+        assert password_verifier._executor is None
+        hashed = pwd_context.hash("secret")
+        assert password_verifier.verify_and_update("secret", hashed)[0]
+        parent_executor = password_verifier._executor
+        assert parent_executor is not None
+
+        # fork된 워커에서는 물려받은 풀 대신 새 풀 사용
+        monkeypatch.setattr(passwords.os, "getpid", lambda: -1)
+        assert password_verifier.verify_and_update("secret", hashed)[0]
+        assert password_verifier._executor is not parent_executor
+        password_verifier._executor.shutdown()
+        parent_executor.shutdown()
+    finally:
+        monkeypatch.undo()
+        password_verifier.init_app(app)
+
+
+def test_login_rate_limit(app, client, db, admin_user, monkeypatch):
+    monkeypatch.setitem(app.config, "LOGIN_RATE_LIMIT", "3/60")
+    login_limiter.init_app(app)
+    try:
+        bad = {"username": "admin", "password": "wrong"}
+        for _ in range(3):
+            assert client.post("/auth/login", json=bad).status_code == 400
+
+        # 해싱 없이 거부 (올바른 비밀번호도 대기 후 가능)
+        verified = password_verifier.stats()["verified"]
+        rep = client.post(
+            "/auth/login", json={"username": "admin", "password": "admin"}
+        )
+        assert rep.status_code == 429
+        assert int(rep.headers["Retry-After"]) >= 1
+        assert password_verifier.stats()["verified"] == verified
+
+        # 다른 계정은 영향 없음
+        rep = client.post("/auth/login", json={"username": "other", "password": "x"})
+        assert rep.status_code == 400
+        assert login_limiter.stats()["rejected"] == 1
+    finally:
+        monkeypatch.undo()
+        login_limiter.init_app(app)
+
+
+def test_login_rate_limit_per_client_ip(app, client, db, admin_user, monkeypatch):
+    assert not app.config["LOGIN_RATE_LIMIT_IP"]
+    monkeypatch.setitem(app.config, "LOGIN_RATE_LIMIT", "2/60")
+    monkeypatch.setitem(app.config, "PROXY_FIX_X_FOR", 1)
+    monkeypatch.setattr(app, "wsgi_app", app.wsgi_app)
+    configure_proxy(app)
+    login_limiter.init_app(app)
+    try:
+        bad = {"username": "admin", "password": "wrong"}
+        good = {"username": "admin", "password": "admin"}
+        for _ in range(2):
+            rep = client.post(
+                "/auth/login", json=bad, environ_base={"REMOTE_ADDR": "10.0.0.1"}
+            )
+            assert rep.status_code == 400
+        rep = client.post(
+            "/auth/login", json=good, environ_base={"REMOTE_ADDR": "10.0.0.1"}
+        )
+        assert rep.status_code == 429
+
+        # 다른 IP의 같은 계정 로그인은 영향 없음
+        rep = client.post(
+            "/auth/login", json=good, environ_base={"REMOTE_ADDR": "10.0.0.2"}
+        )
+        assert rep.status_code == 200
+
+        # 프록시(10.0.0.1) 뒤에서는 X-Forwarded-For의 클라이언트 IP 기준
+        rep = client.post(
+            "/auth/login",
+            json=good,
+            headers={"X-Forwarded-For": "203.0.113.7"},
+            environ_base={"REMOTE_ADDR": "10.0.0.1"},
+        )
+        assert rep.status_code == 200
+    finally:
+        monkeypatch.undo()
+        login_limiter.init_app(app)
+
+
+def test_login_unknown_username_cached(app, client, db, monkeypatch):
+    # Redis 없이는 기본값 0 (단일 프로세스 기준으로 캐시 동작 확인)
+    assert app.config["LOGIN_NEGATIVE_CACHE_TTL"] == 0
+    monkeypatch.setattr(login_limiter, "negative_ttl", 60)
+    login_limiter.reset()
+    statements = []
+
+    def user_select(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("SELECT user.id"):
+            statements.append(statement)
+
+    data = {"username": "ghost", "password": "x"}
+    event.listen(db.engine, "before_cursor_execute", user_select)
+    try:
+        assert client.post("/auth/login", json=data).status_code == 400
+        assert client.post("/auth/login", json=data).status_code == 400
+    finally:
+        event.remove(db.engine, "before_cursor_execute", user_select)
+    assert len(statements) == 1
+    assert login_limiter.stats()["negative_hits"] == 1
+
+    # 계정 생성 시 캐시에서 제거
+    login_limiter.forget_unknown("ghost")
+    assert not login_limiter.is_unknown("ghost")
+    login_limiter.reset()
@@ -0,0 +1,84 @@
+from flask import Flask, jsonify
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+
+from doctruck_backend.commons.db_routing import (
+    READ_BIND,
+    RoutingSession,
+    read_only,
+    register_routing_listeners,
+    route_reads_for_request,
+)
+from doctruck_backend.commons.engine import (
+    configure_engine_options,
+    sqlite_read_only_uri,
+)
+
+
+def _routing_app(tmp_path):
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{tmp_path / 'app.db'}"
+    app.config["SQLITE_READ_ONLY_BIND"] = True
+    app.config["DB_POOL_SIZE"] = 2
+    configure_engine_options(app)
+    db = SQLAlchemy(app, session_options={"class_": RoutingSession})
+    register_routing_listeners()
+    app.before_request(route_reads_for_request)
+
+    class Item(db.Model):
+        id = db.Column(db.Integer, primary_key=True)
+        name = db.Column(db.String(20))
+
+    @app.route("/items")
+    @read_only
+    def items():
+        return jsonify([item.name for item in Item.query.order_by(Item.id)])
+
+    @app.route("/items/<name>", methods=["POST"])
+    @read_only
+    def add_item(name):
+        db.session.add(Item(name=name))
+        db.session.commit()
+        return jsonify([item.name for item in Item.query.order_by(Item.id)])
+
+    with app.app_context():
+        db.create_all()
+    return app, db
+
+
+def test_read_only_views_use_read_bind(tmp_path):
+    app, db = _routing_app(tmp_path)
+    assert app.config["SQLALCHEMY_BINDS"][READ_BIND].endswith("?mode=ro&uri=true")
+    assert app.config["SQLALCHEMY_ENGINE_OPTIONS"]["pool_size"] == 2
+
+    read_selects = []
+    with app.app_context():
+        read_engine = db.engines[READ_BIND]
+
+    def count_select(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("SELECT"):
+            read_selects.append(statement)
+
+    event.listen(read_engine, "before_cursor_execute", count_select)
+    client = app.test_client()
+
+    # 쓰기는 기본 DB, 같은 요청의 이후 조회도 기본 DB (read-your-writes)
+    assert client.post("/items/first").get_json() == ["first"]
+    assert read_selects == []
+
+    assert client.get("/items").get_json() == ["first"]
+    assert len(read_selects) == 1
+
+    # 요청별로 기본 DB 조회 강제
+    rep = client.get("/items", headers={"X-DB-Consistency": "strong"})
+    assert rep.get_json() == ["first"]
+    assert len(read_selects) == 1
+
+
+def test_sqlite_read_only_uri():
+    assert sqlite_read_only_uri("sqlite:///:memory:") is None
+    assert sqlite_read_only_uri("postgresql://db/app") is None
+    assert (
+        sqlite_read_only_uri("sqlite:////db/doctruck_backend.db")
+        == "sqlite:///file:/db/doctruck_backend.db?mode=ro&uri=true"
+    )
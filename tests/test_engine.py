@@ -0,0 +1,61 @@
+import sqlite3
+
+import pytest
+from flask import Flask
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import text
+
+from doctruck_backend.commons.db_routing import READ_BIND
+from doctruck_backend.commons.engine import (
+    apply_pragmas,
+    configure_engine_options,
+    register_sqlite_pragmas,
+    sqlite_pragmas,
+)
+
+
+def test_sqlite_pragmas_applied(app, db):
+    with app.app_context():
+        assert db.session.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+        # NORMAL = 1
+        assert db.session.execute(text("PRAGMA synchronous")).scalar() == 1
+
+
+def test_sqlite_wal_on_file(tmp_path):
+    pragmas = sqlite_pragmas(
+        {"SQLITE_JOURNAL_MODE": "wal", "SQLITE_MMAP_SIZE": 1024 * 1024}
+    )
+    connection = sqlite3.connect(tmp_path / "test.db")
+    apply_pragmas(connection, pragmas)
+    assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    connection.close()
+
+    with pytest.raises(ValueError):
+        sqlite_pragmas({"SQLITE_JOURNAL_MODE": "WAL; DROP TABLE user"})
+
+
+def test_read_only_bind_pragmas(tmp_path):
+    # rollback journal 모드의 기존 파일에 읽기 bind가 먼저 연결되는 경우
+    connection = sqlite3.connect(tmp_path / "app.db")
+    connection.execute("CREATE TABLE item (id INTEGER)")
+    connection.close()
+    app = Flask(__name__)
+    app.config.update(
+        SQLALCHEMY_DATABASE_URI=f"sqlite:///{tmp_path / 'app.db'}",
+        SQLITE_READ_ONLY_BIND=True,
+        SQLITE_JOURNAL_MODE="WAL",
+        SQLITE_SYNCHRONOUS="NORMAL",
+        SQLITE_BUSY_TIMEOUT_MS=3000,
+    )
+    configure_engine_options(app)
+    db = SQLAlchemy(app)
+    register_sqlite_pragmas(app, db)
+
+    with app.app_context():
+        with db.engines[READ_BIND].connect() as conn:
+            assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 3000
+            assert conn.execute(text("PRAGMA query_only")).scalar() == 1
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "delete"
+        with db.engine.connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            assert conn.execute(text("PRAGMA query_only")).scalar() == 0
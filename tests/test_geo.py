@@ -0,0 +1,81 @@
+from flask import url_for
+
+from doctruck_backend.commons.geo import covering_cells, encode_geohash, haversine_km
+
+# 여의도 한강공원 기준 좌표
+YEOUIDO = (37.5284, 126.9334)
+
+
+def test_geohash_and_distance():
+    assert encode_geohash(*YEOUIDO) == "wydm2ry4f"
+    assert encode_geohash(57.64911, 10.40744, 11) == "u4pruydqqvj"
+    # 여의도 -> 서울역 약 4.4km
+    assert round(haversine_km(*YEOUIDO, 37.5547, 126.9707), 1) == 4.4
+
+    cells = covering_cells(37.50, 126.90, 37.56, 126.98)
+    assert len(cells) <= 16
+    assert any(encode_geohash(*YEOUIDO).startswith(cell) for cell in cells)
+
+
+def test_location_list_radius_search(client, db, location_factory):
+    near = location_factory(latitude=37.5300, longitude=126.9350)  # 약 0.2km
+    nearest = location_factory(latitude=37.5284, longitude=126.9334)
+    middle = location_factory(latitude=37.5547, longitude=126.9707)  # 약 4.4km
+    far = location_factory(latitude=35.1587, longitude=129.1604)  # 부산
+    unknown = location_factory(latitude=None, longitude=None)
+    db.session.add_all([near, nearest, middle, far, unknown])
+    db.session.commit()
+    assert nearest.geohash == encode_geohash(*YEOUIDO)
+
+    lat, lon = YEOUIDO
+    rep = client.get(
+        url_for("api.locations", lat=lat, lon=lon, radius_km=5, sort="distance")
+    )
+    assert rep.status_code == 200
+    data = rep.get_json()
+    assert data["total"] == 3
+    assert [r["location_id"] for r in data["results"]] == [
+        nearest.location_id,
+        near.location_id,
+        middle.location_id,
+    ]
+    assert data["results"][0]["distance_km"] == 0
+
+    # 반경 검색은 page 모드만 지원 (cursor를 보내면 page 응답 대신 400)
+    rep = client.get(
+        url_for("api.locations", lat=lat, lon=lon, sort="distance", cursor="")
+    )
+    assert rep.status_code == 400
+    assert "Cursor pagination" in rep.get_json()["message"]
+
+    rep = client.get(url_for("api.locations", lat=lat, lon=lon, radius_km=1))
+    assert {r["location_id"] for r in rep.get_json()["results"]} == {
+        nearest.location_id,
+        near.location_id,
+    }
+
+    # 좌표 변경 시 geohash도 갱신
+    far.latitude, far.longitude = 37.5290, 126.9340
+    db.session.commit()
+    rep = client.get(url_for("api.locations", lat=lat, lon=lon, radius_km=1))
+    assert far.location_id in [r["location_id"] for r in rep.get_json()["results"]]
+
+
+def test_location_list_bbox_search(client, db, location_factory):
+    inside = location_factory(latitude=37.5300, longitude=126.9350)
+    outside = location_factory(latitude=35.1587, longitude=129.1604)
+    db.session.add_all([inside, outside])
+    db.session.commit()
+
+    rep = client.get(url_for("api.locations", bbox="126.9,37.5,127.0,37.6"))
+    assert rep.status_code == 200
+    assert [r["location_id"] for r in rep.get_json()["results"]] == [inside.location_id]
+    assert "distance_km" not in rep.get_json()["results"][0]
+
+    for args in (
+        {"bbox": "126.9,37.6,127.0"},
+        {"lat": 37.5},
+        {"lat": 37.5, "lon": 126.9, "radius_km": 500},
+        {"sort": "distance"},
+    ):
+        assert client.get(url_for("api.locations", **args)).status_code == 400
@@ -0,0 +1,83 @@
+from flask import url_for
+from sqlalchemy import event
+
+from doctruck_backend.models import DocumentStatus
+
+
+def test_document_list_not_modified(client, db, document_factory):
+    db.session.add(document_factory(status=DocumentStatus.VERIFIED))
+    db.session.commit()
+    url = url_for("api.documents")
+
+    rep = client.get(url)
+    assert rep.status_code == 200
+    etag = rep.headers["ETag"]
+    assert etag.startswith('"')
+    assert rep.headers["Cache-Control"] == (
+        "public, max-age=0, s-maxage=30, stale-while-revalidate=30"
+    )
+    assert "Last-Modified" in rep.headers
+
+    # 304는 테이블 버전만 조회 (목록/개수 쿼리와 직렬화 없음)
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", capture)
+    try:
+        rep = client.get(url, headers={"If-None-Match": etag})
+    finally:
+        event.remove(db.engine, "before_cursor_execute", capture)
+    assert rep.status_code == 304
+    assert rep.get_data() == b""
+    assert rep.headers["ETag"] == etag
+    assert len(statements) == 1 and "table_versions" in statements[0]
+
+    # 파라미터가 다르면 다른 ETag
+    rep = client.get(url_for("api.documents", fields="doc_id"))
+    assert rep.status_code == 200
+    assert rep.headers["ETag"] != etag
+
+    # 데이터 변경(커밋) 후에는 새 응답
+    db.session.add(document_factory(status=DocumentStatus.VERIFIED))
+    db.session.commit()
+    rep = client.get(url, headers={"If-None-Match": etag})
+    assert rep.status_code == 200
+    assert rep.headers["ETag"] != etag
+    assert rep.get_json()["total"] == 2
+
+
+def test_location_detail_if_modified_since(client, db, location_factory):
+    location = location_factory()
+    db.session.add(location)
+    db.session.commit()
+    url = url_for("api.location_by_id", location_id=location.location_id)
+
+    rep = client.get(url)
+    assert rep.status_code == 200
+    last_modified = rep.headers["Last-Modified"]
+
+    rep = client.get(url, headers={"If-Modified-Since": last_modified})
+    assert rep.status_code == 304
+    # If-None-Match가 있으면 If-Modified-Since는 무시
+    rep = client.get(
+        url,
+        headers={"If-Modified-Since": last_modified, "If-None-Match": '"stale"'},
+    )
+    assert rep.status_code == 200
+
+    rep = client.get(url_for("api.location_by_id", location_id=0))
+    assert rep.status_code == 404
+    assert "ETag" not in rep.headers
+
+
+def test_unverified_document_not_cached(client, db, document_factory):
+    document = document_factory(status=DocumentStatus.PENDING)
+    db.session.add(document)
+    db.session.commit()
+
+    rep = client.get(url_for("api.document_by_id", doc_id=document.doc_id))
+    assert rep.status_code == 403
+    assert "ETag" not in rep.headers
+    assert "Cache-Control" not in rep.headers
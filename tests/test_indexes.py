@@ -0,0 +1,125 @@
+import re
+from contextlib import contextmanager
+
+import pytest
+from flask import url_for
+from sqlalchemy import event
+
+from doctruck_backend.models import Admin
+
+# 인덱스 없이 테이블 전체를 읽는 실행 계획 (예: "SCAN locations")
+FULL_SCAN = re.compile(
+    r"^SCAN (documents|locations|food_trucks|food_truck_locations|document_locations)$"
+)
+
+
+@contextmanager
+def captured_selects(db):
+    """요청 중 실행된 SELECT 문과 파라미터 수집"""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(db.engine, "before_cursor_execute", capture)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, "before_cursor_execute", capture)
+
+
+def query_plans(db, client, url, headers=None):
+    """GET 요청의 SELECT 문별 EXPLAIN QUERY PLAN 결과 (detail 문자열 목록)"""
+    with captured_selects(db) as statements:
+        rep = client.get(url, headers=headers)
+    assert rep.status_code == 200
+    plans = []
+    with db.engine.connect() as conn:
+        for statement, parameters in statements:
+            rows = conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters)
+            plans.append((statement, [row[-1] for row in rows]))
+    return plans
+
+
+@pytest.fixture
+def admin_token_headers(client, db):
+    db.session.add(Admin(email="admin@example.com", password="admin123", name="관리자"))
+    db.session.commit()
+    rep = client.post(
+        "/auth/admin/login", json={"email": "admin@example.com", "password": "admin123"}
+    )
+    return {"authorization": "Bearer %s" % rep.get_json()["access_token"]}
+
+
+@pytest.mark.parametrize(
+    "endpoint, args, indexes",
+    [
+        ("api.documents", {"cursor": ""}, ["ix_documents_status_published_at"]),
+        (
+            "api.documents",
+            {"start_date": "2026-01-01", "end_date": "2026-12-31"},
+            ["ix_documents_status_published_at"],
+        ),
+        ("api.locations", {"cursor": ""}, ["ix_locations_created_at"]),
+        ("api.locations", {"location_type": "park"}, ["ix_locations_type_created_at"]),
+        (
+            "api.locations",
+            {"start_date": "2026-01-01", "include_total": "true", "cursor": ""},
+            ["ix_locations_created_at", "ix_locations_end_start"],
+        ),
+        (
+            "api.recommended_locations",
+            {},
+            [
+                "ix_food_trucks_owner_id",
+                "ix_food_truck_locations_location_id",
+                "ix_locations_end_start",
+            ],
+        ),
+        (
+            "api.recommended_documents",
+            {},
+            ["ix_food_trucks_owner_id", "ix_documents_status_verified_at"],
+        ),
+    ],
+)
+def test_hot_queries_use_indexes(
+    client, db, admin_user, admin_headers, food_truck_factory, endpoint, args, indexes
+):
+    db.session.add(food_truck_factory(owner_id=admin_user.id))
+    db.session.commit()
+
+    plans = query_plans(db, client, url_for(endpoint, **args), admin_headers)
+    details = [detail for _, plan in plans for detail in plan]
+    for statement, plan in plans:
+        assert not any(FULL_SCAN.match(detail) for detail in plan), statement
+    for index in indexes:
+        assert any(index in detail for detail in details), index
+
+
+@pytest.mark.parametrize(
+    "endpoint, args, index",
+    [
+        (
+            "api.admin_documents_pending",
+            {"cursor": ""},
+            "ix_documents_status_created_at",
+        ),
+        (
+            "api.admin_documents",
+            {"status": "rejected", "cursor": ""},
+            "ix_documents_status_created_at",
+        ),
+        ("api.admin_documents", {"cursor": ""}, "ix_documents_created_at"),
+        ("api.admin_locations", {}, "ix_locations_created_at"),
+    ],
+)
+def test_admin_list_queries_use_indexes(
+    client, db, admin_token_headers, endpoint, args, index
+):
+    plans = query_plans(db, client, url_for(endpoint, **args), admin_token_headers)
+    details = [detail for _, plan in plans for detail in plan]
+    for statement, plan in plans:
+        assert not any(FULL_SCAN.match(detail) for detail in plan), statement
+    assert any(index in detail for detail in details)
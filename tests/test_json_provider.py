@@ -0,0 +1,64 @@
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+from flask import Flask, url_for
+
+from doctruck_backend.commons.json_provider import (
+    ENCODER_JSON,
+    ENCODER_ORJSON,
+    FastJSONProvider,
+    init_json_provider,
+)
+from doctruck_backend.models import DocumentStatus, LocationType
+
+pytest.importorskip("orjson")
+
+
+@pytest.mark.parametrize("encoder", [ENCODER_ORJSON, ENCODER_JSON])
+def test_encoders_native_types(encoder):
+    provider = FastJSONProvider(Flask(__name__), encoder)
+    data = {
+        "b": datetime(2026, 10, 17, 9, 30, 0, 123456),
+        "a": date(2026, 10, 17),
+        "lat": Decimal("37.526920"),
+        "type": LocationType.PARK,
+        "name": "여의도 한강공원",
+    }
+
+    body = provider.dumps_bytes(data, sort_keys=False)
+    assert json.loads(body) == {
+        "b": "2026-10-17T09:30:00.123456",
+        "a": "2026-10-17",
+        "lat": 37.52692,
+        "type": "PARK",
+        "name": "여의도 한강공원",
+    }
+    # 응답(flask-restful)은 입력 순서 유지, jsonify는 키 정렬
+    assert list(json.loads(body))[:2] == ["b", "a"]
+    assert list(json.loads(provider.dumps(data)))[:2] == ["a", "b"]
+    assert provider.loads(body)["type"] == "PARK"
+
+
+def test_api_and_auth_use_configured_encoder(app, client, db, document_factory):
+    assert app.json.encoder == app.config["JSON_ENCODER"]
+    db.session.add(document_factory(status=DocumentStatus.VERIFIED))
+    db.session.commit()
+
+    rep = client.get(url_for("api.documents"))
+    assert rep.status_code == 200
+    assert rep.content_type == "application/json"
+    assert rep.get_data().endswith(b"\n")
+    assert rep.get_json()["results"][0]["status"] == "VERIFIED"
+
+    rep = client.post("/auth/login", json={"username": "nobody", "password": "x"})
+    assert rep.status_code == 400
+    assert rep.get_json() == {"msg": "Bad credentials"}
+
+
+def test_unknown_encoder():
+    app = Flask(__name__)
+    app.config["JSON_ENCODER"] = "simplejson"
+    with pytest.raises(ValueError):
+        init_json_provider(app)
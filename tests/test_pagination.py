@@ -0,0 +1,177 @@
+from datetime import date, datetime
+
+import pytest
+from flask import url_for
+from sqlalchemy import event
+
+from doctruck_backend.commons.pagination import encode_cursor
+
+
+def _walk(client, url):
+    """next 링크를 따라가며 모든 페이지의 결과 ID 수집"""
+    ids = []
+    pages = 0
+    while url:
+        rep = client.get(url)
+        assert rep.status_code == 200
+        data = rep.get_json()
+        assert "total" not in data
+        ids += [r.get("doc_id") or r.get("location_id") for r in data["results"]]
+        url = data["next"]
+        pages += 1
+    return ids, pages
+
+
+def test_document_list_cursor_pagination(client, db, document_factory):
+    same_day = document_factory.build_batch(3, published_at=date(2026, 10, 1))
+    newer = document_factory(published_at=date(2026, 10, 2))
+    undated = document_factory(published_at=None)
+    db.session.add_all([*same_day, newer, undated])
+    db.session.commit()
+
+    ids, pages = _walk(client, url_for("api.documents", cursor="", per_page=2))
+    assert pages == 3
+    # 게시일 내림차순 + 동일 게시일은 ID 내림차순, 게시일 없는 문서는 마지막
+    assert ids == [
+        newer.doc_id,
+        same_day[2].doc_id,
+        same_day[1].doc_id,
+        same_day[0].doc_id,
+        undated.doc_id,
+    ]
+
+    rep = client.get(url_for("api.documents", cursor="", include_total="true"))
+    assert rep.get_json()["total"] == 5
+    assert rep.get_json()["next_cursor"] is None
+
+    # 기존 page 모드 응답 형식 유지
+    rep = client.get(url_for("api.documents", page=2, per_page=2))
+    assert rep.get_json()["total"] == 5
+    assert rep.get_json()["pages"] == 3
+
+
+def test_location_list_cursor_filters(client, db, location_factory):
+    created_at = datetime(2026, 10, 1, 12, 0)
+    locations = location_factory.build_batch(4, created_at=created_at)
+    locations[0].address = "부산시 해운대구"
+    db.session.add_all(locations)
+    db.session.commit()
+
+    ids, _ = _walk(
+        client, url_for("api.locations", cursor="", per_page=1, region="서울")
+    )
+    assert ids == [location.location_id for location in reversed(locations[1:])]
+
+    cursor = encode_cursor(created_at, locations[2].location_id)
+    rep = client.get(url_for("api.locations", cursor=cursor))
+    assert [r["location_id"] for r in rep.get_json()["results"]] == [
+        locations[1].location_id,
+        locations[0].location_id,
+    ]
+
+    rep = client.get(url_for("api.locations", cursor="not-a-cursor"))
+    assert rep.status_code == 400
+
+
+def test_document_list_count_cache(client, db, document_factory):
+    db.session.add_all(document_factory.build_batch(3))
+    db.session.commit()
+
+    statements = []
+
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        if "count(" in statement.lower():
+            statements.append(statement)
+
+    url = url_for("api.documents", document_type="OTHER", per_page=2)
+    event.listen(db.engine, "before_cursor_execute", count_statement)
+    try:
+        assert client.get(url).get_json()["total"] == 3
+        # 같은 필터(순서 무관)의 다음 페이지는 캐시된 개수 사용
+        rep = client.get(
+            url_for("api.documents", per_page=2, page=2, document_type="OTHER")
+        )
+        assert rep.get_json()["total"] == 3
+        assert len(statements) == 1
+
+        rep = client.get(url_for("api.documents", count="exact"))
+        assert rep.get_json()["total"] == 3
+        assert len(statements) == 2
+
+        rep = client.get(url_for("api.documents", count="none", per_page=2))
+        data = rep.get_json()
+        assert data["total"] is None
+        assert "page=2" in data["next"]
+        assert len(statements) == 2
+    finally:
+        event.remove(db.engine, "before_cursor_execute", count_statement)
+
+    # 문서가 추가되면 테이블 버전이 바뀌어 다시 계산
+    db.session.add(document_factory())
+    db.session.commit()
+    assert client.get(url).get_json()["total"] == 4
+
+    # estimate는 마지막으로 계산된 개수 사용
+    db.session.add(document_factory())
+    db.session.commit()
+    rep = client.get(url_for("api.documents", document_type="OTHER", count="estimate"))
+    assert rep.get_json()["total"] == 4
+
+    rep = client.get(url_for("api.documents", count="approximate"))
+    assert rep.status_code == 400
+
+
+def test_document_list_sparse_fieldset(client, db, document_factory):
+    db.session.add_all(
+        document_factory.build_batch(3, ai_summary="긴 요약", published_at=date.today())
+    )
+    db.session.commit()
+
+    statements = []
+
+    def select_statement(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("SELECT") and "FROM documents" in statement:
+            statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", select_statement)
+    try:
+        # 요청 순서와 무관하게 스키마 필드 순서로 응답
+        ids, pages = _walk(
+            client,
+            url_for("api.documents", cursor="", per_page=2, fields="title,doc_id"),
+        )
+        rep = client.get(url_for("api.documents", fields="title,doc_id"))
+    finally:
+        event.remove(db.engine, "before_cursor_execute", select_statement)
+
+    assert pages == 2 and len(ids) == 3
+    assert list(rep.get_json()["results"][0]) == ["doc_id", "title"]
+    # 요청하지 않은 컬럼(ai_summary)은 조회하지 않음
+    assert statements and not any("ai_summary" in s for s in statements)
+
+    # 필드를 지정하지 않으면 기존 응답과 동일
+    result = client.get(url_for("api.documents")).get_json()["results"][0]
+    assert result["ai_summary"] == "긴 요약"
+    assert result["document_type"] == "OTHER"
+
+    rep = client.get(url_for("api.documents", fields="title,password"))
+    assert rep.status_code == 400
+
+
+@pytest.mark.parametrize("per_page", ["0", "-1", "abc", "101"])
+@pytest.mark.parametrize(
+    "endpoint, args",
+    [
+        ("api.documents", {"cursor": ""}),
+        ("api.documents", {}),
+        ("api.locations", {"cursor": ""}),
+        ("api.locations", {"lat": "37.5", "lon": "126.9"}),
+    ],
+)
+def test_invalid_per_page(client, db, document_factory, endpoint, args, per_page):
+    db.session.add(document_factory())
+    db.session.commit()
+
+    rep = client.get(url_for(endpoint, per_page=per_page, **args))
+    assert rep.status_code == 400
+    assert "per_page" in rep.get_json()["message"]
@@ -0,0 +1,280 @@
+from datetime import datetime, timedelta
+
+from flask import url_for
+from sqlalchemy import event
+
+from doctruck_backend.commons.truck_recommendations import (
+    rebuild_truck_recommendations,
+)
+from doctruck_backend.models import (
+    DocumentLocation,
+    FoodTruckLocation,
+    LocationType,
+    TruckRecommendation,
+)
+
+
+def test_recommended_locations_scores(
+    client, db, admin_user, admin_headers, food_truck_factory, location_factory
+):
+    truck = food_truck_factory(owner_id=admin_user.id)
+    other_truck = food_truck_factory(owner_id=admin_user.id, operating_region="부산")
+    matching = location_factory(
+        start_datetime=datetime.now() + timedelta(days=3, hours=1)
+    )
+    crowded = location_factory(
+        address="부산시 해운대구", location_type=LocationType.PARK
+    )
+    interested = location_factory()
+    expired = location_factory(end_datetime=datetime.now() - timedelta(days=1))
+    db.session.add_all([truck, other_truck, matching, crowded, interested, expired])
+    db.session.commit()
+
+    db.session.add(
+        FoodTruckLocation(truck_id=truck.truck_id, location_id=interested.location_id)
+    )
+    db.session.add(
+        FoodTruckLocation(
+            truck_id=other_truck.truck_id, location_id=crowded.location_id
+        )
+    )
+    db.session.commit()
+
+    url = url_for("api.recommended_locations", truck_id=truck.truck_id)
+    rep = client.get(url, headers=admin_headers)
+    assert rep.status_code == 200
+
+    results = rep.get_json()["recommendations"]
+    assert [r["location"]["location_id"] for r in results] == [
+        matching.location_id,
+        crowded.location_id,
+    ]
+    assert results[0]["score"] == 75
+    assert results[0]["reason"] == (
+        "활동 지역(서울) 일치, 디저트 카테고리에 적합한 위치, 3일 후 시작, 신청자 0명"
+    )
+    assert results[1]["score"] == 15
+    assert results[1]["reason"] == "신청자 1명"
+
+
+def test_recommended_locations_query_count(
+    client, db, admin_user, admin_headers, food_truck_factory, location_factory
+):
+    db.session.add(food_truck_factory(owner_id=admin_user.id))
+    db.session.add_all(location_factory.build_batch(20))
+    db.session.commit()
+
+    statements = []
+
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db.engine
+    event.listen(engine, "before_cursor_execute", count_statement)
+    try:
+        rep = client.get(
+            url_for("api.recommended_locations", limit=20), headers=admin_headers
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", count_statement)
+
+    assert rep.status_code == 200
+    assert rep.get_json()["count"] == 20
+    assert len(statements) < 10
+
+
+def test_recommended_locations_limit(
+    client, db, admin_user, admin_headers, food_truck_factory, location_factory
+):
+    db.session.add(food_truck_factory(owner_id=admin_user.id))
+    locations = location_factory.build_batch(5, address="부산시 해운대구")
+    locations += location_factory.build_batch(3)
+    db.session.add_all(locations)
+    db.session.commit()
+
+    rep = client.get(
+        url_for("api.recommended_locations", limit=3), headers=admin_headers
+    )
+    assert rep.status_code == 200
+
+    results = rep.get_json()["recommendations"]
+    assert [r["location"]["location_id"] for r in results] == [
+        location.location_id for location in locations[5:]
+    ]
+
+
+def test_materialized_truck_recommendations(
+    client, db, admin_user, admin_headers, food_truck_factory, location_factory
+):
+    truck = food_truck_factory(owner_id=admin_user.id)
+    locations = location_factory.build_batch(3)
+    db.session.add(truck)
+    db.session.add_all(locations)
+    db.session.commit()
+
+    assert rebuild_truck_recommendations(truck.truck_id) == 3
+    first = TruckRecommendation.query.filter_by(truck_id=truck.truck_id, rank=0).one()
+    first.reason = "precomputed"
+    db.session.commit()
+
+    # 오늘 계산된 결과가 있으면 사전 계산 결과 사용
+    rep = client.get(url_for("api.recommended_locations"), headers=admin_headers)
+    results = rep.get_json()["recommendations"]
+    assert results[0]["reason"] == "precomputed"
+    assert len(results) == 3
+
+    # 관심 등록 시 해당 트럭의 결과가 무효화되고 실시간 계산으로 대체
+    db.session.add(
+        FoodTruckLocation(truck_id=truck.truck_id, location_id=first.location_id)
+    )
+    db.session.commit()
+    assert TruckRecommendation.query.filter_by(truck_id=truck.truck_id).count() == 0
+
+    rep = client.get(url_for("api.recommended_locations"), headers=admin_headers)
+    results = rep.get_json()["recommendations"]
+    assert len(results) == 2
+    assert all(r["reason"] != "precomputed" for r in results)
+
+
+def test_location_change_invalidates_all_trucks(
+    db, admin_user, food_truck_factory, location_factory
+):
+    trucks = food_truck_factory.build_batch(2, owner_id=admin_user.id)
+    db.session.add_all(trucks)
+    db.session.add(location_factory())
+    db.session.commit()
+
+    for truck in trucks:
+        rebuild_truck_recommendations(truck.truck_id)
+    assert TruckRecommendation.query.count() == 2
+
+    db.session.add(location_factory())
+    db.session.commit()
+    assert TruckRecommendation.query.count() == 0
+
+
+def test_non_scoring_location_change_keeps_recommendations(
+    db, admin_user, food_truck_factory, location_factory
+):
+    truck = food_truck_factory(owner_id=admin_user.id)
+    location = location_factory(start_datetime=datetime(2030, 1, 1))
+    db.session.add_all([truck, location])
+    db.session.commit()
+    rebuild_truck_recommendations(truck.truck_id)
+
+    # 표시용 컬럼 변경, 같은 값 대입은 무효화하지 않음
+    db.session.refresh(location)
+    location.location_name = "뚝섬 한강공원"
+    location.start_datetime = datetime(2030, 1, 1)
+    truck.truck_name = "new name"
+    db.session.commit()
+    assert TruckRecommendation.query.count() == 1
+
+    location.end_datetime = datetime(2030, 1, 2)
+    db.session.commit()
+    assert TruckRecommendation.query.count() == 0
+
+
+def test_applicant_threshold_invalidates_affected_trucks(
+    app, db, admin_user, food_truck_factory, location_factory
+):
+    app.config["RECOMMENDATION_MATERIALIZED_TOP_N"] = 1
+    today = datetime.now()
+    crowded = location_factory(start_datetime=today + timedelta(days=90))
+    upcoming = location_factory(start_datetime=today + timedelta(days=3))
+    applicants = food_truck_factory.build_batch(10, owner_id=admin_user.id)
+    truck = food_truck_factory(owner_id=admin_user.id)
+    db.session.add_all([crowded, upcoming, truck, *applicants])
+    db.session.flush()
+    db.session.add_all(
+        FoodTruckLocation(truck_id=applicant.truck_id, location_id=crowded.location_id)
+        for applicant in applicants[:9]
+    )
+    db.session.commit()
+    assert rebuild_truck_recommendations(truck.truck_id) == 1
+    assert (
+        TruckRecommendation.query.filter_by(truck_id=truck.truck_id).one().location_id
+        == upcoming.location_id
+    )
+
+    # 신청자 수 10명: 점수가 낮아질 뿐이므로 이 위치를 추천하지 않는 트럭은 유지
+    application = FoodTruckLocation(
+        truck_id=applicants[9].truck_id, location_id=crowded.location_id
+    )
+    db.session.add(application)
+    db.session.commit()
+    assert TruckRecommendation.query.filter_by(truck_id=truck.truck_id).count() == 1
+
+    # 다시 9명: 점수가 오르므로 상위 N개에서 잘린 트럭은 무효화
+    db.session.delete(application)
+    db.session.commit()
+    assert TruckRecommendation.query.filter_by(truck_id=truck.truck_id).count() == 0
+
+
+def test_recommended_documents(
+    client,
+    db,
+    admin_user,
+    admin_headers,
+    food_truck_factory,
+    location_factory,
+    document_factory,
+):
+    truck = food_truck_factory(owner_id=admin_user.id)
+    location = location_factory()
+    linked, regional, unrelated = document_factory.build_batch(3)
+    regional.source = "서울시청"
+    old = document_factory(verified_at=datetime.utcnow() - timedelta(days=30))
+    db.session.add_all([truck, location, linked, regional, unrelated, old])
+    db.session.commit()
+
+    db.session.add(
+        FoodTruckLocation(truck_id=truck.truck_id, location_id=location.location_id)
+    )
+    for doc in (linked, old):
+        db.session.add(
+            DocumentLocation(doc_id=doc.doc_id, location_id=location.location_id)
+        )
+    db.session.commit()
+
+    rep = client.get(url_for("api.recommended_documents"), headers=admin_headers)
+    assert rep.status_code == 200
+
+    results = rep.get_json()["recommendations"]
+    assert {r["document"]["doc_id"]: r["reason"] for r in results} == {
+        linked.doc_id: "관심 등록한 위치와 관련됨",
+        regional.doc_id: "활동 지역(서울) 관련 문서",
+    }
+
+
+def test_recommended_locations_distance_score(
+    client, db, admin_user, admin_headers, food_truck_factory, location_factory
+):
+    truck = food_truck_factory(
+        owner_id=admin_user.id,
+        operating_region=None,
+        home_latitude=37.5284,
+        home_longitude=126.9334,
+    )
+    far = location_factory(latitude=37.5547, longitude=127.1707)  # 약 21km
+    near = location_factory(latitude=37.5300, longitude=126.9350)  # 약 0.2km
+    unknown = location_factory(latitude=None, longitude=None)
+    db.session.add_all([truck, far, near, unknown])
+    db.session.commit()
+
+    rep = client.get(url_for("api.recommended_locations"), headers=admin_headers)
+    results = rep.get_json()["recommendations"]
+    assert [r["location"]["location_id"] for r in results] == [
+        near.location_id,
+        far.location_id,
+        unknown.location_id,
+    ]
+    assert [r["score"] for r in results] == [55, 40, 35]
+    assert "거점에서 0.2km" in results[0]["reason"]
+
+    # 위치 좌표가 바뀌면 캐시된 좌표 배열도 다시 조회
+    far.latitude, far.longitude = 37.5290, 126.9340
+    db.session.commit()
+    rep = client.get(url_for("api.recommended_locations"), headers=admin_headers)
+    results = rep.get_json()["recommendations"]
+    assert [r["score"] for r in results] == [55, 55, 35]
@@ -0,0 +1,53 @@
+from flask import url_for
+
+from doctruck_backend.commons.regions import parse_region_codes, region_code
+from doctruck_backend.manage import reindex_regions
+from doctruck_backend.models import RegionIndex
+
+
+def test_parse_region_codes():
+    assert parse_region_codes("서울시 영등포구 여의동로 330") == [
+        "11",
+        "11:영등포구",
+        "*:영등포구",
+    ]
+    assert parse_region_codes("서울특별시청") == ["11"]
+    assert parse_region_codes("영등포구청") == ["*:영등포구"]
+    assert parse_region_codes("경기도 광주시 오포읍") == ["41", "41:광주시", "*:광주시"]
+    assert parse_region_codes(None) == []
+
+    assert region_code("서울") == "11"
+    assert region_code("서울 영등포구") == "11:영등포구"
+    assert region_code("영등포구") == "*:영등포구"
+    assert region_code("한강") is None
+
+
+def test_location_list_region_filter(client, db, location_factory):
+    seoul = location_factory(address="서울특별시 영등포구 여의동로 330")
+    busan = location_factory(address="부산광역시 해운대구 우동")
+    db.session.add_all([seoul, busan])
+    db.session.commit()
+
+    rep = client.get(url_for("api.locations", region="서울"))
+    assert rep.status_code == 200
+    assert [r["location_id"] for r in rep.get_json()["results"]] == [seoul.location_id]
+
+    # 주소 변경 시 색인도 함께 갱신
+    seoul.address = "부산시 해운대구"
+    db.session.commit()
+    rep = client.get(url_for("api.locations", region="해운대구"))
+    assert {r["location_id"] for r in rep.get_json()["results"]} == {
+        seoul.location_id,
+        busan.location_id,
+    }
+
+
+def test_reindex_regions_command(app, db, location_factory, document_factory):
+    db.session.add_all([location_factory(), document_factory()])
+    db.session.commit()
+    RegionIndex.query.delete()
+    db.session.commit()
+
+    result = app.test_cli_runner().invoke(reindex_regions)
+    assert "indexed 1 locations and 1 documents" in result.output
+    assert RegionIndex.query.count() == 4
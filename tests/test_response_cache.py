@@ -0,0 +1,165 @@
+import pytest
+from flask import url_for
+from sqlalchemy import event, text
+
+from doctruck_backend.commons.response_cache import ResponseCache
+from doctruck_backend.extensions import response_cache
+from doctruck_backend.models import Admin, DocumentStatus
+
+
+@pytest.fixture
+def admin_token_headers(client, db):
+    db.session.add(Admin(email="admin@example.com", password="admin123", name="관리자"))
+    db.session.commit()
+    rep = client.post(
+        "/auth/admin/login", json={"email": "admin@example.com", "password": "admin123"}
+    )
+    return {"authorization": "Bearer %s" % rep.get_json()["access_token"]}
+
+
+def count_queries(db, func):
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", capture)
+    try:
+        result = func()
+    finally:
+        event.remove(db.engine, "before_cursor_execute", capture)
+    return result, statements
+
+
+def test_location_list_cached_until_admin_update(
+    client, db, location_factory, admin_token_headers
+):
+    location = location_factory(location_name="여의도 한강공원")
+    db.session.add(location)
+    db.session.commit()
+    url = url_for("api.locations", location_type="festival", page=1)
+
+    first = client.get(url)
+    assert first.status_code == 200
+    # 파라미터 순서가 달라도 같은 캐시 항목 (ETag 계산용 테이블 버전만 조회)
+    rep, statements = count_queries(
+        db,
+        lambda: client.get(url_for("api.locations", page=1, location_type="festival")),
+    )
+    assert rep.get_json() == first.get_json()
+    assert len(statements) == 1 and "table_versions" in statements[0]
+    stats = response_cache.stats()
+    assert stats["hits"] == 1 and stats["hit_ratio"] == 0.5
+
+    invalidations = stats["invalidations"]
+    rep = client.put(
+        url_for("api.admin_location_by_id", location_id=location.location_id),
+        json={"location_name": "뚝섬 한강공원"},
+        headers=admin_token_headers,
+    )
+    assert rep.status_code == 200
+    assert response_cache.stats()["invalidations"] == invalidations + 1
+
+    rep = client.get(url)
+    assert rep.get_json()["results"][0]["location_name"] == "뚝섬 한강공원"
+
+
+def test_stats_require_admin(client, db, admin_headers, admin_token_headers):
+    client.get(url_for("api.locations"))
+
+    # 공개 헬스 체크는 생존 여부만 반환
+    rep = client.get("/health")
+    assert rep.status_code == 200
+    assert rep.get_json() == {"status": "healthy"}
+
+    assert client.get(url_for("api.admin_stats")).status_code == 401
+    rep = client.get(url_for("api.admin_stats"), headers=admin_headers)
+    assert rep.status_code == 403
+    rep = client.get(url_for("api.admin_stats"), headers=admin_token_headers)
+    assert rep.status_code == 200
+    assert rep.get_json()["caches"]["response_cache"]["misses"] == 1
+
+
+def test_write_from_other_worker_changes_cache_key(client, db, location_factory):
+    location = location_factory(location_name="여의도 한강공원")
+    db.session.add(location)
+    db.session.commit()
+    url = url_for("api.locations")
+
+    first = client.get(url)
+    assert client.get(url).get_json() == first.get_json()
+    assert response_cache.stats()["hits"] == 1
+
+    # 다른 워커의 쓰기: ORM 이벤트(로컬 무효화) 없이 SQL로 데이터와 버전만 변경
+    with db.engine.begin() as conn:
+        conn.execute(
+            text("UPDATE locations SET location_name = :name WHERE location_id = :id"),
+            {"name": "뚝섬 한강공원", "id": location.location_id},
+        )
+        conn.execute(
+            text(
+                "UPDATE table_versions SET version = :version WHERE table_name = :name"
+            ),
+            {"version": "other-worker", "name": "locations"},
+        )
+
+    rep = client.get(url, headers={"If-None-Match": first.headers["ETag"]})
+    assert rep.status_code == 200
+    assert rep.headers["ETag"] != first.headers["ETag"]
+    assert rep.get_json()["results"][0]["location_name"] == "뚝섬 한강공원"
+    # 새 ETag로 재검증하면 새 본문 기준으로 304
+    rep = client.get(url, headers={"If-None-Match": rep.headers["ETag"]})
+    assert rep.status_code == 304
+
+
+def test_document_list_invalidated_by_verify(
+    client, db, document_factory, admin_token_headers
+):
+    document = document_factory(status=DocumentStatus.PENDING)
+    db.session.add(document)
+    db.session.commit()
+
+    assert client.get(url_for("api.documents")).get_json()["total"] == 0
+    invalidations = response_cache.stats()["invalidations"]
+    rep = client.put(
+        url_for("api.admin_document_verify", doc_id=document.doc_id),
+        json={"action": "approve"},
+        headers=admin_token_headers,
+    )
+    assert rep.status_code == 200
+    assert client.get(url_for("api.documents")).get_json()["total"] == 1
+
+    assert response_cache.stats()["invalidations"] == invalidations + 1
+
+
+def test_error_responses_not_cached(client, db):
+    rep = client.get(url_for("api.locations", location_type="unknown"))
+    assert rep.status_code == 400
+    assert response_cache.stats()["stores"] == 0
+
+
+def test_skip_store_after_invalidation():
+    cache = ResponseCache()
+    generation = cache.generation(["locations"])
+    cache.invalidate(["locations"])
+    cache.set("key", ["locations"], {"results": []}, generation)
+    assert cache.get("key") is None
+
+    cache.set("key", ["locations"], {"results": []}, cache.generation(["locations"]))
+    assert cache.get("key") == {"results": []}
+    cache.invalidate(["documents"])
+    assert cache.get("key") == {"results": []}
+    cache.invalidate(["locations"])
+    assert cache.get("key") is None
+
+
+def test_lru_eviction():
+    cache = ResponseCache()
+    cache.maxsize = 2
+    for key in ("a", "b"):
+        cache.set(key, ["locations"], key, cache.generation(["locations"]))
+    cache.get("a")
+    cache.set("c", ["locations"], "c", cache.generation(["locations"]))
+    assert cache.get("b") is None
+    assert cache.get("a") == "a" and cache.get("c") == "c"
+    assert cache.stats()["size"] == 2
@@ -0,0 +1,100 @@
+from datetime import date
+
+from flask import url_for
+from sqlalchemy import text
+
+from doctruck_backend.commons import search
+from doctruck_backend.commons.search import apply_search
+from doctruck_backend.models import Location
+
+
+def test_location_list_full_text_search(client, db, location_factory):
+    park = location_factory(location_name="여의도 한강공원 야시장")
+    market = location_factory(location_name="망원시장", address="서울시 마포구 포은로")
+    db.session.add_all([park, market])
+    db.session.commit()
+
+    # 단어 중간 부분 일치 (trigram 색인)
+    rep = client.get(url_for("api.locations", search="한강공원"))
+    assert rep.status_code == 200
+    assert [r["location_id"] for r in rep.get_json()["results"]] == [park.location_id]
+
+    # 주소 검색 + 수정 시 색인 동기화 (트리거)
+    market.address = "서울시 영등포구 여의동로"
+    db.session.commit()
+    rep = client.get(url_for("api.locations", search="여의동로"))
+    assert {r["location_id"] for r in rep.get_json()["results"]} == {
+        park.location_id,
+        market.location_id,
+    }
+
+    # 3글자 미만 검색어는 ILIKE로 대체
+    rep = client.get(url_for("api.locations", search="시장"))
+    assert {r["location_id"] for r in rep.get_json()["results"]} == {
+        park.location_id,
+        market.location_id,
+    }
+
+    db.session.delete(park)
+    db.session.commit()
+    rep = client.get(url_for("api.locations", search="한강공원"))
+    assert rep.get_json()["results"] == []
+
+
+def test_document_list_relevance_sort(client, db, document_factory):
+    mentioned_once = document_factory(
+        title="노점 영업 안내",
+        ai_summary="도로 점용 허가를 받은 노점과 푸드트럭의 영업 시간 및 장소 제한 안내",
+        published_at=date(2026, 10, 1),
+    )
+    mentioned_twice = document_factory(
+        title="푸드트럭 영업 신고",
+        ai_summary="푸드트럭 영업 신고 절차",
+        published_at=date(2026, 1, 1),
+    )
+    # bm25 IDF가 양수가 되도록 검색어가 없는 문서를 더 많이 추가
+    unrelated = document_factory.build_batch(3, title="주차장 운영 안내")
+    db.session.add_all([mentioned_once, mentioned_twice, *unrelated])
+    db.session.commit()
+
+    rep = client.get(url_for("api.documents", search="푸드트럭"))
+    assert [r["doc_id"] for r in rep.get_json()["results"]] == [
+        mentioned_once.doc_id,
+        mentioned_twice.doc_id,
+    ]
+
+    rep = client.get(url_for("api.documents", search="푸드트럭", sort="relevance"))
+    assert [r["doc_id"] for r in rep.get_json()["results"]] == [
+        mentioned_twice.doc_id,
+        mentioned_once.doc_id,
+    ]
+
+    rep = client.get(url_for("api.documents", sort="oldest"))
+    assert rep.status_code == 400
+
+
+def test_search_escapes_fts_syntax(db, location_factory):
+    location = location_factory(location_name='"야시장" OR 축제')
+    db.session.add(location)
+    db.session.commit()
+
+    query = apply_search(Location.query, Location, '"야시장" OR')
+    assert query.all() == [location]
+    assert apply_search(Location.query, Location, "NEAR(").all() == []
+
+
+def test_search_without_fts_table(client, db, location_factory):
+    # SQLite 3.34 미만에서 마이그레이션한 DB (FTS5 테이블 없음)
+    location = location_factory(location_name="여의도 한강공원 야시장")
+    db.session.add(location)
+    db.session.commit()
+    for statement in search.sqlite_drop_ddl(Location.__tablename__):
+        db.session.execute(text(statement))
+    db.session.commit()
+    search._existing_fts_tables.clear()
+
+    rep = client.get(url_for("api.locations", search="한강공원"))
+    assert rep.status_code == 200
+    assert [r["location_id"] for r in rep.get_json()["results"]] == [
+        location.location_id
+    ]
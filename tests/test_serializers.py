@@ -0,0 +1,86 @@
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+from marshmallow import Schema, fields, post_dump
+
+from doctruck_backend.api.schemas import (
+    DocumentSchema,
+    FoodTruckSchema,
+    LocationSchema,
+    UserSchema,
+)
+from doctruck_backend.commons.serializers import compile_schema, dump
+from doctruck_backend.models import DocumentStatus, LocationType
+
+
+def _same_output(schema, data):
+    # 키 순서까지 같아야 응답 JSON이 바뀌지 않음
+    expected = json.dumps(schema.dump(data), ensure_ascii=False)
+    assert json.dumps(dump(schema, data), ensure_ascii=False) == expected
+
+
+def test_compiled_dump_matches_schema(
+    db,
+    location_factory,
+    document_factory,
+    user_factory,
+    food_truck_factory,
+):
+    locations = [
+        location_factory(
+            latitude=Decimal("37.526920"),
+            longitude=Decimal("126.934550"),
+            start_datetime=datetime(2026, 10, 1, 9, 30),
+            end_datetime=datetime(2026, 10, 3, 18, 0, 0, 123456),
+            description_summary="한강 축제",
+        ),
+        location_factory(location_type=LocationType.PARK, address=None),
+    ]
+    documents = [
+        document_factory(published_at=date(2026, 10, 1), expires_at=date(2027, 1, 1)),
+        document_factory(status=DocumentStatus.PENDING, verified_at=None, source=None),
+    ]
+    user = user_factory()
+    db.session.add_all([*locations, *documents, user])
+    db.session.commit()
+    truck = food_truck_factory(owner_id=user.id, home_latitude=Decimal("35.1"))
+    db.session.add(truck)
+    db.session.commit()
+
+    _same_output(LocationSchema(many=True), locations)
+    _same_output(LocationSchema(), locations[0])
+    _same_output(DocumentSchema(many=True), documents)
+    _same_output(UserSchema(many=True), [user])
+    _same_output(FoodTruckSchema(many=True), [truck])
+    # 필드를 제한한 스키마는 별도로 컴파일
+    _same_output(
+        LocationSchema(many=True, only=("location_id", "location_type")), locations
+    )
+
+
+def test_compiled_dump_generic_fields():
+    class EventSchema(Schema):
+        name = fields.String(data_key="title")
+        day = fields.Date(format="%Y/%m/%d")
+        active = fields.Boolean()
+        note = fields.String(attribute="meta.note")
+
+    class Event:
+        name = "festival"
+        day = date(2026, 10, 17)
+        active = True
+        meta = {"note": "ok"}
+
+    schema = EventSchema()
+    _same_output(schema, Event())
+    assert compile_schema(EventSchema()) is compile_schema(schema)
+
+    class EnvelopeSchema(Schema):
+        name = fields.String()
+
+        @post_dump
+        def wrap(self, data, **kwargs):
+            return {"event": data}
+
+    _same_output(EnvelopeSchema(), Event())
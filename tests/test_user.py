@@ -1,7 +1,7 @@
 from flask import url_for
 
-from doctruck_backend.extensions import pwd_context
-from doctruck_backend.models import User
+from doctruck_backend.extensions import identity_cache, pwd_context
+from doctruck_backend.models import Admin, User
 
 
 def test_get_user(client, db, user, admin_headers):
@@ -99,3 +99,37 @@ def test_get_all_user(client, db, user_factory, admin_headers):
     results = rep.get_json()
     for user in users:
         assert any(u["id"] == user.id for u in results["results"])
+
+
+def test_identity_cache(client, db, user, admin_user, admin_headers):
+    identity_cache.clear()
+    db.session.add(user)
+    db.session.commit()
+
+    user_url = url_for("api.user_by_id", user_id=user.id)
+    for _ in range(3):
+        assert client.get(user_url, headers=admin_headers).status_code == 200
+    assert identity_cache.stats()["misses"] == 1
+    assert identity_cache.stats()["hits"] == 2
+
+    # 로드된 사용자가 필요 없는 엔드포인트는 조회 생략
+    rep = client.get(url_for("api.recommended_locations"), headers=admin_headers)
+    assert rep.status_code == 200
+    assert identity_cache.stats()["skipped"] == 1
+
+    # 삭제된 사용자의 토큰은 캐시가 무효화되어 즉시 거부
+    admin_url = url_for("api.user_by_id", user_id=admin_user.id)
+    assert client.delete(admin_url, headers=admin_headers).status_code == 200
+    assert client.get(user_url, headers=admin_headers).status_code == 401
+
+
+def test_admin_identity_lookup(client, db):
+    db.session.add(Admin(email="admin@example.com", password="admin123", name="관리자"))
+    db.session.commit()
+    rep = client.post(
+        "/auth/admin/login", json={"email": "admin@example.com", "password": "admin123"}
+    )
+    headers = {"authorization": "Bearer %s" % rep.get_json()["access_token"]}
+
+    rep = client.get(url_for("api.admin_users"), headers=headers)
+    assert rep.status_code == 200